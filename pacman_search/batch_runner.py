@@ -0,0 +1,181 @@
+# batch_runner.py
+"""
+Command-line batch runner for headless Pac-Man episodes.
+Builds the cross product of levels, seeds, maze sizes and Pac-Man policies, runs every
+episode as a headless Simulation on a pool of worker processes, and writes all the
+per-episode results to one CSV or JSON file at the end.
+Usage:
+    python batch_runner.py --levels 1-6 --seeds 0-99 --sizes 20x20,41x61 --policies random,idle --output logs/batch.csv
+    python batch_runner.py --levels 4 --map map_template.json
+Policies:
+    idle               Pac-Man never moves.
+    random[:chance]    Pac-Man wanders, turning with the given chance per tick (seeded per episode).
+    recording:path     Pac-Man replays a recording saved by Simulation.save_recording.
+Functions:
+    parse_range(text): Parses "1-6" or "1,3,5" into a list of integers.
+    parse_sizes(text): Parses "20x20,41x61" into a list of (rows, cols) tuples.
+    build_episodes(args): Expands the command-line matrix into a list of Episode objects.
+        With --map every episode plays the map, so --sizes is not expanded.
+    run_episode(episode): Runs one episode in the current process and returns its result row,
+        with the rows and cols of the maze actually played.
+    run_batch(episodes, workers): Runs all episodes across worker processes.
+    write_results(rows, path): Writes the result rows as CSV or JSON depending on the extension.
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from game.simulation import Simulation, IdlePolicy, RandomPolicy, load_recording
+from search import clear_tree_pool
+
+DEFAULT_SIZES = "20x20"
+
+
+@dataclass
+class Episode:
+    level: int
+    seed: int
+    rows: int
+    cols: int
+    policy: str
+    planning: str
+    max_ticks: int
+    map_file: str = "" # Map played instead of a generated maze, rows and cols are then filled in from it
+
+
+def parse_range(text): # "1-6" or "1,3,5" or "0-9,20"
+    values = []
+    for part in text.split(","):
+        if "-" in part:
+            low, high = part.split("-")
+            values.extend(range(int(low), int(high) + 1))
+        else:
+            values.append(int(part))
+    return values
+
+def parse_sizes(text): # "20x20,41x61"
+    sizes = []
+    for part in text.split(","):
+        rows, cols = part.lower().split("x")
+        sizes.append((int(rows), int(cols)))
+    return sizes
+
+def make_policy(spec, seed): # Build a Pac-Man policy from its command-line name
+    name, _, argument = spec.partition(":")
+    if name == "idle":
+        return IdlePolicy()
+    if name == "random":
+        return RandomPolicy(seed = seed, turn_chance = float(argument) if argument else 0.2)
+    if name == "recording":
+        return load_recording(argument)
+    raise ValueError(f"Unknown policy: {spec}")
+
+def build_episodes(args):
+    sizes = [(0, 0)] if args.map else parse_sizes(args.sizes or DEFAULT_SIZES) # A map has one size, read when it is loaded
+    return [
+        Episode(level, seed, rows, cols, policy, args.planning, args.max_ticks, args.map or "")
+        for level, (rows, cols), policy, seed in itertools.product(
+            parse_range(args.levels), sizes, args.policies.split(","), parse_range(args.seeds)
+        )
+    ]
+
+def run_episode(episode): # Runs in a worker process, no display is ever opened
+    simulation = Simulation(
+        level = episode.level,
+        policy = make_policy(episode.policy, episode.seed),
+        planning = None if episode.planning == "level" else episode.planning,
+        maze_size = (episode.rows, episode.cols),
+        max_ticks = episode.max_ticks,
+        map_file = episode.map_file or None
+    )
+    result = simulation.run()
+    clear_tree_pool() # Workers run episodes of every size, do not hold on to trees sized for this one
+    row = asdict(episode)
+    row.update(
+        rows = simulation.game.maze.rows,
+        cols = simulation.game.maze.cols,
+        ticks = result.ticks,
+        captured = result.captured,
+        capture_tick = result.capture_tick,
+        ghost_search_time = result.ghost_search_time,
+        ghost_searches = result.ghost_searches,
+        nodes_expanded = result.nodes_expanded,
+        wall_time = result.wall_time
+    )
+    return row
+
+def run_batch(episodes, workers = None):
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return [run_episode(episode) for episode in episodes]
+
+    # Several episodes per task keep the inter-process overhead small on many cores
+    chunksize = max(1, len(episodes) // (workers * 4))
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        return list(executor.map(run_episode, episodes, chunksize = chunksize))
+
+def write_results(rows, path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok = True)
+
+    if path.endswith(".json"):
+        with open(path, "w") as file:
+            json.dump(rows, file, indent = 2)
+        return
+
+    with open(path, "w", newline = "") as file:
+        writer = csv.DictWriter(file, fieldnames = list(rows[0].keys()) if rows else [])
+        writer.writeheader()
+        writer.writerows(rows)
+
+def summarise(rows): # One line per level/size/policy group
+    groups = {}
+    for row in rows:
+        key = (row["level"], row["rows"], row["cols"], row["policy"])
+        groups.setdefault(key, []).append(row)
+
+    for (level, rows_, cols, policy), group in sorted(groups.items()):
+        captures = [row["capture_tick"] for row in group if row["captured"]]
+        mean_capture = sum(captures) / len(captures) if captures else float("nan")
+        search_time = sum(row["ghost_search_time"] for row in group)
+        print(
+            f"level {level} {rows_}x{cols} {policy}: {len(captures)}/{len(group)} captured, "
+            f"mean ticks to capture {mean_capture:.1f}, ghost search time {search_time:.3f}s"
+        )
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Run headless Pac-Man episodes in parallel.")
+    parser.add_argument("--levels", default = "1-6", help = "levels to run, e.g. 1-6 or 1,4")
+    parser.add_argument("--seeds", default = "0-9", help = "policy seeds, e.g. 0-99")
+    parser.add_argument("--sizes", default = None, help = "maze sizes as ROWSxCOLS, comma separated (default: 20x20)")
+    parser.add_argument("--map", default = None, help = "map file from assets/maps (or a path) played instead of --sizes")
+    parser.add_argument("--policies", default = "random", help = "Pac-Man policies, comma separated")
+    parser.add_argument(
+        "--planning", default = "level", choices = ["level", "search", "oracle", "shared"],
+        help = "how the ghosts plan, level uses each level's default"
+    )
+    parser.add_argument("--max-ticks", type = int, default = 10000, help = "tick limit per episode")
+    parser.add_argument("--workers", type = int, default = None, help = "worker processes (default: all cores)")
+    parser.add_argument("--output", default = os.path.join("logs", "batch_results.csv"), help = "merged .csv or .json output file")
+    args = parser.parse_args(argv)
+    if args.map and args.sizes:
+        parser.error("--sizes cannot be combined with --map, the map sets the maze size")
+
+    episodes = build_episodes(args)
+    start_time = time.perf_counter()
+    rows = run_batch(episodes, args.workers)
+    elapsed = time.perf_counter() - start_time
+
+    write_results(rows, args.output)
+    summarise(rows)
+    print(f"{len(rows)} episodes in {elapsed:.2f}s, results written to {args.output}")
+
+if __name__ == "__main__":
+    sys.exit(main())
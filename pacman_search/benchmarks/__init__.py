@@ -0,0 +1,8 @@
+# benchmarks/__init__.py
+"""
+This package holds the reproducible benchmarks for the Pacman search project.
+Modules:
+    corpus: Seeded maze generators (pillars, carved, arena, map files) and start/goal sampling.
+    search_benchmark: Runs every SearchAlgorithm over the corpus and writes JSON results.
+    replan_benchmark: Compares a fresh search per tick with DStarLite when chasing a moving target.
+"""
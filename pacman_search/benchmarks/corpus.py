@@ -0,0 +1,145 @@
+# benchmarks/corpus.py
+"""
+This module generates the seeded maze corpus used by the benchmarks.
+Every generator returns a grid as a list of rows of 0 (path) and 1 (wall), the same format as Maze.grid,
+and the same kind, size and seed always give the same grid.
+Classes:
+    MazeCase: A named grid in the corpus.
+Functions:
+    pillar_grid(rows, cols): The layout of Maze.generate_maze, a border with pillars on every other cell.
+    carved_grid(rows, cols, rng): A perfect maze carved by a randomised depth-first search.
+    arena_grid(rows, cols, rng, density): An open arena with a border and scattered single-cell obstacles.
+    map_grid(map_filename): The grid of a map JSON file from assets/maps, any non-zero tile is a wall.
+    map_costs(map_filename): The optional "costs" rows of a map JSON file, None if it has none.
+    weighted_costs(grid, tunnel_cost, house_cost): A generated cost layer, slow straight tunnels and
+        an expensive ghost house in the middle of the grid.
+    build_corpus(kinds, sizes, seed, weighted): Builds a MazeCase for every kind and size, with a cost layer if weighted.
+    sample_pairs(grid, count, rng): Picks start/goal pairs of open cells.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import List, Optional
+from game.maze import Maze
+from utils.asset_loader import load_map
+
+KINDS = ("pillars", "carved", "arena", "map")
+TUNNEL_COST = 3 # Straight corridor tiles in weighted mazes
+HOUSE_COST = 8 # Tiles of the ghost house in the middle of weighted mazes
+
+
+@dataclass
+class MazeCase:
+    name: str
+    kind: str
+    rows: int
+    cols: int
+    grid: List[List[int]]
+    costs: Optional[List[List[int]]] = None # Entry cost of each tile, None for 1 everywhere
+
+
+def pillar_grid(rows, cols):
+    return Maze(rows, cols, headless = True).grid
+
+def carved_grid(rows, cols, rng):
+    # Cells on odd rows and columns are rooms, the walls between them are knocked down by a DFS
+    grid = [[1] * cols for _ in range(rows)]
+    start = (1, 1)
+    grid[1][1] = 0
+    stack = [start]
+    while stack:
+        row, col = stack[-1]
+        options = [
+            (row + dr, col + dc, row + dr // 2, col + dc // 2)
+            for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < row + dr < rows - 1 and 0 < col + dc < cols - 1 and grid[row + dr][col + dc] == 1
+        ]
+        if not options:
+            stack.pop()
+            continue
+        next_row, next_col, wall_row, wall_col = rng.choice(options)
+        grid[wall_row][wall_col] = 0
+        grid[next_row][next_col] = 0
+        stack.append((next_row, next_col))
+    return grid
+
+def arena_grid(rows, cols, rng, density = 0.05):
+    grid = [[0] * cols for _ in range(rows)]
+    for row in range(rows):
+        grid[row][0] = grid[row][cols - 1] = 1
+    for col in range(cols):
+        grid[0][col] = grid[rows - 1][col] = 1
+    for row in range(1, rows - 1):
+        for col in range(1, cols - 1):
+            if rng.random() < density:
+                grid[row][col] = 1
+    return grid
+
+def map_grid(map_filename):
+    data = load_map(map_filename)
+    if data is None:
+        raise FileNotFoundError(map_filename)
+    return [[0 if tile == 0 else 1 for tile in row] for row in data["map"]]
+
+def map_costs(map_filename):
+    data = load_map(map_filename)
+    if data is None:
+        raise FileNotFoundError(map_filename)
+    return data.get("costs")
+
+def weighted_costs(grid, tunnel_cost = TUNNEL_COST, house_cost = HOUSE_COST):
+    rows, cols = len(grid), len(grid[0])
+    costs = [[1] * cols for _ in range(rows)]
+
+    def is_open(row, col):
+        return 0 <= row < rows and 0 <= col < cols and grid[row][col] == 0
+
+    for row in range(rows):
+        for col in range(cols):
+            if not is_open(row, col):
+                continue
+            up, down = is_open(row - 1, col), is_open(row + 1, col)
+            left, right = is_open(row, col - 1), is_open(row, col + 1)
+            if (up and down and not left and not right) or (left and right and not up and not down): # A straight tunnel
+                costs[row][col] = tunnel_cost
+
+    house_rows, house_cols = max(1, rows // 5), max(1, cols // 5)
+    for row in range((rows - house_rows) // 2, (rows + house_rows) // 2):
+        for col in range((cols - house_cols) // 2, (cols + house_cols) // 2):
+            costs[row][col] = house_cost
+    return costs
+
+def build_corpus(kinds = KINDS, sizes = (20, 100), seed = 0, map_files = ("map_template.json",), weighted = False):
+    cases = []
+    for kind in kinds:
+        if kind == "map": # Map files have a fixed size
+            for map_filename in map_files:
+                grid = map_grid(map_filename)
+                costs = (map_costs(map_filename) or weighted_costs(grid)) if weighted else None
+                cases.append(MazeCase(f"map-{map_filename}", kind, len(grid), len(grid[0]), grid, costs))
+            continue
+
+        for size in sizes:
+            rng = random.Random(f"{kind}-{size}-{seed}")
+            if kind == "pillars":
+                grid = pillar_grid(size, size)
+            elif kind == "carved":
+                grid = carved_grid(size, size, rng)
+            elif kind == "arena":
+                grid = arena_grid(size, size, rng)
+            else:
+                raise ValueError(f"Unknown maze kind: {kind}")
+            cases.append(MazeCase(f"{kind}-{size}x{size}", kind, size, size, grid, weighted_costs(grid) if weighted else None))
+    return cases
+
+def sample_pairs(grid, count, rng):
+    # Draw random cells until enough open ones are found, so huge grids are never scanned in full
+    rows, cols = len(grid), len(grid[0])
+
+    def open_cell():
+        while True:
+            row, col = rng.randrange(rows), rng.randrange(cols)
+            if grid[row][col] == 0:
+                return (row, col)
+
+    return [(open_cell(), open_cell()) for _ in range(count)]
@@ -0,0 +1,119 @@
+# benchmarks/replan_benchmark.py
+"""
+Benchmark of replanning every tick while chasing a moving target.
+On every maze of the corpus a chaser follows a random-walking target for a number of ticks and
+replans on each one, once with a fresh search per tick and once with DStarLite repairing its
+previous search. The target walk and the maze edits come from the same seed for every algorithm;
+the chaser follows each algorithm's own path. The mean time and nodes expanded per tick are
+written as JSON.
+Usage:
+    python -m benchmarks.replan_benchmark --kinds pillars,carved,arena --sizes 20,100 --ticks 500
+    python -m benchmarks.replan_benchmark --algorithms AStar,BFS --toggle-every 10
+Functions:
+    chase(maze, algorithm, ticks, seed, toggle_every): Replans a chase for a number of ticks and returns
+        the per-tick times, nodes expanded and path lengths.
+    benchmark_case(case, algorithms, ticks, seed, toggle_every): Runs every algorithm and DStarLite on one maze.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from game.maze import Maze
+from game.ghost import ChasePacmanProblem
+from search import DStarLite, clear_tree_pool, COUNTERS
+from benchmarks.corpus import KINDS, build_corpus
+from benchmarks.search_benchmark import ALGORITHMS, percentile
+
+
+def chase(maze, algorithm, ticks, seed, toggle_every = 0):
+    # Every algorithm starts from the same seed, so the chases only drift apart once their paths differ
+    rng = random.Random(seed)
+    cells = [(row, col) for row in range(maze.rows) for col in range(maze.cols) if not maze.is_wall((row, col))]
+    chaser, target = rng.choice(cells), rng.choice(cells)
+    times, expanded, lengths = [], [], []
+    for tick in range(ticks):
+        if toggle_every and tick % toggle_every == 0: # Open or close a random inner cell
+            row, col = rng.randrange(1, maze.rows - 1), rng.randrange(1, maze.cols - 1)
+            if (row, col) not in (chaser, target):
+                maze.set_tile((row, col), 1 - maze.grid[row][col])
+
+        result = algorithm.search(ChasePacmanProblem(maze, chaser, target, encoded = True), instrumentation = COUNTERS)
+        times.append(result.search_time)
+        expanded.append(result.nodes_expanded)
+        lengths.append(len(result.actions) if result.actions is not None else -1)
+
+        if result.actions:
+            chaser = [position for action, position, cost in maze.get_neighbours(chaser) if action == result.actions[0]][0]
+        if chaser == target or not result.actions: # Caught or cut off, start a new chase
+            chaser = rng.choice(cells)
+        neighbours = maze.get_neighbours(target)
+        if neighbours:
+            target = rng.choice(neighbours)[1]
+    return times, expanded, lengths
+
+def benchmark_case(case, algorithms, ticks, seed, toggle_every = 0):
+    rows = []
+    for name in algorithms + ["DStarLite"]:
+        algorithm = DStarLite() if name == "DStarLite" else ALGORITHMS[name]()
+        maze = Maze(headless = True, grid = [row[:] for row in case.grid]) # Toggling edits the grid
+        maze.graph
+        times, expanded, lengths = chase(maze, algorithm, ticks, f"{case.name}-{seed}", toggle_every)
+        solved = [length for length in lengths if length >= 0]
+        total_time = sum(times)
+        rows.append({
+            "maze": case.name,
+            "kind": case.kind,
+            "rows": case.rows,
+            "cols": case.cols,
+            "algorithm": name,
+            "ticks": ticks,
+            "mean_tick_ms": total_time / ticks * 1000 if ticks else 0.0,
+            "p99_tick_ms": percentile(times, 0.99) * 1000,
+            "mean_nodes_expanded": sum(expanded) / ticks if ticks else 0.0,
+            "mean_path_length": sum(solved) / len(solved) if solved else 0.0,
+        })
+        print(
+            f"{case.name:24} {name:10} {rows[-1]['mean_tick_ms']:9.3f}ms/tick "
+            f"p99 {rows[-1]['p99_tick_ms']:9.3f}ms nodes {rows[-1]['mean_nodes_expanded']:10.1f}",
+            file = sys.stderr
+        )
+    return rows
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Benchmark replanning every tick against a moving target.")
+    parser.add_argument("--kinds", default = "pillars,carved,arena", help = "maze kinds: " + ", ".join(KINDS))
+    parser.add_argument("--sizes", default = "20,100", help = "square maze sizes")
+    parser.add_argument("--maps", default = "map_template.json", help = "map files from assets/maps for the map kind")
+    parser.add_argument("--algorithms", default = "AStar", help = "fresh-search algorithms to compare with DStarLite")
+    parser.add_argument("--ticks", type = int, default = 500, help = "replans per maze")
+    parser.add_argument("--toggle-every", type = int, default = 0, help = "toggle a random cell every N ticks, 0 for a static maze")
+    parser.add_argument("--seed", type = int, default = 0, help = "corpus and walk seed")
+    parser.add_argument("--output", default = os.path.join("logs", "benchmarks", "replan_benchmark.json"))
+    args = parser.parse_args(argv)
+
+    algorithms = args.algorithms.split(",")
+    for name in algorithms:
+        if name not in ALGORITHMS:
+            parser.error(f"unknown algorithm {name}, choose from {', '.join(ALGORITHMS)}")
+
+    corpus = build_corpus(
+        kinds = args.kinds.split(","),
+        sizes = [int(size) for size in args.sizes.split(",")],
+        seed = args.seed,
+        map_files = args.maps.split(",")
+    )
+
+    results = []
+    for case in corpus:
+        results.extend(benchmark_case(case, algorithms, args.ticks, args.seed, args.toggle_every))
+        clear_tree_pool() # The next case is another size, its trees would not be reused
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok = True)
+    with open(args.output, "w") as file:
+        json.dump({"meta": {"seed": args.seed, "ticks": args.ticks}, "results": results}, file, indent = 2, sort_keys = True)
+    print(f"Results written to {args.output}", file = sys.stderr)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+# benchmarks/search_benchmark.py
+"""
+Benchmark of the search algorithms over the seeded maze corpus.
+Every algorithm solves the same start/goal pairs on every maze of the corpus, and the results
+(throughput, p50/p99 latency, peak memory, nodes expanded) are written as JSON with stable key
+order so two runs can be diffed, or compared directly with --baseline.
+Usage:
+    python -m benchmarks.search_benchmark --kinds pillars,carved,arena,map --sizes 20,100,500 --pairs 50
+    python -m benchmarks.search_benchmark --sizes 2000 --algorithms BFS,AStar --output logs/benchmarks/large.json
+    python -m benchmarks.search_benchmark --baseline logs/benchmarks/previous.json
+    python -m benchmarks.search_benchmark --weighted --algorithms BFS,UCS,AStar
+    python -m benchmarks.search_benchmark --log logs/benchmarks/searches.plog
+Functions:
+    percentile(values, fraction): Nearest-rank percentile of a list of numbers.
+    path_cost(graph, start, actions): The sum of the tile costs stepped onto along a path.
+    benchmark_case(case, algorithms, pairs, measure_memory): Runs every algorithm on the pairs of one maze,
+        timing with the COUNTERS instrumentation and, unless disabled, measuring peak memory in a FULL pass.
+        The corridor graph and the landmark tables are built before timing, like the grid graph, but only
+        when an algorithm that reads them (PRECOMPUTED) is selected.
+        With encoded=False the problems use (row, col) tuple states instead of cell ids.
+        Counters an algorithm returns in SearchResult.stats are averaged into mean_<name> fields.
+        With --weighted every maze gets a cost layer (the map's own "costs", or slow tunnels and a
+        ghost house); mean_path_cost then tells the cost-aware algorithms from BFS and DFS, and
+        the unit-cost-only ones (UNIT_COST) are skipped.
+        For UCS and AStar every pop is an expansion, so the *Bucket and *Indexed rows compare the
+        frontier queues by pops (nodes expanded) and peak memory against the tuple heap.
+    compare(results, baseline): Prints the throughput and latency ratios against an earlier run.
+With --log every search is also recorded through a DataLogger result hook, under the maze name as
+its level; a .plog file is written in the columnar format, anything else as CSV.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+from game.maze import Maze
+from game.ghost import ChasePacmanProblem
+from search.GridGraph import MOVES, ACTIONS
+from search import add_result_hook, remove_result_hook, BFS, DFS, UCS, AStar, BucketQueue, IndexedPriorityQueue, landmark_heuristic, JPS, BidirectionalBFS, BidirectionalAStar, CorridorSearch, clear_tree_pool, COUNTERS, FULL
+from benchmarks.corpus import KINDS, build_corpus, sample_pairs
+from utils.data_logger import DataLogger
+
+ALGORITHMS = {
+    "BFS": BFS,
+    "DFS": DFS,
+    "UCS": UCS,
+    "AStar": AStar,
+    "UCSBucket": lambda: UCS(queue = BucketQueue), # Other frontier queues, see search.utils
+    "UCSIndexed": lambda: UCS(queue = IndexedPriorityQueue),
+    "AStarBucket": lambda: AStar(queue = BucketQueue),
+    "AStarIndexed": lambda: AStar(queue = IndexedPriorityQueue),
+    "AStarALT": lambda: AStar(heuristic = landmark_heuristic), # Landmark lower bounds instead of the Manhattan distance
+    "JPS": JPS,
+    "BidirectionalBFS": BidirectionalBFS,
+    "BidirectionalAStar": BidirectionalAStar,
+    "CorridorAStar": lambda: CorridorSearch(AStar()), # A* over junctions, expanded back to tiles
+}
+
+UNIT_COST = ("JPS", "BidirectionalBFS") # Only defined on grids where every step costs 1
+PRECOMPUTED = {"AStarALT": "landmarks", "CorridorAStar": "corridor_graph"} # Maze tables built once per maze
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+def path_cost(graph, start, actions):
+    cell, total = graph.cell_id(start), 0
+    for action in actions:
+        d_row, d_col = MOVES[ACTIONS.index(action)]
+        cell += d_row * graph.cols + d_col
+        total += graph.costs[cell]
+    return total
+
+def benchmark_case(case, algorithms, pairs, measure_memory = True, encoded = True):
+    maze = Maze(headless = True, grid = case.grid, costs = case.costs)
+    maze.graph # Compile the maze before timing
+    rows = []
+    for name in algorithms:
+        if maze.graph.weighted and name in UNIT_COST:
+            print(f"{case.name:24} {name:13} skipped, needs unit step costs", file = sys.stderr)
+            continue
+        if name in PRECOMPUTED: # Build the tables this algorithm reads before timing it, and only for it
+            getattr(maze, PRECOMPUTED[name])
+        algorithm = ALGORITHMS[name]()
+        times, memory, expanded, lengths, costs = [], [], [], [], []
+        stats = {} # Totals of the algorithm's own counters, e.g. stale_pops
+        for start, goal in pairs:
+            result = algorithm.search(ChasePacmanProblem(maze, start, goal, encoded), instrumentation = COUNTERS)
+            times.append(result.search_time)
+            expanded.append(result.nodes_expanded)
+            for key, value in (result.stats or {}).items():
+                stats[key] = stats.get(key, 0) + value
+            if result.actions is not None:
+                lengths.append(len(result.actions))
+                costs.append(path_cost(maze.graph, start, result.actions))
+
+        # tracemalloc slows every allocation, so peak memory comes from a separate pass
+        if measure_memory:
+            for start, goal in pairs:
+                result = algorithm.search(ChasePacmanProblem(maze, start, goal, encoded), instrumentation = FULL)
+                memory.append(result.memory_usage)
+
+        total_time = sum(times)
+        rows.append({
+            "maze": case.name,
+            "kind": case.kind,
+            "rows": case.rows,
+            "cols": case.cols,
+            "algorithm": name,
+            "searches": len(pairs),
+            "solved": len(lengths),
+            "searches_per_sec": len(pairs) / total_time if total_time else 0.0,
+            "p50_ms": percentile(times, 0.50) * 1000,
+            "p99_ms": percentile(times, 0.99) * 1000,
+            "peak_memory_bytes": max(memory) if memory else 0,
+            "mean_nodes_expanded": sum(expanded) / len(expanded) if expanded else 0.0,
+            "mean_path_length": sum(lengths) / len(lengths) if lengths else 0.0,
+            "mean_path_cost": sum(costs) / len(costs) if costs else 0.0,
+        })
+        rows[-1].update({f"mean_{key}": value / len(pairs) for key, value in stats.items()})
+        print(
+            f"{case.name:24} {name:13} {rows[-1]['searches_per_sec']:10.1f}/s "
+            f"p50 {rows[-1]['p50_ms']:9.3f}ms p99 {rows[-1]['p99_ms']:9.3f}ms "
+            f"peak {rows[-1]['peak_memory_bytes'] / 1024:9.1f}KiB nodes {rows[-1]['mean_nodes_expanded']:10.1f}",
+            file = sys.stderr
+        )
+    return rows
+
+def compare(results, baseline):
+    previous = {(row["maze"], row["algorithm"]): row for row in baseline["results"]}
+    for row in results:
+        old = previous.get((row["maze"], row["algorithm"]))
+        if old is None or not old["searches_per_sec"] or not old["p50_ms"]:
+            continue
+        print(
+            f"{row['maze']:24} {row['algorithm']:8} "
+            f"throughput x{row['searches_per_sec'] / old['searches_per_sec']:.2f} "
+            f"p50 x{row['p50_ms'] / old['p50_ms']:.2f} "
+            f"nodes {old['mean_nodes_expanded']:.0f} -> {row['mean_nodes_expanded']:.0f}"
+        )
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Benchmark the search algorithms on a seeded maze corpus.")
+    parser.add_argument("--kinds", default = ",".join(KINDS), help = "maze kinds: " + ", ".join(KINDS))
+    parser.add_argument("--sizes", default = "20,100,500", help = "square maze sizes, e.g. 20,100,2000")
+    parser.add_argument("--maps", default = "map_template.json", help = "map files from assets/maps for the map kind")
+    parser.add_argument("--algorithms", default = ",".join(ALGORITHMS), help = "algorithms to run")
+    parser.add_argument("--pairs", type = int, default = 50, help = "start/goal pairs per maze")
+    parser.add_argument("--seed", type = int, default = 0, help = "corpus and pair seed")
+    parser.add_argument("--output", default = os.path.join("logs", "benchmarks", "search_benchmark.json"))
+    parser.add_argument("--no-memory", action = "store_true", help = "skip the tracemalloc pass for peak memory")
+    parser.add_argument("--weighted", action = "store_true", help = "give every maze a cost layer of slow tunnels and a ghost house")
+    parser.add_argument("--tuple-states", action = "store_true", help = "search on (row, col) tuples instead of cell ids")
+    parser.add_argument("--baseline", default = None, help = "earlier output to compare against")
+    parser.add_argument("--log", default = None, help = "also log every search to this file, columnar if it ends in .plog")
+    args = parser.parse_args(argv)
+
+    algorithms = args.algorithms.split(",")
+    for name in algorithms:
+        if name not in ALGORITHMS:
+            parser.error(f"unknown algorithm {name}, choose from {', '.join(ALGORITHMS)}")
+
+    corpus = build_corpus(
+        kinds = args.kinds.split(","),
+        sizes = [int(size) for size in args.sizes.split(",")],
+        seed = args.seed,
+        map_files = args.maps.split(","),
+        weighted = args.weighted
+    )
+
+    logger = None
+    if args.log:
+        logger = DataLogger(args.log, format = "columnar" if args.log.endswith(".plog") else "csv")
+        add_result_hook(logger.record_search)
+
+    results = []
+    for case in corpus:
+        if logger is not None:
+            logger.level = case.name
+        pairs = sample_pairs(case.grid, args.pairs, random.Random(f"{case.name}-{args.seed}"))
+        results.extend(benchmark_case(case, algorithms, pairs, measure_memory = not args.no_memory, encoded = not args.tuple_states))
+        clear_tree_pool() # The next case is another size, its trees would not be reused
+
+    if logger is not None:
+        remove_result_hook(logger.record_search)
+        logger.close()
+        print(f"Searches logged to {args.log}", file = sys.stderr)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "pairs": args.pairs,
+            "weighted": args.weighted,
+        },
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok = True)
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent = 2, sort_keys = True)
+    print(f"Results written to {args.output}", file = sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            compare(results, json.load(file))
+
+if __name__ == "__main__":
+    sys.exit(main())
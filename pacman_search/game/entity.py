@@ -1,45 +1,69 @@
-# game/entity.py
-"""
-Entity class represents a game entity in the Pacman game.
-Attributes:
-    maze: The maze in which the entity exists.
-    position: A tuple representing the (row, col) position of the entity in the maze.
-    colour: The colour of the entity.
-Methods:
-    __init__(maze, position, colour):
-        Initializes the Entity with a maze, position, and colour.
-    update():
-        Updates the state of the entity. This method should be overridden by subclasses.
-    render(screen):
-        Renders the entity on the given screen.
-"""
-
-
-import pygame
-from .constants import TILE_SIZE, COLOUR_WHITE
-
-class Entity: # Base class for all entities in the game
-    def __init__(self, maze, position = (0, 0), colour = (255, 255, 255), image_path = None): # Default position is (0, 0) and default colour is white
-        self.maze = maze
-        self.position = position
-        self.colour = colour
-        self.image = None
-
-        if image_path:
-            self.image = pygame.image.load(image_path).convert_alpha()
-            self.image = pygame.transform.scale(self.image, (TILE_SIZE, TILE_SIZE))
-    
-    def update(self): # This method should be overridden by subclasses
-        pass
-
-    def render(self, screen): # This method should be overridden by subclasses
-        row, col = self.position
-        x = col * TILE_SIZE
-        y = row * TILE_SIZE
-        
-        if self.image:
-            screen.blit(self.image, (x, y))
-        else:
-            # Fallback: draw a colored rectangle or circle
-            rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
-            pygame.draw.rect(screen, self.color, rect)
\ No newline at end of file
+# game/entity.py
+"""
+Entity class represents a game entity in the Pacman game.
+Attributes:
+    maze: The maze in which the entity exists.
+    position: A tuple representing the (row, col) position of the entity in the maze.
+    colour: The colour of the entity.
+    speed: Tiles per second when the game runs on a fixed timestep; 0 for entities that never move.
+    previous_position: The tile the entity stood on before its last move.
+    draw_position: The (row, col) the entity is drawn at, between previous_position and position while it moves.
+    progress: The fraction of a tile accumulated toward the next move.
+Methods:
+    __init__(maze, position, colour, image_path=None):
+        Initializes the Entity with a maze, position, and colour; the image comes from the shared
+        asset cache, so every entity with the same sprite shares one surface.
+    update():
+        Updates the state of the entity. This method should be overridden by subclasses.
+    steps_due(dt):
+        Adds dt seconds of movement at the entity's speed and returns how many whole tiles it moves this tick.
+    interpolate(alpha, dt):
+        Sets draw_position for a frame alpha ticks of dt seconds after the last tick.
+    render(screen):
+        Renders the entity on the given screen at draw_position.
+"""
+
+
+import pygame
+from .constants import TILE_SIZE, COLOUR_WHITE
+from utils.asset_cache import assets
+
+class Entity: # Base class for all entities in the game
+    def __init__(self, maze, position = (0, 0), colour = (255, 255, 255), image_path = None): # Default position is (0, 0) and default colour is white
+        self.maze = maze
+        self.position = position
+        self.colour = colour
+        self.speed = 0
+        self.previous_position = position # Tile before the last move, the start of the drawn slide
+        self.draw_position = position
+        self.progress = 0.0
+        self.image = None
+
+        if image_path and not maze.headless: # Headless simulations never touch the display
+            self.image = assets.image(image_path, (TILE_SIZE, TILE_SIZE))
+    
+    def update(self): # This method should be overridden by subclasses
+        pass
+
+    def steps_due(self, dt): # Whole tiles to move this tick; the fraction left over carries to the next
+        self.progress += self.speed * dt
+        steps = int(self.progress)
+        self.progress -= steps
+        return steps
+
+    def interpolate(self, alpha, dt): # Slide from the previous tile to the current one over one move
+        fraction = min(1.0, self.progress + self.speed * dt * alpha)
+        (previous_row, previous_col), (row, col) = self.previous_position, self.position
+        self.draw_position = (previous_row + (row - previous_row) * fraction, previous_col + (col - previous_col) * fraction)
+
+    def render(self, screen): # This method should be overridden by subclasses
+        row, col = self.draw_position
+        x = round(col * TILE_SIZE)
+        y = round(row * TILE_SIZE)
+        
+        if self.image:
+            screen.blit(self.image, (x, y))
+        else:
+            # Fallback: draw a colored rectangle or circle
+            rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
+            pygame.draw.rect(screen, self.colour, rect)
\ No newline at end of file
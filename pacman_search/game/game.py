@@ -1,102 +1,221 @@
-# game/game.py
-"""
-This module contains the Game class which initializes and runs the Pac-Man game.
-Classes:
-    Game: Manages the game loop, event handling, updating, and rendering of game entities.
-Methods:
-    __init__: Initializes the game, including the maze, screen, clock, Pac-Man, and ghosts.
-    run: Runs the main game loop, handling events, updating game state, and rendering.
-    handle_events: Handles user input and other events.
-    update: Updates the game state, including the positions of Pac-Man and the ghosts.
-    render: Renders the game entities on the screen.
-"""
-
-import pygame
-import sys
-from .constants import TILE_SIZE, COLOUR_BLACK
-from .maze import Maze
-from .pacman import Pacman
-from game.ghosts.blue_ghost import BlueGhost
-from game.ghosts.orange_ghost import OrangeGhost
-from game.ghosts.pink_ghost import PinkGhost
-from game.ghosts.red_ghost import RedGhost
-
-class Game:
-    def __init__(self, level = 1):
-        pygame.init()
-        
-        self.level = level
-        self.maze = Maze()
-        
-        # Example: Each level uses a different ghost or set of ghosts
-        # Adjust as needed for your BFS, DFS, UCS, A* logic, etc.
-        
-        if level == 1:
-            self.ghosts = [BlueGhost(self.maze, start_pos=(1, 1))]
-        elif level == 2:
-            self.ghosts = [PinkGhost(self.maze, start_pos=(1, self.maze.cols - 2))]
-        elif level == 3:
-            self.ghosts = [OrangeGhost(self.maze, start_pos=(self.maze.rows - 2, 1))]
-        elif level == 4:
-            self.ghosts = [RedGhost(self.maze, start_pos=(self.maze.rows - 2, self.maze.cols - 2))]
-        elif level == 5:
-            self.ghosts = [
-                BlueGhost(self.maze, start_pos=(1, 1)),
-                PinkGhost(self.maze, start_pos=(1, self.maze.cols - 2)),
-                OrangeGhost(self.maze, start_pos=(self.maze.rows - 2, 1)),
-                RedGhost(self.maze, start_pos=(self.maze.rows - 2, self.maze.cols - 2))
-            ]
-        elif level == 6: # Will be modified in the future
-            # Possibly a special mode or advanced logic
-            # For demonstration, reuse all ghosts but do something special
-            self.ghosts = [
-                BlueGhost(self.maze, start_pos=(1, 1)),
-                PinkGhost(self.maze, start_pos=(1, self.maze.cols - 2)),
-                OrangeGhost(self.maze, start_pos=(self.maze.rows - 2, 1)),
-                RedGhost(self.maze, start_pos=(self.maze.rows - 2, self.maze.cols - 2))
-            ]
-        
-        self.width = self.maze.cols * TILE_SIZE
-        self.height = self.maze.rows * TILE_SIZE
-        self.screen = pygame.display.set_mode((self.width, self.height))
-
-        # Pac-Man
-        self.pacman = Pacman(self.maze, position = (10, 10))
-        self.clock = pygame.time.Clock()
-
-    def run(self): # Run the game loop
-        while True:
-            self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(10) # Limit the frame rate to 10 FPS
-
-    def handle_events(self): # Handle events in the game
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            self.pacman.handle_event(event) # Handle events for the Pacman
-
-    def update(self): # Update the game state for the entities in the game loop
-        self.pacman.update()
-        pacman_position = self.pacman.position
-
-        ghost_positions = [ghost.position for ghost in self.ghosts]
-        for ghost in self.ghosts:
-            ghost.update(pacman_position, ghost_positions)
-
-    
-    def render(self): # Render the game entities on the screen
-        self.screen.fill(COLOUR_BLACK)
-        self.maze.render(self.screen)
-        self.pacman.render(self.screen)
-        for ghost in self.ghosts:
-            ghost.render(self.screen)
-
-        pygame.display.flip()
-
-    if __name__ == '__main__': # Run the game
-        game = Game()
-        game.run()
+# game/game.py
+"""
+This module contains the Game class which initializes and runs the Pac-Man game.
+Classes:
+    Game: Manages the game loop, event handling, updating, and rendering of game entities.
+Methods:
+    __init__: Initializes the game, including the maze, screen, clock, Pac-Man, and ghosts.
+        planning selects how ghosts chase: "search" runs each ghost's own search algorithm,
+        "oracle" reads moves from the maze's precomputed DistanceOracle, and "shared" runs one
+        reverse BFS from Pac-Man per tick that every ghost reads its move from. By default the
+        levels with several ghosts (5 and 6) use "shared" and the others "search".
+        With "search", the ghosts look their paths up in the maze's PathCache before searching.
+        headless skips pygame, the window and all image loading so update() can be driven directly.
+        instrumentation is the mode of the ghosts' searches; by default "off" when playing and
+        "counters" when headless, so simulations still report ghost search time.
+        map_file loads the maze from a map JSON file (a name in assets/maps or a path) instead of
+        generating it; the map is compiled to a binary cache on its first load, see utils.map_cache.
+        tick_rate and frame_rate set the simulation ticks per second and the frame rate cap of run().
+        incremental makes the red ghost chase with D* Lite, replanning every tick, instead of A*.
+        plan_budget, in seconds per tick, makes "search" ghosts plan with sliced searches (see
+        Ghost.step_plan), each tick's budget split evenly between the ghosts with a search in
+        progress, so a large maze or many ghosts planning at once cannot stall a tick. None
+        searches whole paths at once, as before.
+    run: Runs the main game loop on a fixed timestep: the time each frame took is added to an
+        accumulator, one tick of 1 / tick_rate seconds is simulated for every whole tick in it,
+        and the frame is rendered with the entities interpolated by the time left over. After a
+        slow frame several ticks run before the next render, at most MAX_CATCH_UP; the rest of a
+        longer stall is dropped so the game slows down instead of freezing to catch up.
+    handle_events: Handles user input and other events.
+    update(dt=None): Updates the game state, including the positions of Pac-Man and the ghosts.
+        With dt, one tick of dt seconds: every entity moves as many tiles as its speed allows
+        (see Entity.steps_due), so a ghost plans at most once per move. Without dt, every entity
+        moves one tile, as headless simulations step the game.
+        With shared planning, the distance field is computed before any ghost moves.
+        Ghosts with a node_budget or time_budget advance their sliced search once per tick,
+        however many tiles they move, before the ghosts move.
+        Also advances the tick counter and records the tick at which a ghost caught Pac-Man.
+    render(alpha=None): Renders the game entities on the screen.
+        The maze is drawn once into the Renderer's cached layer; each frame only redraws
+        and updates the tiles the entities left or moved onto. With alpha, the fraction of a
+        tick since the last update, entities are drawn sliding between their tiles.
+"""
+
+import pygame
+import sys
+import time
+from .constants import TILE_SIZE, MAZE_ROWS, MAZE_COLS, TICK_RATE, FRAME_RATE, MAX_CATCH_UP
+from .maze import Maze
+from .pacman import Pacman
+from .renderer import Renderer
+from search.instrumentation import OFF, COUNTERS
+from search.DistanceField import DistanceField
+from game.ghosts.blue_ghost import BlueGhost
+from game.ghosts.orange_ghost import OrangeGhost
+from game.ghosts.pink_ghost import PinkGhost
+from game.ghosts.red_ghost import RedGhost
+
+SHARED_PLANNING_LEVELS = (5, 6) # Levels where several ghosts chase at once
+
+class Game:
+    def __init__(
+        self, level = 1, planning = None, headless = False, maze_size = None, instrumentation = None, map_file = None,
+        tick_rate = TICK_RATE, frame_rate = FRAME_RATE, plan_budget = None, incremental = False
+    ):
+        if not headless:
+            pygame.init()
+        
+        if planning is None:
+            planning = "shared" if level in SHARED_PLANNING_LEVELS else "search"
+        self.level = level
+        self.planning = planning
+        self.plan_budget = plan_budget if planning == "search" else None
+        self.headless = headless
+        self.tick_rate = tick_rate
+        self.frame_rate = frame_rate
+        rows, cols = maze_size if maze_size else (MAZE_ROWS, MAZE_COLS)
+        self.maze = Maze(rows, cols, headless = headless, map_file = map_file)
+        
+        # Example: Each level uses a different ghost or set of ghosts
+        # Adjust as needed for your BFS, DFS, UCS, A* logic, etc.
+        
+        if level == 1:
+            self.ghosts = [BlueGhost(self.maze, start_pos=(1, 1))]
+        elif level == 2:
+            self.ghosts = [PinkGhost(self.maze, start_pos=(1, self.maze.cols - 2))]
+        elif level == 3:
+            self.ghosts = [OrangeGhost(self.maze, start_pos=(self.maze.rows - 2, 1))]
+        elif level == 4:
+            self.ghosts = [RedGhost(self.maze, start_pos=(self.maze.rows - 2, self.maze.cols - 2), incremental = incremental)]
+        elif level == 5:
+            self.ghosts = [
+                BlueGhost(self.maze, start_pos=(1, 1)),
+                PinkGhost(self.maze, start_pos=(1, self.maze.cols - 2)),
+                OrangeGhost(self.maze, start_pos=(self.maze.rows - 2, 1)),
+                RedGhost(self.maze, start_pos=(self.maze.rows - 2, self.maze.cols - 2), incremental = incremental)
+            ]
+        elif level == 6: # Will be modified in the future
+            # Possibly a special mode or advanced logic
+            # For demonstration, reuse all ghosts but do something special
+            self.ghosts = [
+                BlueGhost(self.maze, start_pos=(1, 1)),
+                PinkGhost(self.maze, start_pos=(1, self.maze.cols - 2)),
+                OrangeGhost(self.maze, start_pos=(self.maze.rows - 2, 1)),
+                RedGhost(self.maze, start_pos=(self.maze.rows - 2, self.maze.cols - 2), incremental = incremental)
+            ]
+
+        self.distance_field = None
+        if planning == "oracle":
+            self.maze.distance_oracle # Build the distance table on level load
+            for ghost in self.ghosts:
+                ghost.use_oracle = True
+        elif planning == "shared":
+            self.distance_field = DistanceField()
+            for ghost in self.ghosts:
+                ghost.distance_field = self.distance_field
+        elif planning == "search":
+            for ghost in self.ghosts: # Ghosts asking for the same paths share the maze's cache
+                ghost.path_cache = self.maze.path_cache
+                if plan_budget is not None:
+                    ghost.time_budget = plan_budget # Upper bound, each tick shares it out in update()
+        else:
+            raise ValueError(f"Unknown planning mode: {planning}")
+
+        if instrumentation is None:
+            instrumentation = COUNTERS if headless else OFF
+        for ghost in self.ghosts:
+            ghost.search_algorithm.instrumentation = instrumentation
+        
+        self.width = self.maze.cols * TILE_SIZE
+        self.height = self.maze.rows * TILE_SIZE
+        self.screen = None
+        self.clock = None
+        self.renderer = Renderer(self.maze) # Cached maze layer and dirty rects for render()
+        if not headless:
+            self.screen = pygame.display.set_mode((self.width, self.height))
+            self.clock = pygame.time.Clock()
+            self.renderer.bake()
+
+        # Pac-Man
+        self.pacman = Pacman(self.maze, position = (self.maze.rows // 2, self.maze.cols // 2))
+
+        self.ticks = 0 # Number of update() calls so far
+        self.capture_tick = None # Tick at which a ghost first reached Pac-Man
+
+    def run(self): # Run the game loop
+        dt = 1.0 / self.tick_rate
+        accumulator = 0.0
+        previous = time.perf_counter()
+        while True:
+            self.handle_events()
+            now = time.perf_counter()
+            accumulator += now - previous
+            previous = now
+
+            ticks = 0
+            while accumulator >= dt and ticks < MAX_CATCH_UP: # Catch up on the ticks this frame took, without rendering
+                self.update(dt)
+                accumulator -= dt
+                ticks += 1
+            if ticks == MAX_CATCH_UP:
+                accumulator %= dt # Drop the rest of a long stall
+
+            self.render(accumulator / dt)
+            self.clock.tick(self.frame_rate) # Cap the frame rate, the ticks keep their own pace
+
+    def handle_events(self): # Handle events in the game
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            self.pacman.handle_event(event) # Handle events for the Pacman
+
+    def update(self, dt = None): # Update the game state for the entities in the game loop
+        for _ in range(1 if dt is None else self.pacman.steps_due(dt)):
+            self.pacman.previous_position = self.pacman.position
+            self.pacman.update()
+        pacman_position = self.pacman.position
+
+        ghost_steps = [1 if dt is None else ghost.steps_due(dt) for ghost in self.ghosts]
+        ghost_positions = [ghost.position for ghost in self.ghosts]
+        # Sliced searches advance every tick, not only on ticks a ghost moves
+        sliced = [ghost for ghost in self.ghosts if ghost.node_budget is not None or ghost.time_budget is not None]
+        for ghost in sliced:
+            ghost.start_plan(pacman_position)
+        planning = [ghost for ghost in sliced if ghost.plan is not None]
+        for ghost in planning: # This tick's budget goes to the ghosts that are actually searching
+            ghost.step_plan(self.plan_budget / len(planning) if self.plan_budget is not None else None)
+        if self.distance_field is not None and any(ghost_steps): # One search from Pac-Man serves every ghost
+            graph = self.maze.graph
+            self.distance_field.compute(
+                graph,
+                graph.cell_id(pacman_position),
+                [graph.cell_id(position) for position in ghost_positions]
+            )
+        for ghost, steps in zip(self.ghosts, ghost_steps):
+            for _ in range(steps):
+                ghost.previous_position = ghost.position
+                ghost.update(pacman_position, ghost_positions)
+
+        self.ticks += 1
+        if self.capture_tick is None and any(ghost.position == pacman_position for ghost in self.ghosts):
+            self.capture_tick = self.ticks
+
+    @property
+    def captured(self): # True once a ghost has caught Pac-Man
+        return self.capture_tick is not None
+
+    
+    def render(self, alpha = None): # Render the game entities on the screen
+        entities = [self.pacman] + self.ghosts
+        for entity in entities:
+            if alpha is None:
+                entity.draw_position = entity.position
+            else:
+                entity.interpolate(alpha, 1.0 / self.tick_rate)
+        self.renderer.draw(self.screen, entities) # Only the tiles that changed reach the display
+
+    if __name__ == '__main__': # Run the game
+        game = Game()
+        game.run()
         
\ No newline at end of file
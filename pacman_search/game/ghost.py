@@ -1,88 +1,213 @@
-# game/ghost.py
-"""
-This module defines the behavior of ghosts in the Pacman game.
-Classes:
-    ChasePacmanProblem: A search problem for chasing Pacman.
-    Ghost: Represents a ghost entity in the game.
-ChasePacmanProblem:
-    Methods:
-        __init__(maze, start, goal): Initializes the problem with the maze, start, and goal positions.
-        get_initial_state(): Returns the initial state of the problem.
-        goal_test(state): Checks if the given state is the goal state.
-        get_successors(state): Returns the successors of the given state.
-        heuristic(state): Computes the heuristic value for the given state using Manhattan distance.
-Ghost:
-    Methods:
-        __init__(maze, position, colour, speed): Initializes the ghost with the maze, position, color, and speed.
-        update(pacman_pos, other_ghosts_positions): Updates the state of the ghost based on Pacman's position and other ghosts' positions.
-        get_new_position(move): Returns the new position of the ghost based on the given move.
-        compute_path(pacman_pos): Computes the path to Pacman's position (to be implemented by subclasses).
-"""
-
-
-
-from .entity import Entity
-from search import SearchProblem
-from search.utils import null_heuristic
-from .constants import GHOST_SPEED
-
-class ChasePacmanProblem(SearchProblem):
-    def __init__(self, maze, start, goal): # Initialize the problem
-        self.maze = maze
-        self.start = start
-        self.goal = goal
-
-    def get_initial_state(self): # Get the initial state
-        return self.start 
-
-    def goal_test(self, state): # Check if the state is the goal state
-        return state == self.goal
-
-    def get_successors(self, state): # Get the successors of the state
-        return self.maze.get_neighbours(state) # Delegate to the maze for valid neighbour moves
-
-    def heuristic(self, state):
-        # Use Manhattan distance as heuristic
-        row, col = state
-        goal_row, goal_col = self.goal
-        return abs(row - goal_row) + abs(col - goal_col)
-
-class Ghost(Entity): # Represents a ghost entity in the game
-    def __init__(
-        self, 
-        maze, 
-        position = (0, 0), 
-        colour = (255, 0, 0),
-        speed = GHOST_SPEED,
-        image_path = None
-    ):
-        super().__init__(maze, position, colour, image_path)
-        self.speed = speed
-        self.path = [] # List of actions to reach the target
-
-    def update(self, pacman_pos, other_ghosts_positions): # Update the state of the ghost
-        if not self.path: # If there is no path
-            self.compute_path(pacman_pos)
-
-        if self.path: # If there is a path
-            next_move = self.path.pop(0)
-            new_position = self.get_new_position(next_move)
-            if not self.maze.is_wall(new_position) and new_position not in other_ghosts_positions: # Check if the new position is not a wall and not occupied by another ghost
-                self.position = new_position
-
-    def get_new_position(self, move):
-        row, col = self.position
-        if move == 'UP':
-            return (row - 1, col)
-        elif move == 'DOWN':
-            return (row + 1, col)
-        elif move == 'LEFT':
-            return (row, col - 1)
-        elif move == 'RIGHT':
-            return (row, col + 1)
-        
-        return self.position
-
-    def compute_path(self, pacman_pos): # Compute the path to the pacman
-        raise NotImplementedError("This method should be implemented by the subclass")
-       
\ No newline at end of file
+# game/ghost.py
+"""
+This module defines the behavior of ghosts in the Pacman game.
+Classes:
+    ChasePacmanProblem: A search problem for chasing Pacman.
+    Ghost: Represents a ghost entity in the game.
+ChasePacmanProblem:
+    Methods:
+        __init__(maze, start, goal, encoded=False): Initializes the problem with the maze, start, and goal positions.
+            With encoded=True the states are integer cell ids of maze.graph and successors come from its CSR adjacency.
+        get_initial_state(): Returns the initial state of the problem.
+        goal_test(state): Checks if the given state is the goal state.
+        get_successors(state): Returns the successors of the given state.
+        get_predecessors(state), get_goal_state(), reverse_heuristic(state): The same, run backwards from Pac-Man
+            for the bidirectional searches.
+        heuristic(state): Computes the heuristic value for the given state using Manhattan distance.
+        state_count(), state_id(state): Number the cells of the maze so searches can use flat arrays.
+Ghost:
+    Methods:
+        __init__(maze, position, colour, speed): Initializes the ghost with the maze, position, color, and speed.
+        update(pacman_pos, other_ghosts_positions): Updates the state of the ghost based on Pacman's position and other ghosts' positions.
+            When distance_field is set, the next move is read from that shared field, computed by the Game once per tick.
+            When use_oracle is set, the next move is read from the maze's DistanceOracle instead of a search.
+            When replan_every_tick is set, the path is searched again on every update instead of when it runs out.
+            When node_budget or time_budget is set, update only follows the path: planning is advanced
+            separately, once per tick, by plan_path (the Game calls start_plan and step_plan for every ghost).
+        get_new_position(move): Returns the new position of the ghost based on the given move.
+        compute_path(pacman_pos): Computes the path to Pacman's position with the ghost's search_algorithm
+            and adds the search statistics to search_time, searches and nodes_expanded.
+            When path_cache is set, cached paths are reused and only the misses are searched and counted.
+        plan_path(pacman_pos, time_budget=None): start_plan then step_plan, one slice of planning.
+        start_plan(pacman_pos): Starts a SlicedSearch toward Pacman's position when a new path is needed,
+            unless the path cache already has one.
+        step_plan(time_budget=None): Advances the SlicedSearch in progress by node_budget nodes or
+            time_budget seconds (the given one, else the ghost's own). The ghost keeps following its
+            previous path meanwhile, and takes up the new one from wherever it has got to on it; a ghost
+            that left the new path stops and plans again from where it stands.
+"""
+
+
+
+import operator
+from .entity import Entity
+from search import SearchProblem, SlicedSearch
+from search.utils import null_heuristic
+from search.GridGraph import ACTIONS, MOVES
+from search.PathCache import MISS
+from .constants import GHOST_SPEED
+
+class ChasePacmanProblem(SearchProblem):
+    def __init__(self, maze, start, goal, encoded = False): # Initialize the problem
+        self.maze = maze
+        self.start = start
+        self.goal = goal
+        self.encoded = encoded # States are cell ids of maze.graph instead of (row, col) tuples
+
+        if encoded:
+            self.graph = maze.graph
+            self.start_state = self.graph.cell_id(start)
+            self.goal_state = self.graph.cell_id(goal)
+            self.get_successors = self.graph.successors # Precomputed tuples, no allocation per expansion
+            self.get_predecessors = self.graph.predecessors
+            self.state_id = operator.index # Cell ids already index the search tree arrays
+        else:
+            self.start_state = start
+            self.goal_state = goal
+
+    def get_initial_state(self): # Get the initial state
+        return self.start_state
+
+    def goal_test(self, state): # Check if the state is the goal state
+        return state == self.goal_state
+
+    def get_successors(self, state): # Get the successors of the state
+        return self.maze.get_neighbours(state) # Delegate to the maze for valid neighbour moves
+
+    def get_predecessors(self, state): # Cells that can step into the state, for searches run backwards
+        return self.maze.graph.position_predecessors(state[0] * self.maze.cols + state[1])
+
+    def get_goal_state(self):
+        return self.goal_state
+
+    def heuristic(self, state):
+        # Use Manhattan distance as heuristic
+        row, col = divmod(state, self.maze.cols) if self.encoded else state
+        goal_row, goal_col = self.goal
+        return abs(row - goal_row) + abs(col - goal_col)
+
+    def reverse_heuristic(self, state): # Manhattan distance back to the start
+        row, col = divmod(state, self.maze.cols) if self.encoded else state
+        start_row, start_col = self.start
+        return abs(row - start_row) + abs(col - start_col)
+
+    def state_count(self): # Cells are numbered row * cols + col for flat-array search trees
+        return self.maze.rows * self.maze.cols
+
+    def state_id(self, state):
+        return state[0] * self.maze.cols + state[1]
+
+class Ghost(Entity): # Represents a ghost entity in the game
+    def __init__(
+        self, 
+        maze, 
+        position = (0, 0), 
+        colour = (255, 0, 0),
+        speed = GHOST_SPEED,
+        image_path = None
+    ):
+        super().__init__(maze, position, colour, image_path)
+        self.speed = speed
+        self.path = [] # List of actions to reach the target
+        self.use_oracle = False # Chase with O(1) next-hop lookups instead of searching
+        self.distance_field = None # A DistanceField shared by all the ghosts, set by the Game
+        self.path_cache = None # A PathCache to look paths up in before searching, set by the Game
+        self.replan_every_tick = False # Follow Pac-Man as it moves, meant for incremental algorithms
+        self.search_algorithm = None # Set by the subclasses
+        self.node_budget = None # Nodes a sliced search may expand per tick, None for no limit
+        self.time_budget = None # Seconds a sliced search may run per tick, None for no limit
+        self.plan = None # The SlicedSearch in progress, if any
+
+        # Running totals over all the searches this ghost has made
+        self.search_time = 0.0
+        self.searches = 0
+        self.nodes_expanded = 0
+
+    def update(self, pacman_pos, other_ghosts_positions): # Update the state of the ghost
+        if self.distance_field is not None:
+            next_move = self.distance_field.next_action(self.maze.graph.cell_id(self.position))
+        elif self.use_oracle:
+            next_move = self.maze.distance_oracle.next_action(self.position, pacman_pos)
+        else:
+            if self.node_budget is not None or self.time_budget is not None:
+                pass # Planned once per tick by plan_path, not once per move
+            elif self.replan_every_tick or not self.path: # If there is no path, or it must follow Pac-Man
+                self.compute_path(pacman_pos)
+            next_move = self.path.pop(0) if self.path else None
+
+        if next_move: # If there is a move to make
+            new_position = self.get_new_position(next_move)
+            if not self.maze.is_wall(new_position) and new_position not in other_ghosts_positions: # Check if the new position is not a wall and not occupied by another ghost
+                self.position = new_position
+
+    def get_new_position(self, move):
+        row, col = self.position
+        if move == 'UP':
+            return (row - 1, col)
+        elif move == 'DOWN':
+            return (row + 1, col)
+        elif move == 'LEFT':
+            return (row, col - 1)
+        elif move == 'RIGHT':
+            return (row, col + 1)
+        
+        return self.position
+
+    def compute_path(self, pacman_pos): # Compute the path to the pacman
+        if self.search_algorithm is None:
+            raise NotImplementedError("The subclass should set a search algorithm")
+
+        problem = ChasePacmanProblem(self.maze, self.position, pacman_pos, encoded = True)
+        if self.path_cache is not None:
+            actions = self.path_cache.lookup(self.search_algorithm, problem)
+            if actions is not MISS: # A cache hit is not a search, the cache counts it
+                self.path = actions if actions is not None else []
+                return
+        result = self.search_algorithm.search(problem)
+        if self.path_cache is not None:
+            self.path_cache.add(self.search_algorithm, problem, result.actions)
+        self.search_time += result.search_time
+        self.searches += 1
+        self.nodes_expanded += result.nodes_expanded
+        self.path = result.actions if result.actions is not None else []
+
+    def plan_path(self, pacman_pos, time_budget = None): # Start a planning search if needed and run one slice of it
+        self.start_plan(pacman_pos)
+        self.step_plan(time_budget)
+
+    def start_plan(self, pacman_pos): # Start a planning search when a new path is needed
+        if self.search_algorithm is None:
+            raise NotImplementedError("The subclass should set a search algorithm")
+        if self.plan is not None or (self.path and not self.replan_every_tick):
+            return
+        problem = ChasePacmanProblem(self.maze, self.position, pacman_pos, encoded = True)
+        if self.path_cache is not None:
+            actions = self.path_cache.lookup(self.search_algorithm, problem)
+            if actions is not MISS: # A cache hit is not a search, the cache counts it
+                self.path = actions if actions is not None else []
+                return
+        self.plan = SlicedSearch(self.search_algorithm, problem)
+
+    def step_plan(self, time_budget = None): # Run one slice of the planning search in progress, if any
+        if self.plan is None:
+            return
+        result = self.plan.step(self.node_budget, time_budget if time_budget is not None else self.time_budget)
+        if result is None: # Not done yet, the previous path is followed meanwhile
+            return
+        problem = self.plan.problem
+        self.plan = None
+        self.search_time += result.search_time
+        self.searches += 1
+        self.nodes_expanded += result.nodes_expanded
+        if self.path_cache is not None:
+            self.path_cache.add(self.search_algorithm, problem, result.actions)
+        self.path = self._rejoin(problem.start, result.actions or [])
+
+    def _rejoin(self, start, actions): # The rest of a path planned from start, from the ghost's current position
+        row, col = start
+        for index, action in enumerate(actions):
+            if (row, col) == self.position:
+                return actions[index:]
+            d_row, d_col = MOVES[ACTIONS.index(action)]
+            row, col = row + d_row, col + d_col
+        return [] # Off the path, or at its end: plan again from here
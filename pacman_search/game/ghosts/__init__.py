@@ -1,6 +1,6 @@
-# game/ghosts/__init__.py
-
-from .blue_ghost import BlueGhost
-from .orange_ghost import OrangeGhost
-from .pink_ghost import PinkGhost
-from .red_ghost import RedGhost
+# game/ghosts/__init__.py
+
+from .blue_ghost import BlueGhost
+from .orange_ghost import OrangeGhost
+from .pink_ghost import PinkGhost
+from .red_ghost import RedGhost
@@ -1,137 +1,211 @@
-# game/maze.py
-
-import os
-import pygame
-from .constants import TILE_SIZE, MAZE_ROWS, MAZE_COLS
-import sys
-
-class Maze: # Represents the maze in the game
-    def __init__(self): # Initialize the maze
-        self.rows = MAZE_ROWS
-        self.cols = MAZE_COLS
-        self.grid = self.generate_maze()
-        
-        # # Load the images for the maze
-        # self.wall_image_h = pygame.image.load("assets\images\map_images\horizontal_walls.png").convert_alpha()  
-        # self.wall_image_h = pygame.transform.scale(self.wall_image_h, (TILE_SIZE, TILE_SIZE))
-
-        # self.wall_image_v = pygame.image.load("assets\images\map_images\vertical_walls.png").convert_alpha()
-        # self.wall_image_v = pygame.transform.scale(self.wall_image_v, (TILE_SIZE, TILE_SIZE))
-
-        # self.empty_image = pygame.image.load("assets\images\map_images\empty.png").convert_alpha()
-        # self.empty_image = pygame.transform.scale(self.empty_image, (TILE_SIZE, TILE_SIZE))
-
-        # self.blue_dot_image = pygame.image.load("assets\images\map_images\blue_dot.png").convert_alpha()
-        # self.blue_dot_image = pygame.transform.scale(self.dot_image, (TILE_SIZE, TILE_SIZE))
-
-        # Use os.path.join for cross-platform compatibility
-        base_path = os.path.join('assets', 'images', 'map_images')
-        
-        # Error handling for image loading
-        try:
-            # Horizontal walls
-            self.wall_image_h = pygame.image.load(os.path.join(base_path, 'horizontal_walls.png')).convert_alpha()
-            self.wall_image_h = pygame.transform.scale(self.wall_image_h, (TILE_SIZE, TILE_SIZE))
-
-            # Vertical walls
-            self.wall_image_v = pygame.image.load(os.path.join(base_path, 'vertical_walls.png')).convert_alpha()
-            self.wall_image_v = pygame.transform.scale(self.wall_image_v, (TILE_SIZE, TILE_SIZE))
-
-            # Empty tile
-            self.empty_image = pygame.image.load(os.path.join(base_path, 'empty.png')).convert_alpha()
-            self.empty_image = pygame.transform.scale(self.empty_image, (TILE_SIZE, TILE_SIZE))
-
-            # Blue dot
-            self.blue_dot_image = pygame.image.load(os.path.join(base_path, 'blue_dot.png')).convert_alpha()
-            self.blue_dot_image = pygame.transform.scale(self.blue_dot_image, (TILE_SIZE, TILE_SIZE))
-
-            # Regular dot
-            self.dot_image = pygame.image.load(os.path.join(base_path, 'blue_dot.png')).convert_alpha()
-            self.dot_image = pygame.transform.scale(self.dot_image, (TILE_SIZE, TILE_SIZE))
-        
-        except pygame.error as e:
-            print(f"Error loading maze images: {e}")
-            # Provide fallback images or exit
-            sys.exit(1)
-
-    def generate_maze(self):
-        # Create a grid with a wall border and simple internal walls
-        grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)] # 0 is a path, 1 is a wall
-        for i in range(self.rows):
-            grid[i][0] = grid[i][self.cols - 1] = 1 # Create left and right walls
-        for j in range(self.cols):
-            grid[0][j] = grid[self.rows - 1][j] = 1 # Create top and bottom walls
-
-        # Create internal walls
-        for i in range(2, self.rows - 2, 2): # Skip every other row
-            for j in range(2, self.cols - 2, 2): # Skip every other column
-                grid[i][j] = 1
-
-        return grid
-
-    def is_wall(self, pos): # pos is a tuple (row, col)
-        row, col = pos 
-        return self.grid[row][col] == 1
-        
-    def get_neighbours(self, pos): # pos is a tuple (row, col)
-        row, col = pos
-        directions = {
-            'UP': (-1, 0),
-            'DOWN': (1, 0),
-            'LEFT': (0, -1),
-            'RIGHT': (0, 1)
-        }
-
-        neighbours = [] # List of tuples (action, new_pos, cost)
-        for action, (dr, dc) in directions.items():
-            new_pos = (row + dr, col + dc)
-            if 0 <= new_pos[0] < self.rows and 0 <= new_pos[1] < self.cols:
-                neighbours.append((action, new_pos, 1)) # 1 is the cost to move to a neighbour 
-
-        return neighbours
-
-    def is_intersection(self, row, col): # Check if the cell is an intersection
-        if self.grid[row][col] != 0:
-            return False
-        
-        # Check top-left corner
-        if row > 0 and col > 0 and self.grid[row - 1][col] == 1 and self.grid[row][col - 1] == 1:
-            return True
-        # Check top-right corner
-        if row > 0 and col < self.cols - 1 and self.grid[row - 1][col] == 1 and self.grid[row][col + 1] == 1:
-            return True
-        # Check bottom-left corner
-        if row < self.rows - 1 and col > 0 and self.grid[row + 1][col] == 1 and self.grid[row][col - 1] == 1:
-            return True
-        # Check bottom-right corner
-        if row < self.rows - 1 and col < self.cols - 1 and self.grid[row + 1][col] == 1 and self.grid[row][col + 1] == 1:
-            return True
-        
-        return False
-
-    def render(self, screen): # Render the maze on the screen
-        for row in range(self.rows):
-            for col in range(self.cols):
-                x = col * TILE_SIZE
-                y = row * TILE_SIZE
-                if self.grid[row][col] == 1:
-                    # Choose wall tile based on position
-                    if row == 0 or row == self.rows - 1:
-                        screen.blit(self.wall_image_h, (x, y))
-                    elif col == 0 or col == self.cols - 1:
-                        screen.blit(self.wall_image_v, (x, y))
-                    else:
-                        # For internal walls, default to horizontal wall image.
-                        screen.blit(self.wall_image_h, (x, y))
-                else:
-                    # Draw the empty cell background
-                    screen.blit(self.empty_image, (x, y))
-                    
-                    # Determine which dot to render:
-                    # Use blue dot if the cell is an intersection/corner; otherwise use the normal dot.
-                    dot = self.blue_dot_image if self.is_intersection(row, col) else self.dot_image
-                    
-                    dot_w, dot_h = dot.get_size()
-                    pos_x = x + (TILE_SIZE - dot_w) // 2
-                    pos_y = y + (TILE_SIZE - dot_h) // 2
+# game/maze.py
+
+import os
+import json
+import pygame
+from .constants import TILE_SIZE, MAZE_ROWS, MAZE_COLS
+from search.Oracle import DistanceOracle
+from search.GridGraph import GridGraph, cost_layer
+from search.CorridorGraph import CorridorGraph
+from search.Landmarks import Landmarks
+from search.PathCache import PathCache
+from utils.map_cache import read_map, read_map_cache, write_map_cache
+from utils.asset_cache import assets
+import sys
+
+class Maze: # Represents the maze in the game
+    def __init__(self, rows = MAZE_ROWS, cols = MAZE_COLS, headless = False, grid = None, costs = None, map_file = None): # Initialize the maze
+        if map_file is not None: # A map file's grid and costs, from its compiled cache when there is one
+            grid, costs, sections, cache_path = self._read_map(map_file)
+        self.rows = len(grid) if grid else rows
+        self.cols = len(grid[0]) if grid else cols
+        self.headless = headless # Headless mazes load no images and cannot be rendered
+        self.grid = grid if grid else self.generate_maze() # A given grid of 0 (path) and 1 (wall) is used as is
+        self.costs = cost_layer(costs, self.rows, self.cols) if costs is not None else None # Entry cost per tile, None for 1 everywhere
+        self.version = 0 # Bumped whenever the grid changes so derived tables get rebuilt
+        self._distance_oracle = None
+        self._graph = None
+        self._corridor_graph = None
+        self._landmarks = None
+        self._intersections = None
+        self._intersections_version = None
+        self.path_cache = PathCache() # Shared by the ghosts searching this maze
+        if map_file is not None:
+            self._compile_map(sections, cache_path)
+
+        if self.headless:
+            return
+        
+        # Tile images come from the shared asset cache, so a new maze (e.g. the next level) reads no files
+        base_path = os.path.join('assets', 'images', 'map_images')
+        tile = (TILE_SIZE, TILE_SIZE)
+        try:
+            self.wall_image_h = assets.image(os.path.join(base_path, 'horizontal_walls.png'), tile)
+            self.wall_image_v = assets.image(os.path.join(base_path, 'vertical_walls.png'), tile)
+            self.empty_image = assets.image(os.path.join(base_path, 'empty.png'), tile)
+            self.blue_dot_image = assets.image(os.path.join(base_path, 'blue_dot.png'), tile)
+            self.dot_image = self.blue_dot_image # Regular dots use the same sprite
+
+        except pygame.error as e:
+            print(f"Error loading maze images: {e}")
+            # Provide fallback images or exit
+            sys.exit(1)
+
+    def generate_maze(self):
+        # Create a grid with a wall border and simple internal walls
+        grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)] # 0 is a path, 1 is a wall
+        for i in range(self.rows):
+            grid[i][0] = grid[i][self.cols - 1] = 1 # Create left and right walls
+        for j in range(self.cols):
+            grid[0][j] = grid[self.rows - 1][j] = 1 # Create top and bottom walls
+
+        # Create internal walls
+        for i in range(2, self.rows - 2, 2): # Skip every other row
+            for j in range(2, self.cols - 2, 2): # Skip every other column
+                grid[i][j] = 1
+
+        return grid
+
+    def _read_map(self, map_file):
+        raw, cache_path = read_map(map_file)
+        sections = read_map_cache(cache_path)
+        if sections is not None:
+            walls, cols = sections["walls"], sections["cols"]
+            grid = [list(walls[row * cols:(row + 1) * cols]) for row in range(sections["rows"])]
+            return grid, sections["costs"], sections, cache_path
+
+        data = json.loads(raw) # First load: parse the JSON, any non-zero tile is a wall
+        grid = [[0 if tile == 0 else 1 for tile in row] for row in data["map"]]
+        return grid, data.get("costs"), None, cache_path
+
+    def _compile_map(self, sections, cache_path):
+        if sections is None: # Compile the graph and intersections now and save them for the next load
+            self._intersections = self._intersection_map()
+            self._intersections_version = self.version
+            try:
+                write_map_cache(cache_path, self.graph, self._intersections, self.costs)
+            except OSError as e: # The cache only saves time, the maze works without it
+                print(f"Error writing map cache '{cache_path}': {e}")
+            return
+        # Memory-mapped arrays of the cache, wrapped as they are
+        self._graph = GridGraph.from_buffers(
+            self.rows, self.cols, sections["walls"],
+            sections["costs"] if sections["costs"] is not None else bytearray([1]) * (self.rows * self.cols),
+            sections["offsets"], sections["targets"], sections["action_codes"], sections["weighted"],
+            version = self.version
+        )
+        self._intersections = sections["intersections"]
+        self._intersections_version = self.version
+
+    def is_wall(self, pos): # pos is a tuple (row, col)
+        row, col = pos 
+        return self.grid[row][col] == 1
+
+    def set_tile(self, pos, value): # Change a cell to a path (0) or a wall (1)
+        row, col = pos
+        if self.grid[row][col] != value:
+            self.grid[row][col] = value
+            self.invalidate()
+
+    def tile_cost(self, pos): # Cost of stepping onto a tile
+        return self.costs[pos[0] * self.cols + pos[1]] if self.costs is not None else 1
+
+    def set_cost(self, pos, cost): # Change the cost of stepping onto a tile, 1 to 255
+        if cost < 1:
+            raise ValueError("Tile costs must be at least 1")
+        if self.costs is None:
+            self.costs = bytearray([1]) * (self.rows * self.cols)
+        cell = pos[0] * self.cols + pos[1]
+        if self.costs[cell] != cost:
+            self.costs[cell] = cost
+            self.invalidate()
+
+    def invalidate(self): # Call after editing self.grid or self.costs directly
+        self.version += 1
+
+    @property
+    def distance_oracle(self): # All-pairs distance table, rebuilt only when the grid has changed
+        if self._distance_oracle is None or self._distance_oracle.version != self.version:
+            self._distance_oracle = DistanceOracle(self.grid, version = self.version, costs = self.costs)
+        return self._distance_oracle
+        
+    @property
+    def graph(self): # Integer CSR graph of the grid, recompiled only when the grid has changed
+        if self._graph is None or self._graph.version != self.version:
+            self._graph = GridGraph(self.grid, version = self.version, costs = self.costs)
+        return self._graph
+
+    @property
+    def corridor_graph(self): # Junctions and corridors of the graph, rebuilt only when the grid has changed
+        if self._corridor_graph is None or self._corridor_graph.version != self.version:
+            self._corridor_graph = CorridorGraph(self.graph)
+        return self._corridor_graph
+
+    @property
+    def landmarks(self): # Landmark distance tables for the ALT heuristic, rebuilt only when the grid has changed
+        if self._landmarks is None or self._landmarks.version != self.version:
+            self._landmarks = Landmarks(self.graph)
+        return self._landmarks
+
+    @property
+    def junctions(self): # Cell id -> junction index, -1 for corridor and wall cells
+        return self.corridor_graph.node_index
+
+    def get_neighbours(self, pos): # pos is a tuple (row, col)
+        # Tuples of (action, new_pos, cost), precomputed once per cell by the compiled graph
+        return self.graph.position_successors(pos[0] * self.cols + pos[1])
+
+    def is_intersection(self, row, col): # Check if the cell is an intersection, from the map built once per grid version
+        if self._intersections_version != self.version:
+            self._intersections = self._intersection_map()
+            self._intersections_version = self.version
+        return self._intersections[row * self.cols + col] == 1
+
+    def _intersection_map(self):
+        return bytearray(self._corner(r, c) for r in range(self.rows) for c in range(self.cols))
+
+    def _corner(self, row, col):
+        if self.grid[row][col] != 0:
+            return False
+        
+        # Check top-left corner
+        if row > 0 and col > 0 and self.grid[row - 1][col] == 1 and self.grid[row][col - 1] == 1:
+            return True
+        # Check top-right corner
+        if row > 0 and col < self.cols - 1 and self.grid[row - 1][col] == 1 and self.grid[row][col + 1] == 1:
+            return True
+        # Check bottom-left corner
+        if row < self.rows - 1 and col > 0 and self.grid[row + 1][col] == 1 and self.grid[row][col - 1] == 1:
+            return True
+        # Check bottom-right corner
+        if row < self.rows - 1 and col < self.cols - 1 and self.grid[row + 1][col] == 1 and self.grid[row][col + 1] == 1:
+            return True
+        
+        return False
+
+    def render(self, screen): # Render the maze on the screen
+        for row in range(self.rows):
+            for col in range(self.cols):
+                x = col * TILE_SIZE
+                y = row * TILE_SIZE
+                if self.grid[row][col] == 1:
+                    # Choose wall tile based on position
+                    if row == 0 or row == self.rows - 1:
+                        screen.blit(self.wall_image_h, (x, y))
+                    elif col == 0 or col == self.cols - 1:
+                        screen.blit(self.wall_image_v, (x, y))
+                    else:
+                        # For internal walls, default to horizontal wall image.
+                        screen.blit(self.wall_image_h, (x, y))
+                else:
+                    # Draw the empty cell background
+                    screen.blit(self.empty_image, (x, y))
+                    
+                    # Determine which dot to render:
+                    # Use blue dot if the cell is an intersection/corner; otherwise use the normal dot.
+                    dot = self.blue_dot_image if self.is_intersection(row, col) else self.dot_image
+                    
+                    dot_w, dot_h = dot.get_size()
+                    pos_x = x + (TILE_SIZE - dot_w) // 2
+                    pos_y = y + (TILE_SIZE - dot_h) // 2
                     screen.blit(dot, (pos_x, pos_y))
\ No newline at end of file
@@ -0,0 +1,89 @@
+# game/renderer.py
+"""
+This module draws the game with a cached maze layer and dirty rectangles.
+The maze never changes between frames, so it is drawn once into an off-screen surface when
+a level is loaded (and again only when the maze version changes). Each frame then only
+restores the background under the entities that moved, draws the entities there, and passes
+just those rectangles to pygame.display.update, so a frame costs in proportion to the number
+of entities instead of the maze area. Entities are drawn at their draw_position, which lies
+between two tiles while the game interpolates a move.
+Classes:
+    Renderer: Keeps the static maze layer and the rectangles drawn in the previous frame.
+Methods:
+    bake(): Draws the maze into the cached layer, done on level load.
+    draw(screen, entities): Draws one frame and updates only the parts of the display that changed.
+    invalidate(): Forces the next frame to be drawn and flipped in full.
+"""
+
+import pygame
+from .constants import TILE_SIZE, COLOUR_BLACK
+
+
+class Renderer:
+    """
+    Draws a maze and its entities onto a screen, one frame at a time.
+    Attributes:
+        maze (Maze): The maze whose static layer is cached.
+        background (Surface): The cached maze layer, rebuilt when the maze version changes.
+        drawn (dict): The rect each entity was drawn at in the previous frame.
+    """
+
+    def __init__(self, maze):
+        self.maze = maze
+        self.background = None # The maze drawn once, blitted back under moving entities
+        self.version = None
+        self.screen = None
+        self.drawn = {} # entity -> the rect it was drawn at in the previous frame
+
+    def invalidate(self): # Next frame redraws everything, e.g. after something else drew on the screen
+        self.screen = None
+
+    def bake(self): # Draw the walls, floor and intersection markers into the cached layer
+        size = (self.maze.cols * TILE_SIZE, self.maze.rows * TILE_SIZE)
+        self.background = pygame.Surface(size).convert()
+        self.background.fill(COLOUR_BLACK)
+        self.maze.render(self.background)
+        self.version = self.maze.version
+
+    def _rect(self, entity):
+        row, col = entity.draw_position
+        return pygame.Rect(round(col * TILE_SIZE), round(row * TILE_SIZE), TILE_SIZE, TILE_SIZE)
+
+    def draw(self, screen, entities):
+        if self.background is None or self.version != self.maze.version:
+            self.bake()
+            self.screen = None
+
+        if screen is not self.screen: # First frame on this screen: draw and flip in full
+            self.screen = screen
+            screen.fill(COLOUR_BLACK)
+            screen.blit(self.background, (0, 0))
+            for entity in entities:
+                entity.render(screen)
+            self.drawn = {entity: self._rect(entity) for entity in entities}
+            pygame.display.flip()
+            return
+
+        dirty = []
+        current = {}
+        for entity in entities:
+            rect = self._rect(entity)
+            current[entity] = rect
+            previous = self.drawn.get(entity)
+            if previous != rect:
+                if previous is not None:
+                    dirty.append(previous)
+                dirty.append(rect)
+        for entity, previous in self.drawn.items(): # Entities that are gone leave their tile behind
+            if entity not in current:
+                dirty.append(previous)
+        self.drawn = current
+        if not dirty:
+            return
+
+        for rect in dirty:
+            screen.blit(self.background, rect, rect)
+        for entity, rect in current.items(): # Redraw anything the restored tiles covered, in the usual order
+            if rect.collidelist(dirty) != -1:
+                entity.render(screen)
+        pygame.display.update(dirty)
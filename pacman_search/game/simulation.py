@@ -0,0 +1,133 @@
+# game/simulation.py
+"""
+This module runs Pac-Man levels headlessly, without a window or frame-rate limit.
+A Simulation owns a headless Game and calls Game.update in a tight loop, with Pac-Man
+driven by a policy instead of the keyboard, so levels can be played at thousands of ticks per second.
+Classes:
+    SimulationResult: A data class with the outcome and ghost search statistics of one run.
+    Simulation: Steps a headless Game with a Pac-Man policy.
+    IdlePolicy: Pac-Man never moves.
+    ScriptedPolicy: Pac-Man follows a fixed list of directions, one per tick.
+    RandomPolicy: Pac-Man wanders randomly, from a seed.
+Functions:
+    load_recording(path): Loads a ScriptedPolicy from a recording written by Simulation.save_recording.
+"""
+
+import json
+import random
+import time
+from dataclasses import dataclass
+from .game import Game
+
+
+class IdlePolicy: # Pac-Man stands still
+    def __call__(self, game):
+        return None
+
+
+class ScriptedPolicy: # Pac-Man follows a list of directions, one per tick
+    def __init__(self, directions, loop = False):
+        self.directions = list(directions)
+        self.loop = loop
+        self.index = 0
+
+    def __call__(self, game):
+        if self.index >= len(self.directions):
+            if not self.loop or not self.directions:
+                return None
+            self.index = 0
+        direction = self.directions[self.index]
+        self.index += 1
+        return direction
+
+
+class RandomPolicy: # Pac-Man keeps its heading and turns at random, never into a wall
+    def __init__(self, seed = None, turn_chance = 0.2):
+        self.random = random.Random(seed)
+        self.turn_chance = turn_chance
+
+    def __call__(self, game):
+        pacman = game.pacman
+        open_directions = [action for action, position, cost in game.maze.get_neighbours(pacman.position)]
+        if not open_directions:
+            return None
+        if pacman.directions in open_directions and self.random.random() >= self.turn_chance:
+            return pacman.directions
+        return self.random.choice(open_directions)
+
+
+def load_recording(path): # Replay the directions saved by Simulation.save_recording
+    with open(path, "r") as file:
+        return ScriptedPolicy(json.load(file)["directions"])
+
+
+@dataclass
+class SimulationResult:
+    level: int
+    ticks: int
+    captured: bool
+    capture_tick: int
+    ghost_search_time: float
+    ghost_searches: int
+    nodes_expanded: int
+    wall_time: float
+
+
+class Simulation:
+    """
+    Runs one level headlessly. incremental is passed on to the Game: the red ghost then chases with D* Lite.
+    Attributes:
+        game (Game): The headless game being simulated.
+        policy (callable): Called with the game every tick, returns Pac-Man's direction or None to keep the current one.
+        max_ticks (int): The number of ticks after which run() stops.
+        stop_on_capture (bool): Whether run() stops as soon as a ghost catches Pac-Man.
+        recording (list): The direction Pac-Man held on every tick, for save_recording().
+    Methods:
+        step(): Advances the game by one tick.
+        run(ticks=None): Steps until capture or the tick limit and returns a SimulationResult.
+        save_recording(path): Writes the directions Pac-Man used so the run can be replayed.
+    """
+
+    def __init__(self, level = 1, policy = None, planning = None, maze_size = None, max_ticks = 10000, stop_on_capture = True, map_file = None, incremental = False):
+        self.game = Game(level = level, planning = planning, headless = True, maze_size = maze_size, map_file = map_file, incremental = incremental)
+        self.policy = policy if policy is not None else IdlePolicy()
+        self.max_ticks = max_ticks
+        self.stop_on_capture = stop_on_capture
+        self.recording = []
+        self.wall_time = 0.0
+
+    def step(self): # Advance the game by one tick
+        direction = self.policy(self.game)
+        if direction is not None:
+            self.game.pacman.directions = direction
+        self.recording.append(self.game.pacman.directions)
+        self.game.update()
+
+    def run(self, ticks = None): # Step until capture or the tick limit
+        limit = self.game.ticks + ticks if ticks is not None else self.max_ticks
+        start_time = time.perf_counter()
+        while self.game.ticks < limit:
+            self.step()
+            if self.stop_on_capture and self.game.captured:
+                break
+        self.wall_time += time.perf_counter() - start_time
+        return self.result()
+
+    def result(self): # Outcome and ghost search statistics so far
+        planners = list(self.game.ghosts) # Anything with search_time, searches and nodes_expanded totals
+        if self.game.distance_field is not None:
+            planners.append(self.game.distance_field)
+        return SimulationResult(
+            level = self.game.level,
+            ticks = self.game.ticks,
+            captured = self.game.captured,
+            capture_tick = self.game.capture_tick,
+            ghost_search_time = sum(planner.search_time for planner in planners),
+            ghost_searches = sum(planner.searches for planner in planners),
+            nodes_expanded = sum(planner.nodes_expanded for planner in planners),
+            wall_time = self.wall_time
+        )
+
+    def save_recording(self, path): # Write Pac-Man's directions so the run can be replayed
+        with open(path, "w") as file:
+            json.dump({"level": self.game.level, "directions": self.recording}, file)
@@ -1,66 +1,110 @@
-# gui/utils.py
-"""
-This module provides utility functions and classes for the Pacman search GUI.
-Functions:
-    load_font(font_path, size):
-        Loads a font from the specified path and size. If loading fails, returns a default system font.
-    draw_text(surface, text, font, colour, pos):
-        Draws text on a given surface at the specified position with the given font and colour.
-Classes:
-    Button:
-        A class representing a clickable button in the GUI.
-        Methods:
-            __init__(self, rect, text, font, bg_colour, text_colour, hover_colour=None):
-                Initializes the Button with a rectangle, text, font, background colour, text colour, and optional hover colour.
-            draw(self, surface):
-                Draws the button on the given surface.
-            update(self, event_list):
-                Updates the button state based on the event list. Returns True if the button is clicked.
-"""
-
-import os
-import pygame
-
-def load_font(font_path, size):
-    font_path = os.path.join("assets", "fonts", "Arcade Font", font_path)
-    try:
-        return pygame.font.Font(font_path, size)
-    except Exception as e:
-        print(f"Error loading font: {e}")
-        return pygame.font.SysFont(None, size)
-
-def draw_text(surface, text, font, colour, pos):
-    text_surface = font.render(text, True, colour)
-    surface.blit(text_surface, pos)
-
-class Button:
-    def __init__(self, rect, text, font, bg_colour, text_colour, hover_colour = None):
-        self.rect = pygame.Rect(rect)
-        self.text = text
-        self.font = font 
-        self.bg_colour = bg_colour
-        self.text_colour = text_colour
-        self.hover_colour = hover_colour if hover_colour else bg_colour
-        self.is_hovered = False
-
-    def update(self, event_list):
-        mouse_pos = pygame.mouse.get_pos()
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
-        for event in event_list:
-            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if self.is_hovered:
-                    return True
-        return False
-
-    def draw(self, surface):
-        colour = self.hover_colour if self.is_hovered else self.bg_colour
-        pygame.draw.rect(surface, colour, self.rect)
-        text_surface = self.font.render(self.text, True, self.text_colour)
-        text_rect = text_surface.get_rect(center = self.rect.center)
-        surface.blit(text_surface, text_rect)
-
-
-
-
-
-
+# gui/utils.py
+"""
+This module provides utility functions and classes for the Pacman search GUI.
+Functions:
+    load_font(font_path, size):
+        Loads a font from the specified path and size through the shared asset cache, so reopening
+        a screen reuses the font. If loading fails, returns the default font.
+    draw_text(surface, text, font, colour, pos):
+        Draws text on a given surface at the specified position with the given font and colour.
+        The rendered text is cached, so drawing the same string every frame rasterises it once.
+    wait_events(timeout=IDLE_TIMEOUT):
+        Blocks until an event arrives or timeout milliseconds pass, then returns every pending event.
+        Menu screens loop on it instead of a 60 FPS clock, so an idle screen sleeps.
+    needs_redraw(events):
+        True if the window was exposed, restored or resized and the whole screen must be drawn again.
+    draw_dirty(surface, buttons):
+        Redraws the buttons whose hover state changed and updates only their part of the display.
+Classes:
+    Button:
+        A class representing a clickable button in the GUI.
+        Methods:
+            __init__(self, rect, text, font, bg_colour, text_colour, hover_colour=None):
+                Initializes the Button with a rectangle, text, font, background colour, text colour, and optional hover colour,
+                and pre-renders its normal and hover states.
+            render_states(self):
+                Renders the normal and hover states again, after the text, font or colours were changed.
+            draw(self, surface):
+                Draws the button on the given surface by blitting the pre-rendered state. Returns its rect.
+            update(self, event_list):
+                Updates the hover state from the mouse events in the list, setting dirty when it changes.
+                Returns True if the button is clicked.
+            sync_hover(self):
+                Sets the hover state from the current mouse position, e.g. when a screen is entered.
+"""
+
+import os
+import pygame
+from utils.asset_cache import assets
+
+def load_font(font_path, size):
+    return assets.font(os.path.join("assets", "fonts", "Arcade Font", font_path), size)
+
+IDLE_TIMEOUT = 500 # Milliseconds a menu waits for an event before looping anyway
+REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED)
+MOUSE_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+def draw_text(surface, text, font, colour, pos):
+    surface.blit(assets.text(font, text, colour), pos)
+
+def wait_events(timeout = IDLE_TIMEOUT):
+    event = pygame.event.wait(timeout)
+    events = [] if event.type == pygame.NOEVENT else [event]
+    events.extend(pygame.event.get())
+    return events
+
+def needs_redraw(events):
+    return any(event.type in REDRAW_EVENTS for event in events)
+
+def draw_dirty(surface, buttons):
+    rects = [button.draw(surface) for button in buttons if button.dirty]
+    if rects:
+        pygame.display.update(rects)
+
+class Button:
+    def __init__(self, rect, text, font, bg_colour, text_colour, hover_colour = None):
+        self.rect = pygame.Rect(rect)
+        self.text = text
+        self.font = font 
+        self.bg_colour = bg_colour
+        self.text_colour = text_colour
+        self.hover_colour = hover_colour if hover_colour else bg_colour
+        self.is_hovered = False
+        self.dirty = True # Hover state changed since the last draw
+        self.render_states()
+
+    def render_states(self): # The whole button, background and label, for not hovered and hovered
+        text_surface = assets.text(self.font, self.text, self.text_colour)
+        self.states = {}
+        for hovered, colour in ((False, self.bg_colour), (True, self.hover_colour)):
+            state = pygame.Surface(self.rect.size)
+            state.fill(colour)
+            state.blit(text_surface, text_surface.get_rect(center = state.get_rect().center))
+            self.states[hovered] = state
+
+    def _hover(self, pos):
+        hovered = bool(self.rect.collidepoint(pos))
+        if hovered != self.is_hovered:
+            self.is_hovered = hovered
+            self.dirty = True
+
+    def sync_hover(self):
+        self._hover(pygame.mouse.get_pos())
+
+    def update(self, event_list): # The mouse position comes from the events, nothing is polled
+        for event in event_list:
+            if event.type in MOUSE_EVENTS:
+                self._hover(event.pos)
+                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.is_hovered:
+                    return True
+        return False
+
+    def draw(self, surface):
+        self.dirty = False
+        return surface.blit(self.states[self.is_hovered], self.rect)
+
+
+
+
+
+
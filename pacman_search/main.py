@@ -1,32 +1,48 @@
-# main.py
-
-import pygame
-import os
-from gui.menu import Menu
-
-def resource_path(relative_path):
-    """
-    Get the absolute path to the resource, works for dev and PyInstaller.
-    When using PyInstaller with --onefile, sys._MEIPASS is where bundled files are unpacked.
-    """
-    try:
-        base_path = sys._MEIPASS  # type: ignore[attr-defined]
-    except AttributeError:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
-
-def main():
-
-    pygame.init()
-    
-    screen_width = 800
-    screen_height = 600
-
-    screen = pygame.display.set_mode((screen_width, screen_height))
-    pygame.display.set_caption("Pac-Man Search Game")
-
-    menu = Menu(screen)
-    menu.run()
-
-if __name__ == "__main__":
+# main.py
+
+import pygame
+import os
+import sys
+from gui.menu import Menu
+from game.constants import TILE_SIZE
+from utils.asset_cache import assets
+
+MENU_FONT = os.path.join("assets", "fonts", "Arcade Font", "EtArtiluxDots-xRR1V.ttf")
+SPRITES = [ # Loaded once at startup, then shared by every maze and entity
+    os.path.join("assets", "images", "Entities", name)
+    for name in ("pacman.png", "red_ghost.png", "pink_ghost.png", "blue_ghost.png", "orange_ghost.png")
+] + [
+    os.path.join("assets", "images", "map_images", name)
+    for name in ("horizontal_walls.png", "vertical_walls.png", "empty.png", "blue_dot.png")
+]
+
+def resource_path(relative_path):
+    """
+    Get the absolute path to the resource, works for dev and PyInstaller.
+    When using PyInstaller with --onefile, sys._MEIPASS is where bundled files are unpacked.
+    """
+    try:
+        base_path = sys._MEIPASS  # type: ignore[attr-defined]
+    except AttributeError:
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, relative_path)
+
+def main():
+
+    pygame.init()
+    
+    screen_width = 800
+    screen_height = 600
+
+    screen = pygame.display.set_mode((screen_width, screen_height))
+    pygame.display.set_caption("Pac-Man Search Game")
+    assets.preload(
+        images = [(path, (TILE_SIZE, TILE_SIZE)) for path in SPRITES],
+        fonts = [(MENU_FONT, 36), (MENU_FONT, 72)]
+    )
+
+    menu = Menu(screen)
+    menu.run()
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,108 +1,113 @@
-# search/AStar.py
-"""
-AStar search algorithm implementation.
-This module contains the AStar class which implements the A* search algorithm
-for solving search problems. The A* algorithm uses a priority queue to explore
-nodes based on their path cost and heuristic value.
-Classes:
-    AStar: Implements the A* search algorithm.
-Methods:
-    search(problem):
-        Performs the A* search on the given problem.
-        Args:
-            problem: An instance of a search problem.
-        Returns:
-            A SearchResult object containing the actions to reach the goal,
-            the search time, memory usage, and the number of nodes expanded.
-"""
-
-
-import time
-import tracemalloc
-from .Search import SearchAlgorithm, reconstruct_path, SearchResult
-from .utils import Node, PriorityQueue
-
-class AStar(SearchAlgorithm):
-    """
-    A* search algorithm implementation.
-    Methods
-    -------
-    search(problem):
-        Executes the A* search algorithm on the given problem.
-    search(problem)
-        Parameters
-        ----------
-        problem : Problem
-            The problem to be solved by the A* search algorithm.
-        Returns
-        -------
-        SearchResult
-            An object containing the result of the search, including the actions to reach the goal,
-            the search time, memory usage, and the number of nodes expanded.
-    """
-    
-    def search(self, problem):
-        start_time = time.perf_counter()
-        tracemalloc.start()
-        nodes_expanded = 0
-
-        initial_state = problem.get_initial_state()
-        # Create the root node
-        root = Node(state = initial_state, parent = None, action = None, path_cost = 0)
-
-        if problem.goal_test(root.state): # if the root is the goal state
-            end_time = time.perf_counter()
-            current, peak  = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-
-            return SearchResult(
-                actions = reconstruct_path(root),
-                search_time = end_time - start_time,
-                memory_usage = peak,
-                nodes_expanded = nodes_expanded
-            )
-
-        frontier = PriorityQueue() # create a priority queue
-        frontier.push(root, root.path_cost + problem.heuristic(root.state)) # push the root node to the frontier
-        explored = {root.state: root.path_cost} # create a dictionary with the root state
-
-        while not frontier.is_empty(): # while the frontier is not empty
-            node = frontier.pop()
-            nodes_expanded += 1
-
-            if problem.goal_test(node.state): # if the node is the goal state
-                end_time = time.perf_counter()
-                current, peak = tracemalloc.get_traced_memory()
-                tracemalloc.stop()
-
-                return SearchResult(
-                    actions = reconstruct_path(node),
-                    search_time = end_time - start_time,
-                    memory_usage = peak,
-                    nodes_expanded = nodes_expanded
-                )
-
-            for action, next_state, cost in problem.get_successors(node.state): # get the successors of the node
-                child_cost = node.path_cost + cost
-                if next_state not in explored or child_cost < explored[next_state]:
-                    child = Node(
-                        state = next_state,
-                        parent = node,
-                        action = action,
-                        path_cost = child_cost
-                    )
-
-                    priority = child_cost + problem.heuristic(next_state)
-                    frontier.push(child, priority)
-                    explored[next_state] = child_cost
-
-        end_time = time.perf_counter()
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-
-        return SearchResult(
-            actions = None,
-            search_time = end_time - start_time,
-            memory_usage = peak,
-            nodes_expanded = nodes_expanded
-        )
\ No newline at end of file
+# search/AStar.py
+"""
+AStar search algorithm implementation.
+This module contains the AStar class which implements the A* search algorithm
+for solving search problems. The A* algorithm uses a priority queue to explore
+nodes based on their path cost and heuristic value.
+Classes:
+    AStar: Implements the A* search algorithm.
+Methods:
+    AStar(queue=PriorityQueue, check_consistency=False, heuristic=None):
+        The queue class holds the frontier; BucketQueue or IndexedPriorityQueue from search.utils
+        lower the priority of a queued state instead of pushing it again.
+        Expanded states go into a closed set, so older frontier entries for them are skipped when
+        popped; with a consistent heuristic each state is expanded at most once. A state reached
+        more cheaply after its expansion (possible only with an inconsistent heuristic) is reopened.
+        check_consistency counts the edges that break h(s) <= cost + h(s').
+        heuristic, if given, builds the heuristic from the problem instead of using problem.heuristic,
+        e.g. landmark_heuristic from search.Landmarks.
+    search(problem):
+        Performs the A* search on the given problem.
+        Args:
+            problem: An instance of a search problem.
+        Returns:
+            A SearchResult object containing the actions to reach the goal,
+            the search time, memory usage, and the number of nodes expanded,
+            with stale_pops, reopened and (when checked) inconsistent_edges in stats.
+"""
+
+
+import math
+from .Search import SearchAlgorithm, run_steps
+from .utils import PriorityQueue, search_tree
+
+class AStar(SearchAlgorithm):
+    """
+    A* search algorithm implementation.
+    Methods
+    -------
+    search(problem):
+        Executes the A* search algorithm on the given problem.
+    search(problem)
+        Parameters
+        ----------
+        problem : Problem
+            The problem to be solved by the A* search algorithm.
+        Returns
+        -------
+        SearchResult
+            An object containing the result of the search, including the actions to reach the goal,
+            the search time, memory usage, and the number of nodes expanded.
+    """
+    
+    optimal = True # Shortest paths, as long as the problem's heuristic is admissible
+
+    def __init__(self, queue = PriorityQueue, check_consistency = False, heuristic = None, instrumentation = None):
+        super().__init__(instrumentation)
+        self.queue = queue # Frontier class with the PriorityQueue interface
+        self.check_consistency = check_consistency # Count the edges where h(s) > cost + h(s') in stats
+        self.heuristic = heuristic # problem -> heuristic(state), None for problem.heuristic
+
+    def _search(self, problem):
+        return run_steps(self._search_steps(problem))
+
+    def _search_steps(self, problem, pause = math.inf):
+        nodes_expanded = 0
+        stats = {"stale_pops": 0, "reopened": 0}
+        check = self.check_consistency
+        if check:
+            stats["inconsistent_edges"] = 0
+        heuristic = self.heuristic(problem) if self.heuristic else problem.heuristic
+
+        with search_tree(problem) as tree: # best known cost and parent of every reached state
+            initial_state = problem.get_initial_state()
+            root = tree.key(initial_state)
+            tree.add_root(root)
+
+            if problem.goal_test(initial_state): # if the root is the goal state
+                return tree.path(root), nodes_expanded, stats
+
+            frontier = self.queue() # create a priority queue
+            frontier.push(initial_state, heuristic(initial_state)) # push the root state to the frontier
+
+            while not frontier.is_empty(): # while the frontier is not empty
+                if nodes_expanded >= pause: # this slice is used up, wait for the next one
+                    pause = yield nodes_expanded
+                state = frontier.pop()
+                key = tree.key(state)
+                if tree.is_closed(key): # a stale entry, left behind when the state was pushed again more cheaply
+                    stats["stale_pops"] += 1
+                    continue
+                tree.close(key) # expanded, so later entries for it are stale
+                path_cost = tree.cost(key)
+                nodes_expanded += 1
+
+                if problem.goal_test(state): # if the state is the goal state
+                    return tree.path(key), nodes_expanded, stats
+
+                if check:
+                    state_heuristic = heuristic(state)
+                for action, next_state, cost in problem.get_successors(state): # get the successors of the state
+                    child_cost = path_cost + cost
+                    next_key = tree.key(next_state)
+                    if check and state_heuristic > cost + heuristic(next_state):
+                        stats["inconsistent_edges"] += 1
+                    if child_cost < tree.cost(next_key): # if the child is unseen or reached more cheaply than before
+                        if tree.is_closed(next_key): # only an inconsistent heuristic expands a state before its cheapest path
+                            tree.reopen(next_key)
+                            stats["reopened"] += 1
+                        tree.add(next_key, key, action, child_cost)
+                        priority = child_cost + heuristic(next_state)
+                        frontier.push(next_state, priority)
+
+        return None, nodes_expanded, stats
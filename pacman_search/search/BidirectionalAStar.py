@@ -0,0 +1,88 @@
+# search/BidirectionalAStar.py
+"""
+Bidirectional A* search implementation.
+This module contains the BidirectionalAStar class, which runs one A* forward from the initial
+state with problem.heuristic and one backward from the goal state through the problem's
+predecessors with problem.reverse_heuristic, expanding from the smaller open set each time.
+Every edge relaxed into a state the other search has reached gives a complete path; the best
+one is returned once either frontier's smallest f value is no lower than its cost.
+Classes:
+    BidirectionalAStar: Implements the bidirectional A* search algorithm.
+Methods:
+    search(problem):
+        Performs the bidirectional A* search on the given problem.
+        Args:
+            problem: A search problem with consistent heuristics in both directions that also provides
+                     get_goal_state() and get_predecessors(state), such as ChasePacmanProblem.
+        Returns:
+            SearchResult: The actions to reach the goal, search time, memory usage and nodes expanded,
+                          with the expansions of each frontier in stats.
+"""
+
+from .Search import SearchAlgorithm
+from .utils import PriorityQueue, search_tree
+
+
+class BidirectionalAStar(SearchAlgorithm):
+    """
+    Bidirectional A* with front-to-end heuristics.
+    Stats
+    -----
+    forward_expanded, backward_expanded: States expanded by each frontier.
+    """
+
+    optimal = True # With consistent heuristics, as the Manhattan distance is on the grid
+
+    def _search(self, problem):
+        expanded = [0, 0] # forward, backward
+
+        def stats():
+            return {"forward_expanded": expanded[0], "backward_expanded": expanded[1]}
+
+        initial_state, goal_state = problem.get_initial_state(), problem.get_goal_state()
+        if goal_state is None:
+            raise ValueError("Bidirectional search needs a problem with a single goal state")
+
+        with search_tree(problem) as forward, search_tree(problem) as backward:
+            start, goal = forward.key(initial_state), backward.key(goal_state)
+            forward.add_root(start)
+            if problem.goal_test(initial_state):
+                return forward.path(start), 0, stats()
+            backward.add_root(goal)
+
+            trees = (forward, backward)
+            neighbours = (problem.get_successors, problem.get_predecessors)
+            heuristics = (problem.heuristic, problem.reverse_heuristic)
+            frontiers = (PriorityQueue(), PriorityQueue())
+            frontiers[0].push(initial_state, heuristics[0](initial_state))
+            frontiers[1].push(goal_state, heuristics[1](goal_state))
+            closed = (set(), set())
+            best, meeting = float('inf'), None # Cost of the best complete path so far, and where it joins
+
+            while not frontiers[0].is_empty() and not frontiers[1].is_empty():
+                if max(frontiers[0].min_priority(), frontiers[1].min_priority()) >= best:
+                    break # Every path left through one frontier costs at least best, so no cheaper one remains
+                side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+                tree, other = trees[side], trees[1 - side]
+
+                state = frontiers[side].pop()
+                key = tree.key(state)
+                if key in closed[side]: # An older entry, already expanded at a lower cost
+                    continue
+                closed[side].add(key)
+                expanded[side] += 1
+
+                path_cost = tree.cost(key)
+                for action, next_state, cost in neighbours[side](state):
+                    child_cost = path_cost + cost
+                    next_key = tree.key(next_state)
+                    if child_cost < tree.cost(next_key):
+                        tree.add(next_key, key, action, child_cost)
+                        frontiers[side].push(next_state, child_cost + heuristics[side](next_state))
+                        if child_cost + other.cost(next_key) < best:
+                            best, meeting = child_cost + other.cost(next_key), next_key
+
+            if meeting is None:
+                return None, sum(expanded), stats()
+            # The backward tree holds moves towards the goal, read from the goal outwards
+            return forward.path(meeting) + backward.path(meeting)[::-1], sum(expanded), stats()
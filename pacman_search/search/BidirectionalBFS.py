@@ -0,0 +1,87 @@
+# search/BidirectionalBFS.py
+"""
+Bidirectional Breadth-First Search implementation.
+This module contains the BidirectionalBFS class, which grows one BFS frontier forward from the
+initial state and one backward from the goal state through the problem's predecessors, always
+expanding a whole layer of the smaller frontier. The searches meet after each has covered about
+half of the distance, so far fewer states are expanded on long paths than with a single BFS.
+Classes:
+    BidirectionalBFS: Implements the bidirectional BFS search algorithm.
+Methods:
+    search(problem):
+        Performs the bidirectional BFS on the given problem.
+        Args:
+            problem: A search problem with unit step costs that also provides get_goal_state()
+                     and get_predecessors(state), such as ChasePacmanProblem. A problem on a maze
+                     or grid graph with a weighted cost layer raises ValueError.
+        Returns:
+            SearchResult: The actions to reach the goal, search time, memory usage and nodes expanded,
+                          with the expansions of each frontier in stats.
+"""
+
+from .Search import SearchAlgorithm
+from .utils import search_tree
+
+
+def _weighted(problem): # True if the grid graph behind a maze problem has a cost layer
+    graph = getattr(problem, "graph", None)
+    if graph is None and hasattr(problem, "maze"):
+        graph = problem.maze.graph
+    return graph is not None and graph.weighted
+
+class BidirectionalBFS(SearchAlgorithm):
+    """
+    Bidirectional Breadth-First Search for problems with unit step costs; a weighted grid raises ValueError.
+    Stats
+    -----
+    forward_expanded, backward_expanded: States expanded by each frontier.
+    """
+
+    optimal = True
+
+    def _search(self, problem):
+        expanded = [0, 0] # forward, backward
+
+        def stats():
+            return {"forward_expanded": expanded[0], "backward_expanded": expanded[1]}
+
+        if _weighted(problem):
+            raise ValueError("Bidirectional BFS needs unit step costs, the maze has a weighted cost layer")
+        initial_state, goal_state = problem.get_initial_state(), problem.get_goal_state()
+        if goal_state is None:
+            raise ValueError("Bidirectional search needs a problem with a single goal state")
+
+        with search_tree(problem) as forward, search_tree(problem) as backward:
+            start, goal = forward.key(initial_state), backward.key(goal_state)
+            forward.add_root(start)
+            if problem.goal_test(initial_state):
+                return forward.path(start), 0, stats()
+            backward.add_root(goal)
+
+            frontiers = [[initial_state], [goal_state]]
+            trees = (forward, backward)
+            neighbours = (problem.get_successors, problem.get_predecessors)
+            while frontiers[0] and frontiers[1]:
+                side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+                tree, other = trees[side], trees[1 - side]
+
+                # Expand the whole layer: the first meeting found is not always the shortest
+                layer, frontiers[side] = frontiers[side], []
+                best, meeting = float('inf'), None
+                for state in layer:
+                    key = tree.key(state)
+                    expanded[side] += 1
+                    for action, next_state, cost in neighbours[side](state):
+                        next_key = tree.key(next_state)
+                        if tree.seen(next_key):
+                            continue
+                        tree.add(next_key, key, action, tree.cost(key) + cost)
+                        frontiers[side].append(next_state)
+                        if other.seen(next_key) and tree.cost(next_key) + other.cost(next_key) < best:
+                            best, meeting = tree.cost(next_key) + other.cost(next_key), next_key
+
+                if meeting is not None:
+                    # The backward tree holds moves towards the goal, read from the goal outwards
+                    return forward.path(meeting) + backward.path(meeting)[::-1], sum(expanded), stats()
+
+        return None, sum(expanded), stats()
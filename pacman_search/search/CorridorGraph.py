@@ -0,0 +1,226 @@
+# search/CorridorGraph.py
+"""
+Corridor-compressed graph of a grid maze.
+This module contains the CorridorGraph class, which reduces a GridGraph to its junctions
+(cells with 1, 3 or 4 open neighbours) and the corridors between them, each corridor becoming
+one edge weighted by the tile costs along it (its length on an unweighted grid); the CorridorProblem class, a SearchProblem on that reduced
+graph for one start and goal cell; and the CorridorSearch class, which runs any search
+algorithm on the reduced graph and expands the corridors back into per-tile actions.
+Classes:
+    CorridorGraph: Junctions and corridors of a GridGraph.
+    CorridorProblem: Search problem over the junctions, with the start and goal cells added as extra states.
+    CorridorSearch: A SearchAlgorithm wrapping another one to search the reduced graph of problem.maze.
+Methods:
+    CorridorGraph.is_junction(cell): True if the cell is a node of the reduced graph.
+    CorridorProblem.expand(actions): Joins the corridor actions of a reduced path into per-tile actions.
+"""
+
+from array import array
+from .Search import SearchProblem, SearchAlgorithm
+
+OPPOSITE = {'UP': 'DOWN', 'DOWN': 'UP', 'LEFT': 'RIGHT', 'RIGHT': 'LEFT'}
+COST_AWARE = ("UCS", "AStar") # Algorithms that return the cheapest path on weighted edges
+
+
+class CorridorGraph:
+    """
+    The junctions of a GridGraph and the corridors joining them.
+    A corridor is a run of open cells with exactly two open neighbours; it is walked once and
+    stored as one edge in each direction, carrying the per-tile actions so paths can be expanded.
+    Attributes:
+        graph (GridGraph): The full grid graph.
+        version: The maze version of the grid graph.
+        nodes (array): Cell id of each junction.
+        node_index (array): Junction index of each cell, -1 for corridor and wall cells.
+        edges (list): For each junction, a list of (action tuple, junction index, length).
+        corridors (list): (from junction, to junction, action tuple, cost) of each corridor, walked from its first end.
+        corridor_index (array), corridor_offset (array): Corridor of each corridor cell and its
+            position along it (the cell is reached after corridor_offset + 1 actions).
+        corridor_cost (array): Cost of walking from the first end of its corridor onto each corridor cell.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.version = graph.version
+        size = len(graph)
+        offsets, walls = graph.offsets, graph.walls
+
+        self.node_index = array('i', [-1]) * size
+        self.nodes = array('i')
+        self.edges = []
+        self.corridors = []
+        self.corridor_index = array('i', [-1]) * size
+        self.corridor_offset = array('i', [0]) * size
+        self.corridor_cost = array('i', [0]) * size
+
+        for cell in range(size):
+            if not walls[cell] and offsets[cell + 1] - offsets[cell] != 2:
+                self._add_node(cell)
+        for node in range(len(self.nodes)):
+            self._walk_corridors(node)
+
+        for cell in range(size): # Loops with no junction on them get one so they are reachable too
+            if not walls[cell] and self.node_index[cell] < 0 and self.corridor_index[cell] < 0:
+                self._walk_corridors(self._add_node(cell))
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def _add_node(self, cell):
+        self.node_index[cell] = len(self.nodes)
+        self.nodes.append(cell)
+        self.edges.append([])
+        return self.node_index[cell]
+
+    def _walk_corridors(self, node):
+        successors, node_index, costs = self.graph.successors, self.node_index, self.graph.costs
+        start = self.nodes[node]
+        for action, cell, cost in successors(start):
+            if node_index[cell] >= 0: # Two junctions side by side
+                self.edges[node].append(((action,), node_index[cell], cost))
+                continue
+            if self.corridor_index[cell] >= 0: # Already walked from its other end
+                continue
+
+            corridor = len(self.corridors)
+            actions = [action]
+            previous = start
+            total = cost
+            while node_index[cell] < 0:
+                self.corridor_index[cell] = corridor
+                self.corridor_offset[cell] = len(actions) - 1
+                self.corridor_cost[cell] = total
+                for next_action, next_cell, cost in successors(cell):
+                    if next_cell != previous:
+                        break
+                actions.append(next_action)
+                total += cost
+                previous, cell = cell, next_cell
+
+            end = node_index[cell]
+            actions = tuple(actions)
+            self.corridors.append((node, end, actions, total))
+            self.edges[node].append((actions, end, total))
+            if end != node: # Walked back, the end's cost is not paid and the start's is
+                back = total - costs[cell] + costs[start]
+                self.edges[end].append((tuple(OPPOSITE[action] for action in reversed(actions)), node, back))
+
+    def is_junction(self, cell):
+        return self.node_index[cell] >= 0
+
+
+class CorridorProblem(SearchProblem):
+    """
+    Search problem over the junctions of a CorridorGraph, from a start cell to a goal cell.
+    States are junction indices; a start or goal cell that is not a junction gets its own state
+    (len(corridors) and len(corridors) + 1), joined to the junctions at the ends of its corridor.
+    Each action is the tuple of per-tile actions of one corridor, and its cost is the sum of the
+    tile costs stepped onto.
+    """
+
+    def __init__(self, corridors, start, goal):
+        self.corridors = corridors
+        self.graph = corridors.graph
+        self.start = start # Cell ids
+        self.goal = goal
+        count = len(corridors)
+        self.start_state = corridors.node_index[start] if corridors.is_junction(start) else count
+        self.goal_state = corridors.node_index[goal] if corridors.is_junction(goal) else count + 1
+        self.goal_row, self.goal_col = self.graph.position(goal)
+
+        # Junctions at the ends of the goal's corridor get an extra edge that stops at the goal
+        self.goal_edges = {}
+        corridor = corridors.corridor_index[goal]
+        if self.goal_state == count + 1 and corridor >= 0:
+            first, last, actions, total = corridors.corridors[corridor]
+            offset = corridors.corridor_offset[goal] + 1
+            reached = corridors.corridor_cost[goal]
+            self.goal_edges.setdefault(first, []).append((actions[:offset], self.goal_state, reached))
+            back = tuple(OPPOSITE[action] for action in reversed(actions[offset:]))
+            # From the last end: every corridor cell from the goal on, without the last end itself
+            back_cost = total - self.graph.costs[corridors.nodes[last]] - reached + self.graph.costs[goal]
+            self.goal_edges.setdefault(last, []).append((back, self.goal_state, back_cost))
+
+    def get_initial_state(self):
+        return self.start_state
+
+    def goal_test(self, state):
+        return state == self.goal_state
+
+    def get_successors(self, state):
+        if state < len(self.corridors):
+            edges = self.corridors.edges[state]
+            extra = self.goal_edges.get(state)
+            return edges + extra if extra else edges
+        if state == self.start_state:
+            return self._start_successors()
+        return ()
+
+    def _start_successors(self): # Walk out of the start cell until a junction or the goal
+        successors = []
+        for action, cell, cost in self.graph.successors(self.start):
+            if self._stops(cell):
+                successors.append(((action,), self._state(cell), cost))
+            elif self.graph.is_wall(self.start): # Stepping off a wall lands mid-corridor, both ways are open
+                for next_action, next_cell, next_cost in self.graph.successors(cell):
+                    successors.append(self._walk(cell, next_cell, [action, next_action], cost + next_cost))
+            else:
+                successors.append(self._walk(self.start, cell, [action], cost))
+        return successors
+
+    def _walk(self, previous, cell, actions, total):
+        while not self._stops(cell):
+            for next_action, next_cell, cost in self.graph.successors(cell):
+                if next_cell != previous:
+                    break
+            actions.append(next_action)
+            total += cost
+            previous, cell = cell, next_cell
+        return (tuple(actions), self._state(cell), total)
+
+    def _stops(self, cell):
+        return cell == self.goal or self.corridors.is_junction(cell)
+
+    def _state(self, cell):
+        return self.goal_state if cell == self.goal else self.corridors.node_index[cell]
+
+    def heuristic(self, state):
+        if state < len(self.corridors):
+            cell = self.corridors.nodes[state]
+        elif state == self.start_state:
+            cell = self.start
+        else:
+            return 0
+        row, col = self.graph.position(cell)
+        return abs(row - self.goal_row) + abs(col - self.goal_col)
+
+    def expand(self, actions):
+        return [step for corridor in actions for step in corridor]
+
+
+class CorridorSearch(SearchAlgorithm):
+    """
+    Runs another search algorithm on the corridor graph of problem.maze instead of its cells.
+    The problem must expose the maze as problem.maze and the start and goal cells as
+    problem.start and problem.goal, like ChasePacmanProblem. nodes_expanded counts junctions.
+    Only the algorithms that compare path costs (UCS, AStar) stay optimal: corridors have
+    different lengths, so BFS and DFS find the path with the fewest corridors instead.
+    """
+
+    def __init__(self, algorithm, instrumentation = None):
+        super().__init__(instrumentation)
+        self.algorithm = algorithm
+        self.optimal = algorithm.optimal and algorithm.name in COST_AWARE
+
+    @property
+    def name(self):
+        return f"Corridor{self.algorithm.name}"
+
+    def _search(self, problem):
+        if problem.start == problem.goal:
+            return [], 0
+        corridors = problem.maze.corridor_graph
+        graph = corridors.graph
+        reduced = CorridorProblem(corridors, graph.cell_id(problem.start), graph.cell_id(problem.goal))
+        actions, nodes_expanded, *stats = self.algorithm._search(reduced)
+        return (reduced.expand(actions) if actions is not None else None), nodes_expanded, *stats
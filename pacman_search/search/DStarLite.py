@@ -0,0 +1,296 @@
+# search/DStarLite.py
+"""
+Incremental replanning for chasing a moving target.
+This module contains the DStarLite class, a SearchAlgorithm that keeps its search state
+between calls and repairs it instead of searching from scratch (Moving Target D* Lite).
+The search runs forward from the chaser, so:
+    - when the target moves, only the heuristic changes and the km key offset absorbs it;
+    - when the chaser steps along its previous path, the part of the search tree below its new
+      cell is kept as is and only the rest is dropped, instead of re-rooting the whole search;
+    - when cells become walls or paths or their tile cost changes, only the cells whose incoming
+      edges changed are updated.
+Classes:
+    DStarLite: Incremental replanning on a ChasePacmanProblem built with encoded=True.
+Methods:
+    search(problem):
+        Repairs the previous search for the new start, goal and maze, and returns the path.
+    reset():
+        Forgets the search state, the next search starts from scratch.
+The repair can be run a slice at a time by a SlicedSearch: the search state lives in the instance
+and is consistent between any two expansions, so a repair cut short by cancel() is simply
+continued by the next search.
+"""
+
+import heapq
+import math
+from array import array
+from .Search import SearchAlgorithm, run_steps
+from .GridGraph import ACTIONS
+
+INF = float('inf')
+NO_PARENT = -1
+CHUNK = 4096 # Bytes compared at once when looking for changed cells
+
+
+class DStarLite(SearchAlgorithm):
+    """
+    Moving Target D* Lite on the integer grid graph of a maze.
+    The problem must be an encoded ChasePacmanProblem: states are cell ids of problem.graph,
+    problem.start_state and problem.goal_state are the ghost and Pac-Man cells.
+    One instance keeps the search of one chaser, so every ghost needs its own.
+    The g values of the kept tree are distances from the first start of the search; they are
+    off by the same constant for every cell, which does not change the order of the keys.
+    Attributes:
+        g (array), rhs (array): The distance estimates from the search root, per cell.
+        parents (array): The best predecessor of each cell, NO_PARENT outside the search tree.
+        km (float): The key offset accumulated from the moves of the goal.
+        searches (int): Number of searches since the last reset.
+        restarts (int): Number of searches that could not reuse the previous one.
+    """
+
+    optimal = True
+
+    def __init__(self, instrumentation = None):
+        super().__init__(instrumentation)
+        self.reset()
+
+    def reset(self):
+        self.graph = None
+        self.searches = 0
+        self.restarts = 0
+
+    def _search(self, problem):
+        return run_steps(self._search_steps(problem))
+
+    def _search_steps(self, problem, pause = math.inf):
+        graph = problem.graph
+        start, goal = problem.start_state, problem.goal_state
+        self.expanded = 0
+
+        if self.graph is None or len(graph) != len(self.graph) or graph.cols != self.graph.cols:
+            self._allocate(graph)
+            self._restart(start, goal)
+        else:
+            changed = []
+            if graph is not self.graph: # The maze changed, find the cells whose incoming edges changed
+                changed = sorted(set(self._changed_cells(self.graph.walls, graph.walls))
+                                 .union(self._changed_cells(self.graph.costs, graph.costs)))
+                self.graph = graph
+
+            if start != self.start:
+                if self._in_subtree(start):
+                    self._move_start(start)
+                else: # Not a step along the previous path (e.g. a respawn), nothing to keep
+                    self._restart(start, goal)
+                    changed = []
+
+            if goal != self.goal: # Keys computed for the old goal stay lower bounds once km grows
+                self.km += self._distance(self.goal, goal)
+                self.goal = goal
+
+            for cell in changed:
+                if cell != self.start:
+                    self._recompute_rhs(cell)
+                    self._update_state(cell)
+
+        self.searches += 1
+        yield from self._compute_shortest_path(pause)
+        return self._extract_path(), self.expanded
+
+    def _allocate(self, graph):
+        size = len(graph)
+        self.graph = graph
+        self.g = array('d', [INF]) * size
+        self.rhs = array('d', [INF]) * size
+        self.parents = array('i', [NO_PARENT]) * size
+        self.tree = set() # Cells with a finite g or rhs, so clearing never scans the whole grid
+        self.heap = []
+        self.queued = {} # cell -> its current key, entries of the heap that disagree are stale
+
+    def _restart(self, start, goal):
+        g, rhs, parents = self.g, self.rhs, self.parents
+        for cell in self.tree:
+            g[cell] = rhs[cell] = INF
+            parents[cell] = NO_PARENT
+        self.tree.clear()
+        self.heap.clear()
+        self.queued.clear()
+        self.start = start
+        self.goal = goal
+        self.km = 0
+        self.restarts += 1
+        rhs[start] = 0
+        self.tree.add(start)
+        self._update_state(start)
+
+    def _distance(self, a, b): # Manhattan distance between two cells, admissible as every step costs at least 1
+        cols = self.graph.cols
+        a_row, a_col = divmod(a, cols)
+        b_row, b_col = divmod(b, cols)
+        return abs(a_row - b_row) + abs(a_col - b_col)
+
+    def _key(self, cell):
+        m = min(self.g[cell], self.rhs[cell])
+        return (m + self._distance(cell, self.goal) + self.km, m)
+
+    def _predecessors(self, cell): # Cells with an edge into cell: every in-bounds neighbour of an open cell
+        graph = self.graph
+        if graph.walls[cell]:
+            return ()
+        cols, size = graph.cols, len(graph)
+        col = cell % cols
+        predecessors = []
+        if cell >= cols:
+            predecessors.append(cell - cols)
+        if cell + cols < size:
+            predecessors.append(cell + cols)
+        if col > 0:
+            predecessors.append(cell - 1)
+        if col < cols - 1:
+            predecessors.append(cell + 1)
+        return predecessors
+
+    def _recompute_rhs(self, cell):
+        g, cost = self.g, self.graph.costs[cell] # Every edge into a cell costs its entry cost
+        best, parent = INF, NO_PARENT
+        for predecessor in self._predecessors(cell):
+            if g[predecessor] + cost < best:
+                best, parent = g[predecessor] + cost, predecessor
+        self.rhs[cell] = best
+        self.parents[cell] = parent
+        if best != INF:
+            self.tree.add(cell)
+
+    def _update_state(self, cell):
+        if self.g[cell] != self.rhs[cell]:
+            key = self._key(cell)
+            if self.queued.get(cell) != key:
+                self._push(cell, key)
+        else:
+            self.queued.pop(cell, None)
+
+    def _push(self, cell, key):
+        self.queued[cell] = key
+        heapq.heappush(self.heap, (key[0], key[1], cell))
+        if len(self.heap) > 4 * len(self.queued) + 1024: # Drop stale entries now and then
+            self.heap = [(key[0], key[1], cell) for cell, key in self.queued.items()]
+            heapq.heapify(self.heap)
+
+    def _top(self): # Smallest live entry of the heap, discarding stale ones
+        heap, queued = self.heap, self.queued
+        while heap:
+            k1, k2, cell = heap[0]
+            if queued.get(cell) == (k1, k2):
+                return cell, (k1, k2)
+            heapq.heappop(heap)
+        return None, (INF, INF)
+
+    def _compute_shortest_path(self, pause): # A generator pausing like _search_steps
+        g, rhs, parents, tree = self.g, self.rhs, self.parents, self.tree
+        successors = self.graph.successors
+        while True:
+            if self.expanded >= pause: # this slice is used up, wait for the next one
+                pause = yield self.expanded
+            cell, top_key = self._top()
+            goal = self.goal
+            if cell is None or (top_key >= self._key(goal) and rhs[goal] <= g[goal]):
+                return
+
+            new_key = self._key(cell)
+            if top_key < new_key: # Key is out of date after km changed, requeue it
+                self._push(cell, new_key)
+                continue
+
+            self.expanded += 1
+            if g[cell] > rhs[cell]: # Overconsistent: settle it and relax its successors
+                g[cell] = rhs[cell]
+                del self.queued[cell]
+                for action, successor, step_cost in successors(cell):
+                    cost = g[cell] + step_cost
+                    if successor != self.start and cost < rhs[successor]:
+                        rhs[successor] = cost
+                        parents[successor] = cell
+                        tree.add(successor)
+                        self._update_state(successor)
+            else: # Underconsistent: raise it and re-derive every cell that hung from it
+                g[cell] = INF
+                for action, successor, step_cost in successors(cell):
+                    if successor != self.start and parents[successor] == cell:
+                        self._recompute_rhs(successor)
+                        self._update_state(successor)
+                self._update_state(cell)
+
+    def _in_subtree(self, cell): # True if the path from the root to cell runs through the current start
+        g, parents = self.g, self.parents
+        if g[cell] == INF or g[cell] != self.rhs[cell]:
+            return False
+        for _ in range(len(self.graph)):
+            if cell == self.start:
+                return True
+            cell = parents[cell]
+            if cell == NO_PARENT:
+                return False
+        return False
+
+    def _move_start(self, start):
+        # Cells below the new start keep their g values; everything else is dropped from the tree
+        g, rhs, parents, queued = self.g, self.rhs, self.parents, self.queued
+        self.start = start
+        parents[start] = NO_PARENT
+        kept = {start: True}
+        deleted = []
+        limit = len(self.tree)
+        for cell in self.tree:
+            chain = []
+            while cell not in kept:
+                chain.append(cell)
+                cell = parents[cell]
+                if cell == NO_PARENT or len(chain) > limit: # Detached, or a cycle left by a raise
+                    cell = NO_PARENT
+                    break
+            keep = cell != NO_PARENT and kept[cell]
+            for link in chain:
+                kept[link] = keep
+                if not keep:
+                    deleted.append(link)
+
+        for cell in deleted:
+            g[cell] = rhs[cell] = INF
+            parents[cell] = NO_PARENT
+            queued.pop(cell, None)
+        self.tree = {cell for cell, keep in kept.items() if keep}
+
+        for cell in deleted: # The border of the kept tree goes back on the queue
+            self._recompute_rhs(cell)
+            if rhs[cell] != INF:
+                self._update_state(cell)
+
+    def _extract_path(self): # Follow the parents back from the goal to the start
+        cell, start = self.goal, self.start
+        if cell != start and self.rhs[cell] == INF:
+            return None
+
+        cols, parents = self.graph.cols, self.parents
+        actions = []
+        for _ in range(len(self.graph)):
+            if cell == start:
+                actions.reverse()
+                return actions
+            parent = parents[cell]
+            if parent == NO_PARENT:
+                return None
+            step = cell - parent
+            actions.append(ACTIONS[0 if step == -cols else 1 if step == cols else 2 if step == -1 else 3])
+            cell = parent
+        return None
+
+    def _changed_cells(self, old_walls, new_walls): # Cells whose wall flag (or cost) differs between two graphs
+        changed = []
+        for offset in range(0, len(new_walls), CHUNK):
+            end = offset + CHUNK
+            if old_walls[offset:end] != new_walls[offset:end]:
+                changed.extend(
+                    cell for cell in range(offset, min(end, len(new_walls)))
+                    if old_walls[cell] != new_walls[cell]
+                )
+        return changed
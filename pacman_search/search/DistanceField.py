@@ -0,0 +1,143 @@
+# search/DistanceField.py
+"""
+Shared distance field for several chasers with the same target.
+This module contains the DistanceField class, which runs one reverse BFS from a target cell over
+the integer grid graph of a maze and stores the distance of every reached cell to it. Every chaser
+then reads its next move from the field, so N ghosts chasing Pac-Man cost one search per tick
+instead of N. A source on a wall, such as Pac-Man standing on its spawn tile in some mazes, is
+treated as one step beyond its neighbours, so chasers close in on it even though they cannot enter
+it. On a graph with a weighted cost layer the reverse search is a Dijkstra search and the
+distances are path costs.
+Classes:
+    DistanceField: Distances to one source cell, recomputed in place for each new source.
+Methods:
+    compute(graph, source, targets):
+        Fills the field for a new source, stopping early once every target cell is reached.
+    distance(cell):
+        Returns the distance from a cell to the source, or None if it was not reached.
+    next_action(cell):
+        Returns the first action of a shortest (cheapest) path from a cell to the source.
+"""
+
+import heapq
+import time
+from array import array
+from collections import deque
+
+
+class DistanceField:
+    """
+    Distances from every cell to a source cell of a GridGraph, from a single BFS (Dijkstra on a
+    weighted graph) over the reversed edges. The arrays are reused between computations; a cell only counts as
+    reached if its stamp matches the current generation, so nothing is cleared per tick.
+    Attributes:
+        graph (GridGraph): The graph of the last computation.
+        source (int): The cell id the distances are measured to.
+        search_time (float): Seconds spent in compute() so far.
+        searches (int): Number of computations so far.
+        nodes_expanded (int): Number of cells expanded by all computations so far.
+    """
+
+    def __init__(self):
+        self.graph = None
+        self.source = None
+        self.generation = 0
+        self.distances = array('i')
+        self.stamps = array('I')
+        self.search_time = 0.0
+        self.searches = 0
+        self.nodes_expanded = 0
+
+    def compute(self, graph, source, targets = ()):
+        start_time = time.perf_counter()
+        size = len(graph)
+        if len(self.stamps) != size:
+            self.distances = array('i', [0]) * size
+            self.stamps = array('I', [0]) * size
+            self.generation = 0
+        self.generation += 1
+        if self.generation > 0xFFFFFFFF: # Stamps would wrap around, start over
+            self.stamps = array('I', [0]) * size
+            self.generation = 1
+        self.graph = graph
+        self.source = source
+
+        remaining = set(targets)
+        remaining.discard(source)
+        self.distances[source] = 0
+        self.stamps[source] = self.generation
+        if graph.weighted:
+            expanded = self._dijkstra(graph, source, remaining, bool(targets))
+        else:
+            expanded = self._bfs(graph, source, remaining, bool(targets))
+
+        self.searches += 1
+        self.nodes_expanded += expanded
+        self.search_time += time.perf_counter() - start_time
+
+    def _bfs(self, graph, source, remaining, targeted):
+        distances, stamps, generation = self.distances, self.stamps, self.generation
+        walls, cols, size = graph.walls, graph.cols, len(graph)
+        frontier = deque([source])
+        expanded = 0
+        while frontier and (remaining or not targeted):
+            cell = frontier.popleft()
+            expanded += 1
+            if walls[cell] and cell != source: # Nothing can step onto a wall, so it has no predecessors
+                continue
+            step = distances[cell] + 1
+            col = cell % cols
+            for other in (
+                cell - cols if cell >= cols else -1,
+                cell + cols if cell + cols < size else -1,
+                cell - 1 if col > 0 else -1,
+                cell + 1 if col < cols - 1 else -1,
+            ):
+                if other >= 0 and stamps[other] != generation:
+                    stamps[other] = generation
+                    distances[other] = step
+                    frontier.append(other)
+                    remaining.discard(other)
+        return expanded
+
+    def _dijkstra(self, graph, source, remaining, targeted):
+        distances, stamps, generation = self.distances, self.stamps, self.generation
+        walls, costs, cols, size = graph.walls, graph.costs, graph.cols, len(graph)
+        frontier = [(0, source)]
+        expanded = 0
+        while frontier and (remaining or not targeted):
+            distance, cell = heapq.heappop(frontier)
+            if distance > distances[cell]: # Stale entry, the cell was settled cheaper
+                continue
+            expanded += 1
+            remaining.discard(cell) # A target is final once settled, not when first reached
+            if walls[cell] and cell != source:
+                continue
+            step = distance + costs[cell] # Stepping from a neighbour onto cell costs cell's cost
+            col = cell % cols
+            for other in (
+                cell - cols if cell >= cols else -1,
+                cell + cols if cell + cols < size else -1,
+                cell - 1 if col > 0 else -1,
+                cell + 1 if col < cols - 1 else -1,
+            ):
+                if other >= 0 and (stamps[other] != generation or step < distances[other]):
+                    stamps[other] = generation
+                    distances[other] = step
+                    heapq.heappush(frontier, (step, other))
+        return expanded
+
+    def distance(self, cell): # Distance to the source, or None if the cell was not reached
+        if self.graph is None or self.stamps[cell] != self.generation:
+            return None
+        return self.distances[cell]
+
+    def next_action(self, cell): # Step to a neighbour on a shortest path to the source, or None
+        distance = self.distance(cell)
+        if not distance: # Unreached, or already on the source
+            return None
+        distances, stamps, generation = self.distances, self.stamps, self.generation
+        for action, successor, cost in self.graph.successors(cell):
+            if stamps[successor] == generation and distances[successor] == distance - cost:
+                return action
+        return None
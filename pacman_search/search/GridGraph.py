@@ -0,0 +1,181 @@
+# search/GridGraph.py
+"""
+Compiled integer graph of a grid maze.
+This module contains the GridGraph class, which numbers every cell of a grid as
+row * cols + col and stores the open neighbours of each cell once, CSR style:
+the neighbours of cell c are targets[offsets[c]:offsets[c + 1]], reached with the
+actions in action_codes at the same indices. A step costs the entry cost of the cell
+stepped onto, from an optional per-tile cost layer (1 everywhere by default); the costs
+are baked into the successor tuples, so searches pay nothing extra to read them.
+The tuples are cached per cell on grids of up to CACHE_LIMIT cells; on larger grids, where one
+Python tuple per cell would dwarf the CSR arrays, they are built from the arrays on every call.
+Classes:
+    GridGraph: The CSR adjacency of a grid of 0 (path) and 1 (wall).
+Functions:
+    cost_layer(costs, rows, cols): Flattens per-tile costs (rows of ints, or one flat sequence) into a bytearray.
+Methods:
+    GridGraph.from_buffers(rows, cols, walls, costs, offsets, targets, action_codes, weighted):
+        Wraps arrays compiled earlier, e.g. memory-mapped from a map cache, without rebuilding them.
+    cell_id(pos): Returns the id of a (row, col) position.
+    position(cell): Returns the (row, col) position of a cell id.
+    successors(cell): Returns the (action, cell, cost) successors of a cell, built once per cell up to CACHE_LIMIT cells.
+    position_successors(cell): Returns the same successors with (row, col) positions.
+    predecessors(cell), position_predecessors(cell): Return the (action, cell, cost) edges into a cell,
+        where action is the move made from that neighbour.
+"""
+
+from array import array
+
+ACTIONS = ('UP', 'DOWN', 'LEFT', 'RIGHT')
+MOVES = ((-1, 0), (1, 0), (0, -1), (0, 1))
+CACHE_LIMIT = 256 * 256 # Cells up to which successor and predecessor tuples are cached
+
+
+def cost_layer(costs, rows, cols):
+    layer = bytearray(value for line in costs for value in line) if costs and not isinstance(costs[0], int) \
+        else bytearray(costs)
+    if len(layer) != rows * cols:
+        raise ValueError(f"Cost layer has {len(layer)} tiles, the grid has {rows * cols}")
+    if 0 in layer:
+        raise ValueError("Tile costs must be at least 1, so the Manhattan heuristic stays admissible")
+    return layer
+
+
+class GridGraph:
+    """
+    CSR adjacency of a grid. Every cell, wall or not, has edges to its open in-bounds
+    neighbours, which matches Maze.get_neighbours: an entity standing on a wall can step off it.
+    Attributes:
+        rows (int), cols (int): The size of the grid.
+        version: The maze version the graph was compiled for.
+        walls (bytearray): 1 for every wall cell, indexed by cell id.
+        offsets (array): Start of each cell's neighbours in targets, with one extra entry at the end.
+        targets (array): Neighbour cell ids.
+        action_codes (bytearray): Index into ACTIONS of the move to each neighbour.
+        costs (bytearray): The cost of stepping onto each cell, 1 to 255.
+        weighted (bool): True if any open cell costs more than 1.
+    """
+
+    def __init__(self, grid, version = 0, costs = None):
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if self.rows else 0
+        self.version = version
+        rows, cols = self.rows, self.cols
+        size = rows * cols
+
+        self.walls = bytearray(size)
+        for row in range(rows):
+            line = grid[row]
+            for col in range(cols):
+                if line[col] != 0:
+                    self.walls[row * cols + col] = 1
+
+        self.costs = cost_layer(costs, rows, cols) if costs is not None else bytearray([1]) * size
+        self.weighted = any(cost > 1 for cost, wall in zip(self.costs, self.walls) if not wall)
+
+        self.offsets = array('i', [0]) * (size + 1)
+        self.targets = array('i')
+        self.action_codes = bytearray()
+        walls, targets, action_codes = self.walls, self.targets, self.action_codes
+        for cell in range(size):
+            row, col = divmod(cell, cols)
+            if row > 0 and not walls[cell - cols]:
+                targets.append(cell - cols)
+                action_codes.append(0)
+            if row < rows - 1 and not walls[cell + cols]:
+                targets.append(cell + cols)
+                action_codes.append(1)
+            if col > 0 and not walls[cell - 1]:
+                targets.append(cell - 1)
+                action_codes.append(2)
+            if col < cols - 1 and not walls[cell + 1]:
+                targets.append(cell + 1)
+                action_codes.append(3)
+            self.offsets[cell + 1] = len(targets)
+
+        self._reset_successors()
+
+    @classmethod
+    def from_buffers(cls, rows, cols, walls, costs, offsets, targets, action_codes, weighted, version = 0):
+        graph = cls.__new__(cls)
+        graph.rows, graph.cols, graph.version = rows, cols, version
+        graph.walls, graph.costs = walls, costs
+        graph.offsets, graph.targets, graph.action_codes = offsets, targets, action_codes
+        graph.weighted = weighted
+        graph._reset_successors()
+        return graph
+
+    def _reset_successors(self):
+        # Successor tuples are built on first use and then shared by every search, on grids small enough
+        size = self.rows * self.cols
+        if size > CACHE_LIMIT:
+            self._successors = self._position_successors = self._predecessors = self._position_predecessors = None
+            return
+        self._successors = [None] * size
+        self._position_successors = [None] * size
+        self._predecessors = [None] * size
+        self._position_predecessors = [None] * size
+
+    def __len__(self):
+        return self.rows * self.cols
+
+    def cell_id(self, pos):
+        return pos[0] * self.cols + pos[1]
+
+    def position(self, cell):
+        return divmod(cell, self.cols)
+
+    def is_wall(self, cell):
+        return self.walls[cell] == 1
+
+    def successors(self, cell): # (action, cell, cost) for each open neighbour
+        cache = self._successors
+        successors = cache[cell] if cache is not None else None
+        if successors is None:
+            start, end, costs = self.offsets[cell], self.offsets[cell + 1], self.costs
+            successors = tuple(
+                (ACTIONS[code], target, costs[target])
+                for code, target in zip(self.action_codes[start:end], self.targets[start:end])
+            )
+            if cache is not None:
+                cache[cell] = successors
+        return successors
+
+    def position_successors(self, cell): # (action, (row, col), cost) for each open neighbour
+        cache = self._position_successors
+        successors = cache[cell] if cache is not None else None
+        if successors is None:
+            successors = tuple(
+                (action, divmod(target, self.cols), cost) for action, target, cost in self.successors(cell)
+            )
+            if cache is not None:
+                cache[cell] = successors
+        return successors
+
+    def predecessors(self, cell): # (action, neighbour, cost) for each neighbour that can step into cell
+        cache = self._predecessors
+        predecessors = cache[cell] if cache is not None else None
+        if predecessors is None:
+            predecessors = []
+            if not self.walls[cell]: # Every in-bounds neighbour, wall or not, can step onto an open cell
+                cost = self.costs[cell]
+                row, col = divmod(cell, self.cols)
+                for code, (d_row, d_col) in enumerate(MOVES):
+                    r, c = row - d_row, col - d_col # The neighbour that reaches cell with this move
+                    if 0 <= r < self.rows and 0 <= c < self.cols:
+                        predecessors.append((ACTIONS[code], r * self.cols + c, cost))
+            predecessors = tuple(predecessors)
+            if cache is not None:
+                cache[cell] = predecessors
+        return predecessors
+
+    def position_predecessors(self, cell): # The same edges with (row, col) positions
+        cache = self._position_predecessors
+        predecessors = cache[cell] if cache is not None else None
+        if predecessors is None:
+            predecessors = tuple(
+                (action, divmod(source, self.cols), cost) for action, source, cost in self.predecessors(cell)
+            )
+            if cache is not None:
+                cache[cell] = predecessors
+        return predecessors
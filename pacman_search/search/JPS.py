@@ -0,0 +1,147 @@
+# search/JPS.py
+"""
+Jump Point Search (JPS) implementation for 4-connected grids.
+This module contains the JPS class, an A* over jump points: instead of pushing every
+neighbour of a tile, it scans along straight lines and only stops where the path may have
+to turn (the goal, or a tile next to an obstacle that opens a new direction). All the
+symmetric paths through open areas are skipped, and the straight segments between jump
+points are expanded back into per-tile actions at the end.
+Classes:
+    JPS: Implements Jump Point Search on the grid graph of problem.maze.
+Methods:
+    search(problem):
+        Performs Jump Point Search on the given problem.
+        Args:
+            problem: A ChasePacmanProblem, or any problem exposing maze, start and goal.
+        Returns:
+            A SearchResult with the same per-tile actions as an A* path,
+            the search time, memory usage, and the number of jump points expanded.
+"""
+
+
+from .Search import SearchAlgorithm
+from .utils import PriorityQueue, DictSearchTree
+from .GridGraph import ACTIONS, MOVES
+
+UP, DOWN, LEFT, RIGHT = range(4) # Indices into ACTIONS and MOVES
+PRUNED = ( # Directions worth scanning from a jump point, by the direction it was reached in
+    (UP, LEFT, RIGHT),
+    (DOWN, LEFT, RIGHT),
+    (LEFT, UP, DOWN),
+    (RIGHT, UP, DOWN),
+)
+
+class JPS(SearchAlgorithm):
+    """
+    Jump Point Search on a 4-connected grid with unit step costs; a weighted grid raises ValueError.
+    Vertical scans also look sideways at every tile, so paths are canonical: vertical
+    segments first, turning to horizontal ones at jump points.
+    Methods
+    -------
+    search(problem)
+        Executes Jump Point Search on the given problem.
+    """
+
+    optimal = True
+
+    def __init__(self, instrumentation = None):
+        super().__init__(instrumentation)
+        self.graph = None
+
+    def _search(self, problem):
+        graph = problem.maze.graph
+        if graph.weighted:
+            raise ValueError("JPS needs unit step costs, the maze has a weighted cost layer")
+        self._prepare(graph)
+        start, goal = graph.cell_id(problem.start), graph.cell_id(problem.goal)
+        goal_row, goal_col = problem.goal
+        self.goal = self._padded(goal)
+        nodes_expanded = 0
+
+        tree = DictSearchTree() # Jump points only, the action of each is (direction, segment length)
+        tree.add_root(start)
+        if start == goal:
+            return [], nodes_expanded
+
+        def heuristic(cell):
+            row, col = divmod(cell, graph.cols)
+            return abs(row - goal_row) + abs(col - goal_col)
+
+        frontier = PriorityQueue()
+        frontier.push(start, heuristic(start))
+        closed = set()
+        while not frontier.is_empty():
+            cell = frontier.pop()
+            if cell in closed: # An older, costlier entry for a jump point already expanded
+                continue
+            closed.add(cell)
+            nodes_expanded += 1
+
+            if cell == goal:
+                return self._expand(tree.path(cell)), nodes_expanded
+
+            parent, action, path_cost = tree.entries[cell]
+            directions = range(4) if action is None else PRUNED[action[0]]
+            padded = self._padded(cell)
+            for direction in directions:
+                jump_point, length = self._jump(padded, self.steps[direction])
+                if jump_point < 0:
+                    continue
+                jump_point = self._unpadded(jump_point)
+                child_cost = path_cost + length
+                if child_cost < tree.cost(jump_point):
+                    tree.add(jump_point, cell, (direction, length), child_cost)
+                    frontier.push(jump_point, child_cost + heuristic(jump_point))
+
+        return None, nodes_expanded
+
+    def _prepare(self, graph):
+        # The walls with a one-cell blocked border, so scans never check bounds; built once per graph
+        if self.graph is graph:
+            return
+        self.graph = graph
+        self.width = width = graph.cols + 2
+        self.blocked = bytearray([1]) * (width * (graph.rows + 2))
+        for row in range(graph.rows):
+            base = row * graph.cols
+            self.blocked[(row + 1) * width + 1:(row + 1) * width + 1 + graph.cols] = graph.walls[base:base + graph.cols]
+        self.steps = tuple(d_row * width + d_col for d_row, d_col in MOVES)
+
+    def _padded(self, cell):
+        row, col = divmod(cell, self.graph.cols)
+        return (row + 1) * self.width + col + 1
+
+    def _unpadded(self, padded):
+        row, col = divmod(padded, self.width)
+        return (row - 1) * self.graph.cols + col - 1
+
+    def _jump(self, cell, step): # Scan until a jump point (returned with the distance) or a wall (-1)
+        blocked, goal, width = self.blocked, self.goal, self.width
+        length = 0
+        if step == 1 or step == -1: # Horizontal: a wall behind above or below that ends here opens a new way
+            while True:
+                cell += step
+                length += 1
+                if blocked[cell]:
+                    return -1, 0
+                if cell == goal:
+                    return cell, length
+                if (not blocked[cell - width] and blocked[cell - width - step]) or \
+                   (not blocked[cell + width] and blocked[cell + width - step]):
+                    return cell, length
+
+        while True: # Vertical: the same to the sides, and any jump point straight left or right
+            cell += step
+            length += 1
+            if blocked[cell]:
+                return -1, 0
+            if cell == goal:
+                return cell, length
+            if (not blocked[cell - 1] and blocked[cell - 1 - step]) or \
+               (not blocked[cell + 1] and blocked[cell + 1 - step]):
+                return cell, length
+            if self._jump(cell, -1)[0] >= 0 or self._jump(cell, 1)[0] >= 0:
+                return cell, length
+
+    def _expand(self, segments): # (direction, length) segments -> per-tile actions
+        return [ACTIONS[direction] for direction, length in segments for _ in range(length)]
@@ -0,0 +1,147 @@
+# search/Landmarks.py
+"""
+Landmark (ALT) heuristic for grid mazes.
+This module contains the Landmarks class, which picks a few landmark cells of a GridGraph,
+spread as far apart as possible, and stores the exact distances from and to each of them.
+By the triangle inequality, for any landmark L the true distance from v to t is at least
+d(L, t) - d(L, v) and at least d(v, L) - d(t, L); the largest of these bounds (and of the
+Manhattan distance) is an admissible and consistent heuristic that follows the walls,
+so A* expands far fewer states than with the Manhattan distance alone on mazes with long walls.
+Classes:
+    Landmarks: The landmark cells of a grid graph and their distance tables.
+Functions:
+    landmark_heuristic(problem): The ALT heuristic of problem.maze.landmarks for a problem, for AStar(heuristic=...).
+Methods:
+    Landmarks.heuristic(problem): Returns heuristic(state), a lower bound on the cost from state to the goal.
+        The problem must number its states with the cell ids of the graph through state_id(state)
+        and give its goal through get_goal_state(), like ChasePacmanProblem.
+    Landmarks.heuristic_to(goal): Returns heuristic(cell) for cell ids of the graph.
+    Landmarks.bound(cell, goal): The same lower bound between two cell ids.
+"""
+
+import heapq
+from array import array
+from collections import deque
+
+DEFAULT_COUNT = 8 # Landmarks per maze
+UNREACHABLE = -1 # Distance of the cells a landmark cannot reach, or that cannot reach it
+
+
+class Landmarks:
+    """
+    Landmark cells of a GridGraph with exact distance tables, one array('i') per landmark and direction.
+    Landmarks are picked farthest-first: the first is the open cell farthest from an arbitrary one,
+    and each next one is the cell whose nearest landmark is farthest away.
+    On an unweighted grid steps between open cells cost the same both ways, so the distances to a
+    landmark are the distances from it and one table per landmark is kept.
+    Attributes:
+        graph (GridGraph): The graph the tables were computed on.
+        version: The maze version of the graph.
+        cells (array): The landmark cell ids.
+        from_distances (list): For each landmark, the distance from it to every cell.
+        to_distances (list): For each landmark, the distance from every cell to it.
+    """
+
+    def __init__(self, graph, count = DEFAULT_COUNT):
+        self.graph = graph
+        self.version = graph.version
+        self.cells = array('i')
+        self.from_distances = []
+        self.to_distances = []
+
+        first = next((cell for cell in range(len(graph)) if not graph.walls[cell]), None)
+        if first is None:
+            return
+        nearest = self._distances(first, graph.successors) # Distance to the nearest landmark so far
+        for _ in range(count):
+            landmark = max(range(len(nearest)), key = nearest.__getitem__)
+            if nearest[landmark] <= 0 and len(self.cells): # Every reachable cell is already a landmark
+                break
+            distances = self._distances(landmark, graph.successors)
+            self.cells.append(landmark)
+            self.from_distances.append(distances)
+            self.to_distances.append(self._distances(landmark, graph.predecessors) if graph.weighted else distances)
+            for cell in range(len(nearest)):
+                if 0 <= distances[cell] < nearest[cell]:
+                    nearest[cell] = distances[cell]
+
+    def __len__(self):
+        return len(self.cells)
+
+    def _distances(self, source, neighbours):
+        # BFS on unit costs, Dijkstra otherwise; neighbours are successors, or predecessors for distances to source
+        distances = array('i', [UNREACHABLE]) * len(self.graph)
+        distances[source] = 0
+        if not self.graph.weighted:
+            queue = deque([source])
+            while queue:
+                cell = queue.popleft()
+                distance = distances[cell] + 1
+                for action, neighbour, cost in neighbours(cell):
+                    if distances[neighbour] == UNREACHABLE:
+                        distances[neighbour] = distance
+                        queue.append(neighbour)
+            return distances
+
+        heap = [(0, source)]
+        while heap:
+            distance, cell = heapq.heappop(heap)
+            if distance > distances[cell]:
+                continue
+            for action, neighbour, cost in neighbours(cell):
+                if distances[neighbour] == UNREACHABLE or distance + cost < distances[neighbour]:
+                    distances[neighbour] = distance + cost
+                    heapq.heappush(heap, (distance + cost, neighbour))
+        return distances
+
+    def _terms(self, goal): # (from table, d(L, goal), to table, d(goal, L)) of the landmarks that reach the goal
+        return [
+            (from_distances, from_distances[goal], to_distances, to_distances[goal])
+            for from_distances, to_distances in zip(self.from_distances, self.to_distances)
+            if from_distances[goal] != UNREACHABLE and to_distances[goal] != UNREACHABLE
+        ]
+
+    def bound(self, cell, goal):
+        return self.heuristic_to(goal)(cell)
+
+    def heuristic_to(self, goal): # Lower bound on the cost from a cell id to goal
+        terms = self._terms(goal)
+        cols = self.graph.cols
+        goal_row, goal_col = divmod(goal, cols)
+
+        if not self.graph.weighted: # One table per landmark, both bounds are |d(L, goal) - d(L, cell)|
+            tables = [(from_distances, from_goal) for from_distances, from_goal, to_distances, to_goal in terms]
+
+            def heuristic(cell):
+                row, col = divmod(cell, cols)
+                best = abs(row - goal_row) + abs(col - goal_col)
+                for distances, from_goal in tables:
+                    distance = distances[cell]
+                    if distance != UNREACHABLE and abs(from_goal - distance) > best:
+                        best = abs(from_goal - distance)
+                return best
+
+            return heuristic
+
+        def heuristic(cell):
+            row, col = divmod(cell, cols)
+            best = abs(row - goal_row) + abs(col - goal_col)
+            for from_distances, from_goal, to_distances, to_goal in terms:
+                from_cell = from_distances[cell]
+                if from_cell != UNREACHABLE and from_goal - from_cell > best:
+                    best = from_goal - from_cell
+                to_cell = to_distances[cell]
+                if to_cell != UNREACHABLE and to_cell - to_goal > best:
+                    best = to_cell - to_goal
+            return best
+
+        return heuristic
+
+    def heuristic(self, problem):
+        bound = self.heuristic_to(problem.state_id(problem.get_goal_state()))
+        state_id = problem.state_id
+        return lambda state: bound(state_id(state))
+
+
+def landmark_heuristic(problem):
+    return problem.maze.landmarks.heuristic(problem)
@@ -0,0 +1,283 @@
+# search/Oracle.py
+"""
+Precomputed distance oracle for static grid mazes.
+This module contains the DistanceOracle class, which runs one BFS per open cell of a grid
+when a level is loaded and stores the all-pairs shortest-path distances together with a
+next-hop table, and the Oracle class, which answers search problems from that table.
+On a grid with a weighted cost layer each pass is a Dijkstra search instead of a BFS, so the
+distances are path costs and the next hops follow cheapest paths.
+Only grids with up to EAGER_LIMIT (2048) open cells are fully computed on construction. On larger
+grids the all-pairs table would take too long to build and too much memory to keep, so each goal's
+row is computed by the first query towards that goal, and that query costs one BFS pass. Only the
+MAX_LAZY_ROWS most recently queried rows are kept, so a chase across a large maze uses bounded memory.
+A start on a wall is handled like GridGraph handles it: the entity steps off onto the open
+neighbour with the shortest remaining path. Nothing can step onto a wall, so a wall goal is unreachable,
+except from itself: like every search, a query whose start is its goal gets an empty path.
+Classes:
+    DistanceOracle: All-pairs distance and next-hop table for a grid.
+    Oracle: A SearchAlgorithm that reads paths from a maze's DistanceOracle.
+Methods:
+    DistanceOracle.distance(start, goal):
+        Returns the shortest-path distance (the path cost on a weighted grid) between two cells, or None if unreachable.
+    DistanceOracle.next_action(start, goal):
+        Returns the first action of a shortest path from start to goal in O(1).
+    DistanceOracle.path(start, goal):
+        Returns the full list of actions of a shortest path from start to goal.
+    Oracle.search(problem):
+        Reads the path for the problem from the oracle of problem.maze.
+"""
+
+import heapq
+import time
+from array import array
+from collections import OrderedDict, deque
+from .GridGraph import cost_layer
+from .Search import SearchAlgorithm, SearchResult
+
+ACTIONS = ('UP', 'DOWN', 'LEFT', 'RIGHT')
+MOVES = ((-1, 0), (1, 0), (0, -1), (0, 1))
+OPPOSITE = (1, 0, 3, 2) # index of the reverse action for each entry of ACTIONS
+NO_ACTION = 255 # next-hop entry for unreachable cells and for the goal itself
+
+EAGER_LIMIT = 2048 # above this many open cells the rows are computed on first use
+MAX_LAZY_ROWS = 32 # rows kept when they are computed on first use, least recently used dropped first
+
+
+class DistanceOracle:
+    """
+    All-pairs shortest-path distances and next-hop actions for a grid of 0 (path) and 1 (wall),
+    with an optional per-tile cost layer where a step costs the entry cost of the cell stepped onto.
+    Distances are kept in one compact array per goal cell, indexed by the ordinal of the start
+    cell among the open cells, and next hops in a bytearray of action codes. Small mazes are
+    fully computed on construction; larger ones compute a goal's row on its first query and keep
+    the max_rows most recently used rows.
+    Attributes:
+        rows (int): The number of rows in the grid.
+        cols (int): The number of columns in the grid.
+        version: The maze version the oracle was built for.
+        weighted (bool): True if any open cell costs more than 1; the rows are then built by Dijkstra.
+        build_time (float): Seconds spent running the BFS passes so far.
+        nodes_expanded (int): Number of cells expanded by the BFS passes so far.
+        lazy (bool): True if rows are computed on first use.
+        max_rows (int): Rows kept in lazy mode.
+    """
+
+    def __init__(self, grid, version = 0, lazy = None, costs = None, max_rows = MAX_LAZY_ROWS):
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if self.rows else 0
+        self.version = version
+        costs = cost_layer(costs, self.rows, self.cols) if costs is not None else None
+        self.build_time = 0.0
+        self.nodes_expanded = 0
+
+        # Map each open cell (row * cols + col) to its ordinal among the open cells
+        self.index = array('l', [-1]) * (self.rows * self.cols)
+        self.cells = array('l')
+        for row in range(self.rows):
+            for col in range(self.cols):
+                if grid[row][col] == 0:
+                    self.index[row * self.cols + col] = len(self.cells)
+                    self.cells.append(row * self.cols + col)
+
+        # Open neighbours of each open cell as (action code, ordinal) pairs
+        self.neighbours = []
+        for cell in self.cells:
+            row, col = divmod(cell, self.cols)
+            adjacent = []
+            for code, (dr, dc) in enumerate(MOVES):
+                r, c = row + dr, col + dc
+                if 0 <= r < self.rows and 0 <= c < self.cols and grid[r][c] == 0:
+                    adjacent.append((code, self.index[r * self.cols + c]))
+            self.neighbours.append(tuple(adjacent))
+
+        size = len(self.cells)
+        # Entry cost of each open cell by ordinal, kept only when some step costs more than 1
+        self.costs = bytearray(costs[cell] for cell in self.cells) if costs is not None else None
+        self.weighted = self.costs is not None and any(cost > 1 for cost in self.costs)
+        if not self.weighted:
+            self.costs = None
+        longest = size * max(self.costs) if self.weighted else size # Bound on any path cost
+        self.typecode = 'H' if longest < 0xFFFF else 'L'
+        self.unreachable = 0xFFFF if self.typecode == 'H' else 0xFFFFFFFF
+        self.distances = [None] * size
+        self.next_hops = [None] * size
+
+        if lazy is None:
+            lazy = size > EAGER_LIMIT
+        self.lazy = lazy
+        self.max_rows = max_rows
+        self.recent = OrderedDict() # Goals whose rows are built in lazy mode, least recently used first
+        if not lazy:
+            for goal in range(size):
+                self._build_row(goal)
+
+    def _build_row(self, goal): # BFS outward from the goal fills one row of both tables
+        if self.weighted:
+            self._build_weighted_row(goal)
+            return
+        start_time = time.perf_counter()
+        size = len(self.cells)
+        distances = array(self.typecode, [self.unreachable]) * size
+        next_hops = bytearray([NO_ACTION]) * size
+        neighbours = self.neighbours
+
+        distances[goal] = 0
+        frontier = deque([goal])
+        expanded = 0
+        while frontier:
+            current = frontier.popleft()
+            expanded += 1
+            step = distances[current] + 1
+            for code, other in neighbours[current]:
+                if distances[other] == self.unreachable:
+                    distances[other] = step
+                    next_hops[other] = OPPOSITE[code] # from other, step back towards current
+                    frontier.append(other)
+
+        self.distances[goal] = distances
+        self.next_hops[goal] = next_hops
+        self.nodes_expanded += expanded
+        self.build_time += time.perf_counter() - start_time
+
+    def _build_weighted_row(self, goal): # Dijkstra outward from the goal over the reversed edges
+        start_time = time.perf_counter()
+        size = len(self.cells)
+        distances = array(self.typecode, [self.unreachable]) * size
+        next_hops = bytearray([NO_ACTION]) * size
+        neighbours, costs = self.neighbours, self.costs
+
+        distances[goal] = 0
+        frontier = [(0, goal)]
+        expanded = 0
+        while frontier:
+            distance, current = heapq.heappop(frontier)
+            if distance > distances[current]: # Stale entry, the cell was settled cheaper
+                continue
+            expanded += 1
+            step = distance + costs[current] # Stepping from a neighbour onto current costs current's cost
+            for code, other in neighbours[current]:
+                if step < distances[other]:
+                    distances[other] = step
+                    next_hops[other] = OPPOSITE[code]
+                    heapq.heappush(frontier, (step, other))
+
+        self.distances[goal] = distances
+        self.next_hops[goal] = next_hops
+        self.nodes_expanded += expanded
+        self.build_time += time.perf_counter() - start_time
+
+    def _ordinal(self, pos):
+        row, col = pos
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return -1
+        return self.index[row * self.cols + col]
+
+    def _step_off(self, start, goal): # Best first move off a wall start as (distance, action code, ordinal), or None
+        row, col = start
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return None
+        distances = self._row(goal)[0]
+        best = None
+        for code, (dr, dc) in enumerate(MOVES):
+            r, c = row + dr, col + dc
+            if not (0 <= r < self.rows and 0 <= c < self.cols):
+                continue
+            other = self.index[r * self.cols + c]
+            if other < 0 or distances[other] == self.unreachable:
+                continue
+            distance = distances[other] + (self.costs[other] if self.weighted else 1)
+            if best is None or distance < best[0]:
+                best = (distance, code, other)
+        return best
+
+    def _row(self, goal):
+        if self.distances[goal] is None:
+            self._build_row(goal)
+            if self.lazy:
+                self.recent[goal] = None
+                if len(self.recent) > self.max_rows:
+                    evicted, _ = self.recent.popitem(last = False)
+                    self.distances[evicted] = self.next_hops[evicted] = None
+        elif self.lazy:
+            self.recent.move_to_end(goal)
+        return self.distances[goal], self.next_hops[goal]
+
+    def distance(self, start, goal): # Shortest-path distance, or None if unreachable
+        if start == goal:
+            return 0
+        s, g = self._ordinal(start), self._ordinal(goal)
+        if g < 0:
+            return None
+        if s < 0:
+            step = self._step_off(start, g)
+            return step[0] if step is not None else None
+        distance = self._row(g)[0][s]
+        return None if distance == self.unreachable else distance
+
+    def next_action(self, start, goal): # First move of a shortest path, or None
+        s, g = self._ordinal(start), self._ordinal(goal)
+        if g < 0:
+            return None
+        if s < 0:
+            step = self._step_off(start, g)
+            return ACTIONS[step[1]] if step is not None else None
+        code = self._row(g)[1][s]
+        return None if code == NO_ACTION else ACTIONS[code]
+
+    def path(self, start, goal): # Full action list by following the next-hop table
+        if start == goal: # Even on a wall, as every search returns an empty path there
+            return []
+        s, g = self._ordinal(start), self._ordinal(goal)
+        if g < 0:
+            return None
+        actions = []
+        if s < 0:
+            step = self._step_off(start, g)
+            if step is None:
+                return None
+            actions.append(ACTIONS[step[1]])
+            s = step[2]
+        distances, next_hops = self._row(g)
+        if distances[s] == self.unreachable:
+            return None
+
+        row, col = divmod(self.cells[s], self.cols)
+        while s != g:
+            code = next_hops[s]
+            actions.append(ACTIONS[code])
+            dr, dc = MOVES[code]
+            row, col = row + dr, col + dc
+            s = self.index[row * self.cols + col]
+        return actions
+
+    def memory_usage(self): # Bytes held by the distance and next-hop tables
+        return sum(
+            row.itemsize * len(row) for row in self.distances if row is not None
+        ) + sum(len(row) for row in self.next_hops if row is not None)
+
+    def stats(self): # Build statistics in the same shape as a search result
+        return SearchResult(
+            actions = None,
+            search_time = self.build_time,
+            memory_usage = self.memory_usage(),
+            nodes_expanded = self.nodes_expanded
+        )
+
+
+class Oracle(SearchAlgorithm):
+    """
+    Answers a search problem from the DistanceOracle of its maze instead of searching.
+    The problem must expose the maze as problem.maze and the start and goal cells as
+    problem.start and problem.goal.
+    Methods
+    -------
+    search(problem):
+        Returns a SearchResult whose nodes_expanded is the number of table lookups made.
+    """
+
+    optimal = True
+
+    def _search(self, problem):
+        oracle = problem.maze.distance_oracle
+        actions = oracle.path(problem.start, problem.goal)
+        return actions, len(actions) if actions is not None else 0
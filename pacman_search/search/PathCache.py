@@ -0,0 +1,158 @@
+# search/PathCache.py
+"""
+Memoised search results for chasers that keep asking for the same paths.
+This module contains the PathCache class, a bounded LRU of paths keyed by maze version,
+algorithm, start and goal, placed in front of SearchAlgorithm.search. A repeated query
+returns the cached path without searching. For algorithms that return shortest paths,
+a query whose start lies on a cached path to the same goal also returns the rest of that
+path, since every suffix of a shortest path is a shortest path.
+Classes:
+    PathCache: The LRU of paths with hit, suffix hit, miss and eviction counters.
+Methods:
+    search(algorithm, problem, instrumentation=None):
+        Returns a SearchResult from the cache, or runs algorithm.search and caches its path.
+    lookup(algorithm, problem):
+        Returns the cached actions for a problem (None if it has no path), or MISS.
+    add(algorithm, problem, actions):
+        Caches the actions found for a problem, e.g. by a SlicedSearch after a MISS.
+    clear():
+        Drops every cached path, the counters are kept.
+    stats():
+        Returns the counters and the size of the cache as a dict.
+"""
+
+from collections import OrderedDict
+from .Search import SearchResult
+from .instrumentation import get_default_instrumentation, make_probe
+
+MOVES = {'UP': (-1, 0), 'DOWN': (1, 0), 'LEFT': (0, -1), 'RIGHT': (0, 1)}
+DEFAULT_CAPACITY = 1024
+MISS = object() # lookup() found nothing; None is a cached "no path"
+
+
+class PathCache:
+    """
+    Bounded LRU of search results for the problems of one maze.
+    The problem must expose the maze as problem.maze and the start and goal cells as
+    problem.start and problem.goal, like ChasePacmanProblem. The cache empties itself when
+    the maze version changes, so it never holds paths of an older grid.
+    Attributes:
+        capacity (int): Maximum number of cached paths.
+        hits (int): Queries answered with a whole cached path.
+        suffix_hits (int): Queries answered with the rest of a cached path the start was on.
+        misses (int): Queries that had to search.
+        evictions (int): Paths dropped to stay within capacity.
+    """
+
+    def __init__(self, capacity = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.version = None
+        self.entries = OrderedDict() # (version, algorithm, start, goal) -> tuple of actions, or None
+        self.routes = {} # (algorithm, goal) -> {cell on a cached path: [(entry key, index of the cell), ...]}
+        self.hits = 0
+        self.suffix_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def search(self, algorithm, problem, instrumentation = None):
+        probe = make_probe(instrumentation or algorithm.instrumentation or get_default_instrumentation())
+        probe.start()
+        actions = self.lookup(algorithm, problem)
+        if actions is not MISS:
+            search_time, memory_usage = probe.stop()
+            return SearchResult(
+                actions = actions,
+                search_time = search_time,
+                memory_usage = memory_usage,
+                nodes_expanded = 0
+            )
+
+        result = algorithm.search(problem, instrumentation = instrumentation)
+        self.add(algorithm, problem, result.actions)
+        return result
+
+    def lookup(self, algorithm, problem):
+        version = problem.maze.version
+        if version != self.version: # The grid changed, every cached path may be wrong
+            self.clear()
+            self.version = version
+
+        name = algorithm.name
+        key = (version, name, problem.start, problem.goal)
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            actions = self.entries[key]
+            return list(actions) if actions is not None else None # Callers pop from their path
+
+        if algorithm.optimal: # Somewhere along a cached shortest path to the same goal
+            route = self.routes.get((name, problem.goal))
+            if route is not None and problem.start in route:
+                entry, index = route[problem.start][0] # Any cached path through the cell will do
+                self.suffix_hits += 1
+                self.entries.move_to_end(entry)
+                return list(self.entries[entry][index:])
+
+        self.misses += 1
+        return MISS
+
+    def add(self, algorithm, problem, actions):
+        if problem.maze.version != self.version: # Found on a grid that has changed since
+            return
+        self._add((self.version, algorithm.name, problem.start, problem.goal), actions, algorithm.optimal)
+
+    def _add(self, key, actions, optimal):
+        if key in self.entries: # Re-added: drop the old entry's route cells, which would point into the wrong path
+            self._drop_route(key, self.entries.pop(key))
+        self.entries[key] = tuple(actions) if actions is not None else None
+        if optimal and actions:
+            version, name, start, goal = key
+            route = self.routes.setdefault((name, goal), {})
+            row, col = start
+            for index, action in enumerate(actions):
+                route.setdefault((row, col), []).append((key, index)) # A shared cell outlives any one of its entries
+                d_row, d_col = MOVES[action]
+                row, col = row + d_row, col + d_col
+
+        while len(self.entries) > self.capacity:
+            self._evict()
+
+    def _evict(self):
+        key, actions = self.entries.popitem(last = False)
+        self.evictions += 1
+        self._drop_route(key, actions)
+
+    def _drop_route(self, key, actions): # Remove the entry from its route cells, dropping the cells no other entry covers
+        version, name, start, goal = key
+        route = self.routes.get((name, goal))
+        if route is None or not actions:
+            return
+        row, col = start
+        for action in actions:
+            owners = route.get((row, col))
+            if owners is not None:
+                owners[:] = [owner for owner in owners if owner[0] != key]
+                if not owners:
+                    del route[(row, col)]
+            d_row, d_col = MOVES[action]
+            row, col = row + d_row, col + d_col
+        if not route:
+            del self.routes[(name, goal)]
+
+    def clear(self):
+        self.entries.clear()
+        self.routes.clear()
+
+    def stats(self):
+        queries = self.hits + self.suffix_hits + self.misses
+        return {
+            "capacity": self.capacity,
+            "paths": len(self.entries),
+            "stored_steps": sum(len(actions) for actions in self.entries.values() if actions),
+            "route_cells": sum(len(route) for route in self.routes.values()),
+            "hits": self.hits,
+            "suffix_hits": self.suffix_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits + self.suffix_hits) / queries if queries else 0.0,
+        }
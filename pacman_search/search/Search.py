@@ -1,76 +1,168 @@
-# search/Search.py 
-"""
-This module defines the abstract base classes for search problems and search algorithms, 
-as well as utility functions and data structures for search.
-Classes:
-    SearchProblem: An abstract base class for defining search problems.
-    SearchAlgorithm: An abstract base class for defining search algorithms.
-    SearchResult: A data class for storing the results of a search.
-Functions:
-    reconstruct_path(node): Reconstructs the path from the initial state to the given node.
-Classes and Methods:
-    SearchProblem:
-        get_initial_state(): Returns the initial state of the problem.
-        get_successors(state): Returns the successors of the given state.
-        get_cost(current_cost, step_cost): Returns the total cost after taking a step.
-        heuristic(state): Returns the heuristic value of the given state.
-        goal_test(state): Checks if the given state is the goal state.
-    SearchAlgorithm:
-        search(problem: SearchProblem) -> Optional[List[Any]]: Performs a search to find a solution to the given search problem.
-"""
-
-import abc
-from dataclasses import dataclass
-from typing import List, Optional, Any
-
-class SearchProblem(abc.ABC):
-
-    @abc.abstractmethod
-    def get_initial_state(self):
-        pass # return the initial state of the problem
-
-    @abc.abstractmethod
-    def get_successors(self, state):
-        pass
-
-
-    def get_cost(self, current_cost, step_cost):
-        return current_cost + step_cost
-
-    def heuristic(self, state):
-        return 0
-
-    @abc.abstractmethod
-    def goal_test(self, state):
-        pass
-
-
-class SearchAlgorithm(abc.ABC):
-    @abc.abstractmethod
-    def search(self, problem: SearchProblem) -> Optional[List[Any]]:
-        """
-        Perform a search to find a solution to the given search problem.
-        Args:
-            problem (SearchProblem): The search problem to solve.
-        Returns:
-            Optional[List[Any]]: A list of actions that represents the solution to the problem, 
-                                 or None if no solution is found.
-        """
-
-        pass
-
-
-def reconstruct_path(node):
-    actions = []
-    while node.parent is not None:
-        actions.append(node.action)
-        node = node.parent
-    actions.reverse()
-    return actions
-
-@dataclass
-class SearchResult:
-    actions: Optional[List[Any]]
-    search_time: float
-    memory_usage: float
-    nodes_expanded: int
\ No newline at end of file
+# search/Search.py 
+"""
+This module defines the abstract base classes for search problems and search algorithms, 
+as well as utility functions and data structures for search.
+Classes:
+    SearchProblem: An abstract base class for defining search problems.
+    SearchAlgorithm: An abstract base class for defining search algorithms.
+    SearchResult: A data class for storing the results of a search.
+Functions:
+    reconstruct_path(node): Reconstructs the path from the initial state to the given node.
+    add_result_hook(hook), remove_result_hook(hook): Register or drop a function called as
+        hook(algorithm, problem, result) after every search, e.g. DataLogger.record_search.
+    run_steps(steps): Runs a _search_steps generator that never pauses and returns its result tuple.
+Classes and Methods:
+    SearchProblem:
+        get_initial_state(): Returns the initial state of the problem.
+        get_successors(state): Returns the successors of the given state.
+        get_cost(current_cost, step_cost): Returns the total cost after taking a step.
+        heuristic(state): Returns the heuristic value of the given state.
+        state_count(): Returns the number of states if they can be numbered 0..n-1, else None.
+        state_id(state): Returns the number of the given state.
+        get_goal_state(): Returns the single goal state, or None if there is none to search back from.
+        get_predecessors(state): Returns (action, previous_state, cost) for every edge into the given state.
+        reverse_heuristic(state): Estimates the cost from the initial state to the given state.
+        goal_test(state): Checks if the given state is the goal state.
+    SearchAlgorithm:
+        search(problem, instrumentation=None) -> SearchResult: Measures and runs _search on the given search problem.
+        _search(problem) -> (actions, nodes_expanded[, stats]): The search itself, implemented by each algorithm.
+            An optional stats dict is passed through to SearchResult.stats.
+        _search_steps(problem, pause=inf): The same search as a generator that can be run a slice at a time,
+            see SlicedSearch. Once nodes_expanded reaches pause it yields nodes_expanded and waits for
+            the next pause count from send(); it returns the _search tuple. BFS, DFS, UCS, AStar and
+            DStarLite implement _search on top of it; other algorithms run whole in their first slice.
+        optimal: Class attribute, True for the algorithms that always return a shortest path.
+        name: The class name, or a more specific one for algorithms that wrap another.
+"""
+
+import abc
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Any
+from .instrumentation import get_default_instrumentation, make_probe
+
+_result_hooks = [] # Called after every search; empty by default, which costs one check per search
+
+def add_result_hook(hook):
+    _result_hooks.append(hook)
+
+def remove_result_hook(hook):
+    _result_hooks.remove(hook)
+
+def _report(algorithm, problem, result):
+    for hook in _result_hooks:
+        hook(algorithm, problem, result)
+
+def run_steps(steps):
+    try:
+        next(steps)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("A search run without a pause count yielded")
+
+class SearchProblem(abc.ABC):
+
+    @abc.abstractmethod
+    def get_initial_state(self):
+        pass # return the initial state of the problem
+
+    @abc.abstractmethod
+    def get_successors(self, state):
+        pass
+
+
+    def get_cost(self, current_cost, step_cost):
+        return current_cost + step_cost
+
+    def heuristic(self, state):
+        return 0
+
+    def state_count(self):
+        return None # Problems that number their states get flat-array search trees
+
+    def get_goal_state(self):
+        return None # Bidirectional searches need the single goal state
+
+    def get_predecessors(self, state): # (action, previous state, cost) for every edge into state
+        raise NotImplementedError("Bidirectional search needs the predecessors of a state")
+
+    def reverse_heuristic(self, state):
+        return 0 # Estimate of the cost from the initial state, for searches run backwards
+
+    def state_id(self, state):
+        return state
+
+    @abc.abstractmethod
+    def goal_test(self, state):
+        pass
+
+
+class SearchAlgorithm(abc.ABC):
+    optimal = False # True if every path found is a shortest one, which lets a PathCache reuse its suffixes
+
+    def __init__(self, instrumentation = None):
+        self.instrumentation = instrumentation # None follows the global default mode
+
+    @property
+    def name(self): # Tells algorithms apart, e.g. in PathCache keys
+        return type(self).__name__
+
+    def search(self, problem: SearchProblem, instrumentation = None) -> "SearchResult":
+        """
+        Perform a search to find a solution to the given search problem.
+        Args:
+            problem (SearchProblem): The search problem to solve.
+            instrumentation (str, optional): "off", "counters" or "full" for this call only.
+                Defaults to the algorithm's own mode, then to the global default.
+        Returns:
+            SearchResult: The actions that solve the problem (None if no solution is found),
+                          with the search time, memory usage and nodes expanded.
+        """
+
+        probe = make_probe(instrumentation or self.instrumentation or get_default_instrumentation())
+        probe.start()
+        actions, nodes_expanded, *stats = self._search(problem)
+        search_time, memory_usage = probe.stop()
+
+        result = SearchResult(
+            actions = actions,
+            search_time = search_time,
+            memory_usage = memory_usage,
+            nodes_expanded = nodes_expanded,
+            stats = stats[0] if stats else None
+        )
+        if _result_hooks:
+            _report(self, problem, result)
+        return result
+
+    @abc.abstractmethod
+    def _search(self, problem: SearchProblem):
+        """
+        Run the search itself.
+        Returns:
+            tuple: (actions, nodes_expanded), where actions is None if no solution is found,
+                   optionally followed by a dict of algorithm-specific counters.
+        """
+
+        pass
+
+    def _search_steps(self, problem: SearchProblem, pause = math.inf):
+        return self._search(problem) # Searches that cannot pause run whole in the first slice
+        yield
+
+
+def reconstruct_path(node):
+    actions = []
+    while node.parent is not None:
+        actions.append(node.action)
+        node = node.parent
+    actions.reverse()
+    return actions
+
+@dataclass
+class SearchResult:
+    actions: Optional[List[Any]]
+    search_time: float
+    memory_usage: float
+    nodes_expanded: int
+    stats: Optional[dict] = None # Algorithm-specific counters, e.g. the expansions of each frontier
\ No newline at end of file
@@ -0,0 +1,97 @@
+# search/SlicedSearch.py
+"""
+Anytime planning: one search run a slice at a time.
+This module contains the SlicedSearch class, which drives the _search_steps generator of a
+search algorithm so a search too large for one frame can be spread over several: each step()
+expands up to a node budget or runs for a time budget, then the search is suspended with its
+frontier and search tree intact and resumes where it stopped on the next step().
+Classes:
+    SlicedSearch: One search of one problem, advanced by step() until it is done.
+Methods:
+    step(node_budget=None, time_budget=None):
+        Runs the next slice. Returns the SearchResult once the search is done, None while it is not.
+        Args:
+            node_budget (int, optional): Nodes to expand in this slice, at least one.
+            time_budget (float, optional): Seconds to run this slice for. The clock is read every
+                CHUNK expansions, so a slice may run over by up to CHUNK expansions.
+            With neither, the search runs to the end.
+    cancel(): Stops the search and gives its search tree back to the pool.
+"""
+
+import math
+import time
+from .Search import SearchResult, _report
+
+CHUNK = 64 # Expansions between clock checks under a time budget
+
+
+class SlicedSearch:
+    """
+    A search suspended between slices.
+    search_time in the result is the wall-clock time of all the slices, measured whatever the
+    instrumentation mode; memory_usage is not measured and is 0. The result hooks are called once,
+    when the search is done.
+    Attributes:
+        algorithm (SearchAlgorithm): The algorithm searching.
+        problem (SearchProblem): The problem being solved; it must not change between slices.
+        nodes_expanded (int): Nodes expanded over all the slices so far.
+        slices (int): Slices run so far.
+        result (SearchResult): The result once the search is done, else None.
+    """
+
+    def __init__(self, algorithm, problem):
+        self.algorithm = algorithm
+        self.problem = problem
+        self.steps = None # The _search_steps generator, started by the first slice
+        self.nodes_expanded = 0
+        self.search_time = 0.0
+        self.slices = 0
+        self.result = None
+
+    @property
+    def done(self):
+        return self.result is not None
+
+    def step(self, node_budget = None, time_budget = None):
+        if self.result is not None:
+            return self.result
+
+        start = time.perf_counter()
+        deadline = start + time_budget if time_budget is not None else None
+        stop_at = self.nodes_expanded + max(1, node_budget) if node_budget is not None else math.inf
+        self.slices += 1
+        try:
+            while True:
+                pause = stop_at if deadline is None else min(stop_at, self.nodes_expanded + CHUNK)
+                if self.steps is None:
+                    self.steps = self.algorithm._search_steps(self.problem, pause)
+                    self.nodes_expanded = next(self.steps)
+                else:
+                    self.nodes_expanded = self.steps.send(pause)
+                if self.nodes_expanded >= stop_at or (deadline is not None and time.perf_counter() >= deadline):
+                    break
+        except StopIteration as stop:
+            self.search_time += time.perf_counter() - start
+            self._finish(stop.value)
+            return self.result
+
+        self.search_time += time.perf_counter() - start
+        return None
+
+    def _finish(self, value):
+        actions, nodes_expanded, *stats = value
+        self.nodes_expanded = nodes_expanded
+        self.steps = None
+        self.result = SearchResult(
+            actions = actions,
+            search_time = self.search_time,
+            memory_usage = 0,
+            nodes_expanded = nodes_expanded,
+            stats = stats[0] if stats else None
+        )
+        _report(self.algorithm, self.problem, self.result)
+
+    def cancel(self):
+        if self.steps is not None:
+            self.steps.close() # Runs the generator's cleanup, returning its pooled search tree
+            self.steps = None
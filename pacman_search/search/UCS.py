@@ -1,111 +1,98 @@
-# search/UCS.py 
-"""
-Uniform Cost Search (UCS) implementation.
-This module contains the UCS class which implements the Uniform Cost Search algorithm
-for solving search problems. The UCS algorithm expands the least-cost node first, ensuring
-that the path to the goal state is the least costly.
-Classes:
-    UCS: Inherits from SearchAlgorithm and implements the search method for UCS.
-Methods:
-    search(problem):
-        Performs the UCS algorithm to find the least-cost path to the goal state.
-        Args:
-            problem: An instance of a search problem that provides the initial state,
-                     goal test, and successor function.
-        Returns:
-            SearchResult: An object containing the actions to reach the goal state,
-                          the search time, memory usage, and the number of nodes expanded.
-"""
-
-
-import time
-import tracemalloc
-from .Search import SearchAlgorithm, reconstruct_path, SearchResult
-from .utils import Node, PriorityQueue
-
-class UCS(SearchAlgorithm):
-    """
-    Uniform Cost Search (UCS) algorithm implementation.
-    Methods
-    -------
-    search(problem)
-        Executes the UCS algorithm to find the solution to the given problem.
-    """
-    """
-        Executes the Uniform Cost Search (UCS) algorithm to find the solution to the given problem.
-        Parameters
-        ----------
-        problem : Problem
-            The problem to be solved, which must provide methods for getting the initial state, 
-            testing the goal state, and getting the successors of a state.
-        Returns
-        -------
-        SearchResult
-            An object containing the actions to reach the goal state, the search time, 
-            the memory usage, and the number of nodes expanded during the search.
-    """
-
-    def search(self, problem):
-        start_time = time.perf_counter()
-        tracemalloc.start()
-        nodes_expanded = 0
-
-        initial_state = problem.get_initial_state()
-        # Create the root node
-        root = Node(state = initial_state, parent = None, action = None, path_cost = 0)
-
-        if problem.goal_test(root.state): # if the root is the goal state
-            end_time = time.perf_counter()
-            current, peak  = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-
-            return SearchResult(
-                actions = reconstruct_path(root),
-                search_time = end_time - start_time,
-                memory_usage = peak,
-                nodes_expanded = nodes_expanded
-            )
-
-        frontier = PriorityQueue()
-        frontier.push(root, root.path_cost)
-        explored = {root.state: root.path_cost}
-
-        while not frontier.is_empty():
-            node = frontier.pop()
-            nodes_expanded += 1
-
-            if problem.goal_test(node.state): # if the node is the goal state
-                end_time = time.perf_counter()
-                current, peak = tracemalloc.get_traced_memory()
-                tracemalloc.stop()
-
-                return SearchResult(
-                    actions = reconstruct_path(node),
-                    search_time = end_time - start_time,
-                    memory_usage = peak,
-                    nodes_expanded = nodes_expanded
-                )
-            
-            for action, next_state, cost in problem.get_successors(node.state): # get the successors of the node
-                child_cost = node.path_cost + cost
-                if next_state not in explored or child_cost < explored[next_state]: # if the child is not in the explored set or the child cost is less than the explored child cost
-                    child = Node(
-                        state = next_state,
-                        parent = node,
-                        action = action,
-                        path_cost = child_cost
-                    )
-
-                    frontier.push(child, child.path_cost)
-                    explored[next_state] = child_cost
-        
-        end_time = time.perf_counter()
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-
-        return SearchResult(
-            actions = None,
-            search_time = end_time - start_time,
-            memory_usage = peak,
-            nodes_expanded = nodes_expanded
-        )
\ No newline at end of file
+# search/UCS.py 
+"""
+Uniform Cost Search (UCS) implementation.
+This module contains the UCS class which implements the Uniform Cost Search algorithm
+for solving search problems. The UCS algorithm expands the least-cost node first, ensuring
+that the path to the goal state is the least costly.
+Classes:
+    UCS: Inherits from SearchAlgorithm and implements the search method for UCS.
+Methods:
+    UCS(queue=PriorityQueue):
+        The queue class holds the frontier; BucketQueue or IndexedPriorityQueue from search.utils
+        lower the priority of a queued state instead of pushing it again.
+        Expanded states go into a closed set and older frontier entries for them are skipped
+        when popped, so each state is expanded at most once; the skips are counted in stats.
+    search(problem):
+        Performs the UCS algorithm to find the least-cost path to the goal state.
+        Args:
+            problem: An instance of a search problem that provides the initial state,
+                     goal test, and successor function.
+        Returns:
+            SearchResult: An object containing the actions to reach the goal state,
+                          the search time, memory usage, and the number of nodes expanded.
+"""
+
+
+import math
+from .Search import SearchAlgorithm, run_steps
+from .utils import PriorityQueue, search_tree
+
+class UCS(SearchAlgorithm):
+    """
+    Uniform Cost Search (UCS) algorithm implementation.
+    Methods
+    -------
+    search(problem)
+        Executes the UCS algorithm to find the solution to the given problem.
+    """
+    """
+        Executes the Uniform Cost Search (UCS) algorithm to find the solution to the given problem.
+        Parameters
+        ----------
+        problem : Problem
+            The problem to be solved, which must provide methods for getting the initial state, 
+            testing the goal state, and getting the successors of a state.
+        Returns
+        -------
+        SearchResult
+            An object containing the actions to reach the goal state, the search time, 
+            the memory usage, and the number of nodes expanded during the search.
+    """
+
+    optimal = True
+
+    def __init__(self, queue = PriorityQueue, instrumentation = None):
+        super().__init__(instrumentation)
+        self.queue = queue # Frontier class with the PriorityQueue interface
+
+    def _search(self, problem):
+        return run_steps(self._search_steps(problem))
+
+    def _search_steps(self, problem, pause = math.inf):
+        nodes_expanded = 0
+        stats = {"stale_pops": 0}
+
+        with search_tree(problem) as tree: # best known cost and parent of every reached state
+            initial_state = problem.get_initial_state()
+            root = tree.key(initial_state)
+            tree.add_root(root)
+
+            if problem.goal_test(initial_state): # if the root is the goal state
+                return tree.path(root), nodes_expanded, stats
+
+            frontier = self.queue()
+            frontier.push(initial_state, 0)
+
+            while not frontier.is_empty():
+                if nodes_expanded >= pause: # this slice is used up, wait for the next one
+                    pause = yield nodes_expanded
+                state = frontier.pop()
+                key = tree.key(state)
+                if tree.is_closed(key): # a stale entry, left behind when the state was pushed again more cheaply
+                    stats["stale_pops"] += 1
+                    continue
+                tree.close(key) # expanded, so later entries for it are stale
+                path_cost = tree.cost(key)
+                nodes_expanded += 1
+
+                if problem.goal_test(state): # if the state is the goal state
+                    return tree.path(key), nodes_expanded, stats
+                
+                for action, next_state, cost in problem.get_successors(state): # get the successors of the state
+                    child_cost = path_cost + cost
+                    next_key = tree.key(next_state)
+                    if child_cost < tree.cost(next_key): # if the child is unseen or reached more cheaply than before
+                        tree.add(next_key, key, action, child_cost)
+                        frontier.push(next_state, child_cost)
+
+        return None, nodes_expanded, stats
@@ -1,23 +1,56 @@
-#search/__init__.py
-"""
-This module initializes the search package and imports various search-related classes and functions.
-Imports:
-    - SearchProblem: A class representing a search problem.
-    - SearchAlgorithm: A base class for search algorithms.
-    - SearchResult: A class representing the result of a search.
-    - reconstruct_path: A function to reconstruct the path from the search result.
-    - Node: A class representing a node in the search tree.
-    - PriorityQueue: A class representing a priority queue.
-    - null_heuristic: A heuristic function that always returns zero.
-    - BFS: A class implementing the Breadth-First Search algorithm.
-    - DFS: A class implementing the Depth-First Search algorithm.
-    - UCS: A class implementing the Uniform Cost Search algorithm.
-    - AStar: A class implementing the A* Search algorithm.
-"""
-
-from .Search import SearchProblem, SearchAlgorithm, SearchResult, reconstruct_path
-from .utils import Node, PriorityQueue, null_heuristic
-from .BFS import BFS
-from .DFS import DFS
-from .UCS import UCS
-from .AStar import AStar
\ No newline at end of file
+#search/__init__.py
+"""
+This module initializes the search package and imports various search-related classes and functions.
+Imports:
+    - SearchProblem: A class representing a search problem.
+    - SearchAlgorithm: A base class for search algorithms.
+    - SearchResult: A class representing the result of a search.
+    - reconstruct_path: A function to reconstruct the path from the search result.
+    - add_result_hook, remove_result_hook: Functions registering a callback for every SearchResult.
+    - Node: A class representing a node in the search tree.
+    - PriorityQueue: A class representing a priority queue.
+    - BucketQueue, IndexedPriorityQueue: Priority queues with decrease-key, for integer priorities or any.
+    - null_heuristic: A heuristic function that always returns zero.
+    - ArraySearchTree, DictSearchTree: Search trees stored as flat arrays or as a dict.
+    - search_tree: A context manager lending a pooled search tree for a problem.
+    - clear_tree_pool: A function dropping every pooled search tree.
+    - BFS: A class implementing the Breadth-First Search algorithm.
+    - DFS: A class implementing the Depth-First Search algorithm.
+    - UCS: A class implementing the Uniform Cost Search algorithm.
+    - AStar: A class implementing the A* Search algorithm.
+    - BidirectionalBFS: A class implementing BFS from both the start and the goal.
+    - BidirectionalAStar: A class implementing A* from both the start and the goal.
+    - JPS: A class implementing Jump Point Search for 4-connected grids.
+    - DistanceOracle: A class holding precomputed all-pairs distances and next hops for a grid.
+    - Oracle: A class answering searches from a maze's DistanceOracle.
+    - GridGraph: A class compiling a grid into an integer CSR adjacency graph.
+    - DStarLite: A class implementing incremental D* Lite replanning for a moving target.
+    - CorridorGraph: A class reducing a grid graph to its junctions and the corridors between them.
+    - CorridorSearch: A class running another search algorithm on a maze's corridor graph.
+    - Landmarks: A class holding landmark distance tables for the ALT heuristic.
+    - landmark_heuristic: A function giving AStar the ALT heuristic of a problem's maze.
+    - PathCache: A class caching search results by maze version, algorithm, start and goal in a bounded LRU.
+    - SlicedSearch: A class running one search a node or time budget at a time, resuming where it stopped.
+    - DistanceField: A class holding the distances to one cell from a single reverse BFS, shared by several chasers.
+    - OFF, COUNTERS, FULL: The instrumentation modes accepted by SearchAlgorithm.search.
+    - set_default_instrumentation: A function setting the global instrumentation mode.
+"""
+
+from .Search import SearchProblem, SearchAlgorithm, SearchResult, reconstruct_path, add_result_hook, remove_result_hook
+from .utils import Node, PriorityQueue, BucketQueue, IndexedPriorityQueue, null_heuristic, ArraySearchTree, DictSearchTree, search_tree, clear_tree_pool
+from .BFS import BFS
+from .DFS import DFS
+from .UCS import UCS
+from .AStar import AStar
+from .JPS import JPS
+from .BidirectionalBFS import BidirectionalBFS
+from .BidirectionalAStar import BidirectionalAStar
+from .Oracle import DistanceOracle, Oracle
+from .instrumentation import OFF, COUNTERS, FULL, set_default_instrumentation, get_default_instrumentation
+from .GridGraph import GridGraph
+from .DStarLite import DStarLite
+from .DistanceField import DistanceField
+from .PathCache import PathCache
+from .SlicedSearch import SlicedSearch
+from .Landmarks import Landmarks, landmark_heuristic
+from .CorridorGraph import CorridorGraph, CorridorProblem, CorridorSearch
\ No newline at end of file
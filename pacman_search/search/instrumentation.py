@@ -0,0 +1,85 @@
+# search/instrumentation.py
+"""
+This module provides the instrumentation modes used by SearchAlgorithm.search.
+Modes:
+    OFF: No measurement at all, search_time and memory_usage are reported as 0. Used for gameplay.
+    COUNTERS: Wall-clock search time only, from two perf_counter calls. The default.
+    FULL: Search time plus tracemalloc peak memory. Slows every allocation, meant for benchmarking.
+        Under an outer trace (a profiler, or an enclosing FULL search) the outer peak is left alone:
+        memory_usage is then the rise of the peak above the memory traced at the start when the search
+        set a new peak, and the net growth, a lower bound, when it did not.
+Classes:
+    NullProbe, CounterProbe, MemoryProbe: Measure one search in the OFF, COUNTERS and FULL modes.
+Functions:
+    set_default_instrumentation(mode): Sets the mode used when neither the call nor the algorithm chooses one.
+    get_default_instrumentation(): Returns the current global mode.
+    make_probe(mode): Returns a fresh probe for the given mode.
+"""
+
+import time
+import tracemalloc
+
+OFF = "off"
+COUNTERS = "counters"
+FULL = "full"
+
+_default_mode = COUNTERS
+
+
+class NullProbe:
+    def start(self):
+        pass
+
+    def stop(self): # Returns (search_time, memory_usage)
+        return 0.0, 0
+
+
+class CounterProbe:
+    def start(self):
+        self.start_time = time.perf_counter()
+
+    def stop(self):
+        return time.perf_counter() - self.start_time, 0
+
+
+class MemoryProbe:
+    def start(self):
+        # Reuse an outer trace (e.g. a profiler) instead of stopping it when done
+        self.owns_trace = not tracemalloc.is_tracing()
+        if self.owns_trace:
+            tracemalloc.start()
+            self.base, self.outer_peak = 0, 0
+        else: # Resetting the peak would lose the outer one, and it cannot be restored afterwards
+            self.base, self.outer_peak = tracemalloc.get_traced_memory()
+        self.start_time = time.perf_counter()
+
+    def stop(self):
+        search_time = time.perf_counter() - self.start_time
+        current, peak = tracemalloc.get_traced_memory()
+        if self.owns_trace:
+            tracemalloc.stop()
+            return search_time, peak
+        return search_time, max(0, (peak if peak > self.outer_peak else current) - self.base)
+
+
+_PROBES = {
+    OFF: NullProbe,
+    COUNTERS: CounterProbe,
+    FULL: MemoryProbe,
+}
+
+
+def set_default_instrumentation(mode):
+    global _default_mode
+    if mode not in _PROBES:
+        raise ValueError(f"Unknown instrumentation mode: {mode}")
+    _default_mode = mode
+
+def get_default_instrumentation():
+    return _default_mode
+
+def make_probe(mode):
+    try:
+        return _PROBES[mode]()
+    except KeyError:
+        raise ValueError(f"Unknown instrumentation mode: {mode}") from None
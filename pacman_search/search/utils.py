@@ -1,128 +1,461 @@
-# search/utils.py
-"""
-This module provides utility classes and functions for search algorithms.
-Classes:
-    Node: Represents a node in a search tree.
-    PriorityQueue: Implements a priority queue using a heap.
-Functions:
-    null_heuristic(state): A heuristic function that always returns 0.
-Class Node:
-    __init__(self, state, parent=None, action=None, path_cost=0):
-        Initializes a new node.
-        Args:
-            state: The state represented by the node.
-            parent: The parent node.
-            action: The action taken to reach this node.
-            path_cost: The cost to reach this node.
-    __lt__(self, other):
-        Compares this node with another node based on path cost.
-        Args:
-            other: The other node to compare with.
-        Returns:
-            True if this node's path cost is less than the other node's path cost.
-    __repr__(self):
-        Returns a string representation of the node.
-Class PriorityQueue:
-    __init__(self):
-        Initializes a new priority queue.
-    push(self, item, priority):
-        Adds an item to the priority queue with the given priority.
-        Args:
-            item: The item to add.
-            priority: The priority of the item.
-    pop(self):
-        Removes and returns the item with the highest priority (lowest priority value).
-        Returns:
-            The item with the highest priority.
-    is_empty(self):
-        Checks if the priority queue is empty.
-        Returns:
-            True if the priority queue is empty, False otherwise.
-Function null_heuristic(state):
-    A heuristic function that always returns 0.
-    Args:
-        state: The state for which the heuristic value is calculated.
-    Returns:
-        0
-"""
-
-
-
-import heapq
-
-class Node: 
-    """
-    A class used to represent a Node in a search tree.
-    Attributes
-    ----------
-    state : any
-        The state represented by the node.
-    parent : Node, optional
-        The parent node of this node (default is None).
-    action : any, optional
-        The action taken to get to this node from the parent node (default is None).
-    path_cost : int, optional
-        The cost to reach this node from the root node (default is 0).
-    Methods
-    -------
-    __lt__(other)
-        Compares this node with another node based on path_cost.
-    __repr__()
-        Returns a string representation of the node.
-    """
-
-    def __init__(self, state, parent = None, action = None, path_cost = 0):
-        self.state = state
-        self.parent = parent
-        self.action = action
-        self.path_cost = path_cost
-        
-    def __lt__(self, other):
-        return self.path_cost < other.path_cost
-
-    def __repr__(self):
-        return f"Node(state = {self.state}, path_cost = {self.path_cost})"
-
-class PriorityQueue:
-    """
-    A priority queue implementation using a heap.
-    Attributes:
-        elements (list): A list to store the elements of the priority queue.
-        count (int): A counter to maintain the order of elements with the same priority.
-    Methods:
-        __init__():
-            Initializes an empty priority queue.
-        push(item, priority):
-            Adds an item to the priority queue with the given priority.
-        pop():
-            Removes and returns the item with the highest priority (lowest priority number).
-        is_empty():
-            Checks if the priority queue is empty.
-    """
-
-    def __init__(self):
-        self.elements = []
-        self.count = 0
-
-    def push(self, item, priority):
-        heapq.heappush(self.elements, (priority, self.count, item))
-        self.count += 1
-
-    def pop(self):
-        return heapq.heappop(self.elements)[2]
-
-    def is_empty(self):
-        return len(self.elements) == 0
-
-
-def null_heuristic(state): 
-    """
-    A heuristic function that always returns zero.
-    This heuristic is used in search algorithms where no heuristic information is available or needed.
-    Args:
-        state: The current state of the search problem.
-    Returns:
-        int: Always returns 0.
-    """
-
-    return 0
\ No newline at end of file
+# search/utils.py
+"""
+This module provides utility classes and functions for search algorithms.
+Classes:
+    Node: Represents a node in a search tree.
+    PriorityQueue: Implements a priority queue using a heap.
+    BucketQueue: The same interface for small non-negative integer priorities, one list per priority.
+    IndexedPriorityQueue: The same interface as a binary heap with decrease-key, one entry per item.
+    ArraySearchTree: Parent pointers, actions and path costs in flat arrays indexed by state id.
+    DictSearchTree: The same interface backed by a dict, for problems whose states cannot be numbered.
+Functions:
+    null_heuristic(state): A heuristic function that always returns 0.
+    search_tree(problem): Context manager lending a search tree suited to the problem.
+        Free ArraySearchTrees are pooled, at most POOL_LIMIT per size and POOL_BYTES in all.
+    clear_tree_pool(): Drops every pooled search tree, e.g. before moving on to another maze size.
+Class Node:
+    __init__(self, state, parent=None, action=None, path_cost=0):
+        Initializes a new node.
+        Args:
+            state: The state represented by the node.
+            parent: The parent node.
+            action: The action taken to reach this node.
+            path_cost: The cost to reach this node.
+    __lt__(self, other):
+        Compares this node with another node based on path cost.
+        Args:
+            other: The other node to compare with.
+        Returns:
+            True if this node's path cost is less than the other node's path cost.
+    __repr__(self):
+        Returns a string representation of the node.
+Class PriorityQueue:
+    __init__(self):
+        Initializes a new priority queue.
+    push(self, item, priority):
+        Adds an item to the priority queue with the given priority.
+        Args:
+            item: The item to add.
+            priority: The priority of the item.
+    pop(self):
+        Removes and returns the item with the highest priority (lowest priority value).
+        Returns:
+            The item with the highest priority.
+    is_empty(self):
+        Checks if the priority queue is empty.
+        Returns:
+            True if the priority queue is empty, False otherwise.
+Class BucketQueue, Class IndexedPriorityQueue:
+    Drop-in replacements for PriorityQueue, selected with the queue argument of UCS and AStar.
+    BucketQueue needs non-negative integer priorities. Pushing an item that is already in an
+    IndexedPriorityQueue lowers its priority (decrease-key) instead of adding a second entry,
+    and a push with a higher priority than the queued one is ignored.
+Function null_heuristic(state):
+    A heuristic function that always returns 0.
+    Args:
+        state: The state for which the heuristic value is calculated.
+    Returns:
+        0
+"""
+
+
+
+import heapq
+from array import array
+from contextlib import contextmanager
+
+ROOT = -1 # Parent id of the root state in an ArraySearchTree
+
+class Node: 
+    """
+    A class used to represent a Node in a search tree.
+    Attributes
+    ----------
+    state : any
+        The state represented by the node.
+    parent : Node, optional
+        The parent node of this node (default is None).
+    action : any, optional
+        The action taken to get to this node from the parent node (default is None).
+    path_cost : int, optional
+        The cost to reach this node from the root node (default is 0).
+    Methods
+    -------
+    __lt__(other)
+        Compares this node with another node based on path_cost.
+    __repr__()
+        Returns a string representation of the node.
+    """
+
+    __slots__ = ('state', 'parent', 'action', 'path_cost')
+
+    def __init__(self, state, parent = None, action = None, path_cost = 0):
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.path_cost = path_cost
+        
+    def __lt__(self, other):
+        return self.path_cost < other.path_cost
+
+    def __repr__(self):
+        return f"Node(state = {self.state}, path_cost = {self.path_cost})"
+
+class PriorityQueue:
+    """
+    A priority queue implementation using a heap.
+    Attributes:
+        elements (list): A list to store the elements of the priority queue.
+        count (int): A counter to maintain the order of elements with the same priority.
+    Methods:
+        __init__():
+            Initializes an empty priority queue.
+        push(item, priority):
+            Adds an item to the priority queue with the given priority.
+        pop():
+            Removes and returns the item with the highest priority (lowest priority number).
+        is_empty():
+            Checks if the priority queue is empty.
+        min_priority():
+            Returns the priority of the item pop() would return, without removing it.
+        __len__():
+            Returns the number of queued entries, stale ones included.
+    """
+
+    def __init__(self):
+        self.elements = []
+        self.count = 0
+
+    def push(self, item, priority):
+        heapq.heappush(self.elements, (priority, self.count, item))
+        self.count += 1
+
+    def pop(self):
+        return heapq.heappop(self.elements)[2]
+
+    def is_empty(self):
+        return len(self.elements) == 0
+
+    def __len__(self):
+        return len(self.elements)
+
+    def min_priority(self): # Priority of the next item to pop, infinity when empty
+        return self.elements[0][0] if self.elements else float('inf')
+
+
+class BucketQueue:
+    """
+    A priority queue for small non-negative integer priorities, such as path costs on a grid.
+    Items are kept in one list per priority and a cursor moves up to the lowest non-empty one,
+    so push and pop are O(1) instead of O(log n), and an entry is one list slot instead of a
+    (priority, count, item) tuple. Buckets are dropped once emptied, so only the priorities
+    currently in the frontier take memory. Items of equal priority come out newest first,
+    which in A* means the deepest state on an f-value plateau.
+    Attributes:
+        buckets (dict): The list of items queued at each priority.
+        current (int): No queued item has a lower priority than this.
+        size (int): The number of queued entries.
+    """
+
+    def __init__(self):
+        self.buckets = {}
+        self.current = 0
+        self.size = 0
+
+    def push(self, item, priority):
+        index = int(priority)
+        if index != priority or index < 0:
+            raise ValueError(f"BucketQueue needs non-negative integer priorities, got {priority}")
+        bucket = self.buckets.get(index)
+        if bucket is None:
+            bucket = self.buckets[index] = []
+        bucket.append(item)
+        self.size += 1
+        if index < self.current:
+            self.current = index
+
+    def _advance(self): # Move the cursor to the lowest priority with a queued item
+        while self.current not in self.buckets:
+            self.current += 1
+        return self.buckets[self.current]
+
+    def pop(self):
+        bucket = self._advance()
+        item = bucket.pop()
+        self.size -= 1
+        if not bucket:
+            del self.buckets[self.current]
+        return item
+
+    def is_empty(self):
+        return self.size == 0
+
+    def __len__(self):
+        return self.size
+
+    def min_priority(self): # Priority of the next item to pop, infinity when empty
+        if self.size == 0:
+            return float('inf')
+        self._advance()
+        return self.current
+
+
+class IndexedPriorityQueue:
+    """
+    A binary heap that knows where each item is, so its priority can be lowered in place.
+    Every item has a single entry, so a state reached again more cheaply (common on weighted
+    graphs such as corridors) is moved up instead of pushed twice, and nothing stale is ever
+    popped. Items of equal priority come out newest first, like BucketQueue.
+    Attributes:
+        heap (list): (priority, -count, item) entries in heap order.
+        index (dict): The position of every queued item in the heap.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.index = {}
+        self.count = 0
+
+    def push(self, item, priority):
+        position = self.index.get(item)
+        if position is None:
+            position = len(self.heap)
+            self.heap.append(None)
+        elif priority >= self.heap[position][0]: # Already queued at least as early
+            return
+        self.count += 1
+        self._sift_up(position, (priority, -self.count, item)) # Insert, or decrease-key
+
+    def pop(self):
+        heap = self.heap
+        item = heap[0][2]
+        del self.index[item]
+        last = heap.pop()
+        if heap:
+            self._sift_down(0, last)
+        return item
+
+    def is_empty(self):
+        return not self.heap
+
+    def __len__(self):
+        return len(self.heap)
+
+    def min_priority(self): # Priority of the next item to pop, infinity when empty
+        return self.heap[0][0] if self.heap else float('inf')
+
+    def _sift_up(self, position, entry):
+        heap, index = self.heap, self.index
+        while position > 0:
+            parent = (position - 1) >> 1
+            above = heap[parent]
+            if above <= entry:
+                break
+            heap[position] = above
+            index[above[2]] = position
+            position = parent
+        heap[position] = entry
+        index[entry[2]] = position
+
+    def _sift_down(self, position, entry):
+        heap, index = self.heap, self.index
+        size = len(heap)
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            below = heap[child]
+            if entry <= below:
+                break
+            heap[position] = below
+            index[below[2]] = position
+            position = child
+        heap[position] = entry
+        index[entry[2]] = position
+
+
+def null_heuristic(state): 
+    """
+    A heuristic function that always returns zero.
+    This heuristic is used in search algorithms where no heuristic information is available or needed.
+    Args:
+        state: The current state of the search problem.
+    Returns:
+        int: Always returns 0.
+    """
+
+    return 0
+
+
+class ArraySearchTree:
+    """
+    A search tree stored as flat arrays indexed by state id instead of one Node per state.
+    Each state costs 21 bytes (stamp, parent id, action code, path cost, closed stamp) and no Python objects,
+    and the arrays are reused across searches: a state belongs to the current search only if
+    its stamp equals the current generation, so starting a new search is O(1).
+    Keys are the integer ids returned by problem.state_id(state).
+    Methods:
+        reset(): Forgets every state, ready for a new search.
+        key(state): Returns the id of a state.
+        add_root(key): Adds the initial state with cost 0.
+        add(key, parent_key, action, cost): Adds or re-parents a state.
+        seen(key): True if the state has been added in this search.
+        cost(key): The path cost of a state, or infinity if unseen.
+        path(key): The list of actions from the root to the state.
+        close(key), is_closed(key), reopen(key): The closed set of UCS and AStar, stamped the same way.
+    """
+
+    BYTES_PER_STATE = 21
+
+    def __init__(self, size, state_id):
+        self.size = size
+        self.key = state_id
+        self.stamps = array('I', [0]) * size
+        self.parents = array('i', [0]) * size
+        self.action_codes = bytearray(size)
+        self.costs = array('d', [0.0]) * size
+        self.closed_stamps = array('I', [0]) * size
+        self.actions = [] # Action for each code
+        self.codes = {} # Code for each action
+        self.generation = 0
+
+    def reset(self):
+        self.generation += 1
+        if self.generation > 0xFFFFFFFF: # Stamps wrapped around, clear them once
+            self.stamps = array('I', [0]) * self.size
+            self.closed_stamps = array('I', [0]) * self.size
+            self.generation = 1
+
+    def add_root(self, key):
+        self.stamps[key] = self.generation
+        self.parents[key] = ROOT
+        self.costs[key] = 0
+
+    def add(self, key, parent_key, action, cost):
+        code = self.codes.get(action)
+        if code is None:
+            code = self.codes[action] = len(self.actions)
+            self.actions.append(action)
+        self.stamps[key] = self.generation
+        self.parents[key] = parent_key
+        self.action_codes[key] = code
+        self.costs[key] = cost
+
+    def seen(self, key):
+        return self.stamps[key] == self.generation
+
+    def cost(self, key):
+        return self.costs[key] if self.stamps[key] == self.generation else float('inf')
+
+    def close(self, key):
+        self.closed_stamps[key] = self.generation
+
+    def is_closed(self, key):
+        return self.closed_stamps[key] == self.generation
+
+    def reopen(self, key):
+        self.closed_stamps[key] = 0
+
+    def path(self, key):
+        actions = []
+        parents, action_codes, action_list = self.parents, self.action_codes, self.actions
+        while parents[key] != ROOT:
+            actions.append(action_list[action_codes[key]])
+            key = parents[key]
+        actions.reverse()
+        return actions
+
+
+class DictSearchTree:
+    """
+    The ArraySearchTree interface backed by a dict of state -> (parent state, action, cost),
+    used when the problem does not number its states. Keys are the states themselves.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.closed = set()
+
+    def reset(self):
+        self.entries = {}
+        self.closed = set()
+
+    def key(self, state):
+        return state
+
+    def add_root(self, key):
+        self.entries[key] = (None, None, 0)
+
+    def add(self, key, parent_key, action, cost):
+        self.entries[key] = (parent_key, action, cost)
+
+    def seen(self, key):
+        return key in self.entries
+
+    def cost(self, key):
+        entry = self.entries.get(key)
+        return entry[2] if entry is not None else float('inf')
+
+    def close(self, key):
+        self.closed.add(key)
+
+    def is_closed(self, key):
+        return key in self.closed
+
+    def reopen(self, key):
+        self.closed.discard(key)
+
+    def path(self, key):
+        actions = []
+        parent, action, cost = self.entries[key]
+        while action is not None:
+            actions.append(action)
+            key = parent
+            parent, action, cost = self.entries[key]
+        actions.reverse()
+        return actions
+
+
+_tree_pool = {} # Free ArraySearchTrees by size, so their arrays are allocated once
+_pool_bytes = 0 # Bytes held by the pooled trees
+POOL_LIMIT = 4 # Free trees kept per size
+POOL_BYTES = 64 * 1024 * 1024 # Free trees kept in all, a tree that would go over is dropped
+
+
+def clear_tree_pool():
+    global _pool_bytes
+    _tree_pool.clear()
+    _pool_bytes = 0
+
+
+@contextmanager
+def search_tree(problem):
+    """
+    Lends a search tree for one search: a pooled ArraySearchTree when the problem numbers its
+    states through state_count() and state_id(state), a DictSearchTree otherwise.
+    """
+
+    global _pool_bytes
+    size = problem.state_count()
+    if size is None:
+        yield DictSearchTree()
+        return
+
+    free = _tree_pool.setdefault(size, [])
+    nbytes = size * ArraySearchTree.BYTES_PER_STATE
+    if free:
+        tree = free.pop()
+        _pool_bytes -= nbytes
+    else:
+        tree = ArraySearchTree(size, problem.state_id)
+    tree.key = problem.state_id
+    tree.reset()
+    try:
+        yield tree
+    finally:
+        tree.key = None # Do not keep the problem alive from the pool
+        if len(free) < POOL_LIMIT and _pool_bytes + nbytes <= POOL_BYTES:
+            free.append(tree)
+            _pool_bytes += nbytes
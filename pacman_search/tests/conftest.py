@@ -0,0 +1,13 @@
+# tests/conftest.py
+"""
+Shared setup for the pytest suite: the package directory goes on sys.path so the tests import
+game, search and utils the way the game does, and pygame gets a dummy video driver so headless
+mazes can be built without a display. Run with python -m pytest -q from pacman_search.
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
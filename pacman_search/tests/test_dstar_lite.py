@@ -0,0 +1,68 @@
+# tests/test_dstar_lite.py
+"""
+D* Lite keeps its search tree between calls; after walls or costs change under it, its
+repaired paths must still cost what a fresh UCS finds.
+"""
+
+import random
+from game.maze import Maze
+from game.ghost import ChasePacmanProblem
+from game.ghosts import RedGhost
+from search import UCS, AStar, DStarLite
+from benchmarks.corpus import build_corpus
+from benchmarks.search_benchmark import path_cost
+
+
+def cheapest(maze, start, goal):
+    actions = UCS().search(ChasePacmanProblem(maze, start, goal, encoded = True)).actions
+    return path_cost(maze.graph, start, actions) if actions is not None else None
+
+def replanned(algorithm, maze, start, goal):
+    actions = algorithm.search(ChasePacmanProblem(maze, start, goal, encoded = True)).actions
+    return path_cost(maze.graph, start, actions) if actions is not None else None
+
+def test_wall_on_the_path_is_routed_around():
+    maze = Maze(headless = True, grid = [[0] * 7 for _ in range(7)])
+    algorithm = DStarLite()
+    assert replanned(algorithm, maze, (3, 0), (3, 6)) == 6
+    maze.set_tile((3, 3), 1)
+    assert replanned(algorithm, maze, (3, 0), (3, 6)) == cheapest(maze, (3, 0), (3, 6)) == 8
+    maze.set_tile((3, 3), 0)
+    assert replanned(algorithm, maze, (3, 0), (3, 6)) == 6
+
+def test_chase_with_toggled_walls_matches_ucs():
+    for weighted in (False, True):
+        for case in build_corpus(kinds = ("carved", "arena"), sizes = (21,), seed = 0, weighted = weighted):
+            rng = random.Random(case.name)
+            maze = Maze(headless = True, grid = [row[:] for row in case.grid], costs = case.costs)
+            algorithm = DStarLite()
+            cells = [(row, col) for row in range(maze.rows) for col in range(maze.cols) if not maze.is_wall((row, col))]
+            chaser, target = rng.choice(cells), rng.choice(cells)
+            for tick in range(150):
+                if tick % 3 == 0: # Open or close an inner cell, as the replan benchmark does
+                    row, col = rng.randrange(1, maze.rows - 1), rng.randrange(1, maze.cols - 1)
+                    if (row, col) not in (chaser, target):
+                        maze.set_tile((row, col), 1 - maze.grid[row][col])
+                if weighted and tick % 5 == 0:
+                    maze.set_cost((rng.randrange(maze.rows), rng.randrange(maze.cols)), rng.randint(1, 5))
+
+                problem = ChasePacmanProblem(maze, chaser, target, encoded = True)
+                actions = algorithm.search(problem).actions
+                expected = cheapest(maze, chaser, target)
+                assert (path_cost(maze.graph, chaser, actions) if actions is not None else None) == expected, (case.name, tick)
+
+                if actions:
+                    chaser = [position for move, position, cost in maze.get_neighbours(chaser) if move == actions[0]][0]
+                if chaser == target or not actions:
+                    chaser = rng.choice(cells)
+                    while maze.is_wall(chaser):
+                        chaser = rng.choice(cells)
+                neighbours = maze.get_neighbours(target)
+                if neighbours:
+                    target = rng.choice(neighbours)[1]
+
+def test_red_ghost_uses_d_star_lite_only_when_asked():
+    maze = Maze(headless = True, grid = [[0] * 7 for _ in range(7)])
+    assert isinstance(RedGhost(maze, (1, 1)).search_algorithm, AStar)
+    ghost = RedGhost(maze, (1, 1), incremental = True)
+    assert isinstance(ghost.search_algorithm, DStarLite) and ghost.replan_every_tick
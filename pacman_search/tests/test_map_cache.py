@@ -0,0 +1,63 @@
+# tests/test_map_cache.py
+"""
+A map compiled into the binary cache on its first load must load back from the cache as the
+same grid, costs, graph and intersections, and a damaged or outdated cache must be ignored.
+"""
+
+import json
+import os
+import random
+import pytest
+import game.maze
+from game.maze import Maze
+from game.ghost import ChasePacmanProblem
+from search import UCS
+from benchmarks.corpus import carved_grid, weighted_costs
+from utils.map_cache import read_map, read_map_cache
+
+
+@pytest.fixture
+def map_file(tmp_path, monkeypatch):
+    grid = carved_grid(15, 21, random.Random(0))
+    path = tmp_path / "carved.json"
+    path.write_text(json.dumps({"map": grid, "costs": weighted_costs(grid)}))
+    cache_dir = str(tmp_path / "cache")
+    monkeypatch.setattr(game.maze, "read_map", lambda map_filename: read_map(map_filename, cache_dir = cache_dir))
+    return str(path)
+
+def test_compiled_map_round_trip(map_file):
+    first = Maze(headless = True, map_file = map_file)
+    raw, cache_path = read_map(map_file, cache_dir = os.path.join(os.path.dirname(map_file), "cache"))
+    assert os.path.exists(cache_path)
+
+    second = Maze(headless = True, map_file = map_file)
+    assert isinstance(second.graph.targets, memoryview) # Wrapped from the memory-mapped cache, not rebuilt
+    assert second.grid == first.grid
+    assert bytes(second.costs) == bytes(first.costs)
+    for name in ("walls", "costs", "offsets", "targets", "action_codes"):
+        assert bytes(getattr(second.graph, name)) == bytes(getattr(first.graph, name)), name
+    assert second.graph.weighted == first.graph.weighted == True
+    assert [second.is_intersection(row, col) for row in range(15) for col in range(21)] == \
+        [first.is_intersection(row, col) for row in range(15) for col in range(21)]
+
+    cells = [(row, col) for row in range(15) for col in range(21) if not first.is_wall((row, col))]
+    for start, goal in zip(cells, reversed(cells)):
+        assert UCS().search(ChasePacmanProblem(second, start, goal, encoded = True)).actions == \
+            UCS().search(ChasePacmanProblem(first, start, goal, encoded = True)).actions
+
+def test_truncated_cache_is_ignored(map_file):
+    Maze(headless = True, map_file = map_file)
+    raw, cache_path = read_map(map_file, cache_dir = os.path.join(os.path.dirname(map_file), "cache"))
+    with open(cache_path, "r+b") as cache_file:
+        cache_file.truncate(os.path.getsize(cache_path) - 1)
+    assert read_map_cache(cache_path) is None
+    assert Maze(headless = True, map_file = map_file).graph.weighted
+
+def test_edited_map_gets_a_new_cache(map_file):
+    raw, cache_path = read_map(map_file)
+    with open(map_file) as file:
+        data = json.load(file)
+    data["costs"][1][1] = 9
+    with open(map_file, "w") as file:
+        json.dump(data, file)
+    assert read_map(map_file)[1] != cache_path
@@ -0,0 +1,29 @@
+# tests/test_oracle.py
+"""
+The distance oracle answers like a search: lazily built rows are bounded, and wall starts
+behave as they do in GridGraph.
+"""
+
+import random
+from search.Oracle import DistanceOracle
+from benchmarks.corpus import arena_grid, pillar_grid
+
+
+def test_lazy_rows_are_bounded():
+    grid = arena_grid(30, 30, random.Random(0))
+    oracle = DistanceOracle(grid, lazy = True, max_rows = 3)
+    eager = DistanceOracle(grid, lazy = False)
+    cells = [(row, col) for row in range(30) for col in range(30) if grid[row][col] == 0]
+    rng = random.Random(1)
+    for _ in range(50):
+        start, goal = rng.choice(cells), rng.choice(cells)
+        assert oracle.path(start, goal) == eager.path(start, goal)
+        assert sum(row is not None for row in oracle.distances) <= 3
+    assert len(oracle.recent) == 3
+
+def test_start_on_its_goal_wall_gets_an_empty_path():
+    oracle = DistanceOracle(pillar_grid(20, 20))
+    assert oracle.path((10, 10), (10, 10)) == []
+    assert oracle.distance((10, 10), (10, 10)) == 0
+    assert oracle.next_action((10, 10), (10, 10)) is None
+    assert oracle.path((9, 10), (10, 10)) is None # Nothing can step onto a wall
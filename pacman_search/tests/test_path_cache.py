@@ -0,0 +1,67 @@
+# tests/test_path_cache.py
+"""
+PathCache answers repeated queries and queries starting on a cached shortest path without
+searching, and never from paths of an older grid or a replaced entry.
+"""
+
+from game.maze import Maze
+from game.ghost import ChasePacmanProblem
+from search import PathCache, AStar, DFS, UCS
+from search.PathCache import MISS
+
+
+def open_maze(rows = 7, cols = 7):
+    return Maze(headless = True, grid = [[0] * cols for _ in range(rows)])
+
+def test_suffix_of_a_cached_path_is_a_hit():
+    maze, cache, algorithm = open_maze(), PathCache(), AStar()
+    path = cache.search(algorithm, ChasePacmanProblem(maze, (0, 0), (0, 6), encoded = True)).actions
+    assert path == ["RIGHT"] * 6 and cache.misses == 1
+
+    result = cache.search(algorithm, ChasePacmanProblem(maze, (0, 2), (0, 6), encoded = True))
+    assert result.actions == ["RIGHT"] * 4 and result.nodes_expanded == 0
+    assert cache.suffix_hits == 1 and cache.misses == 1
+
+    result = cache.search(algorithm, ChasePacmanProblem(maze, (0, 0), (0, 6), encoded = True))
+    assert result.actions == path and cache.hits == 1
+
+def test_non_optimal_algorithms_get_no_suffix_hits():
+    maze, cache, algorithm = open_maze(), PathCache(), DFS()
+    cache.search(algorithm, ChasePacmanProblem(maze, (0, 0), (0, 6), encoded = True))
+    assert cache.lookup(algorithm, ChasePacmanProblem(maze, (0, 2), (0, 6), encoded = True)) is MISS
+
+def test_grid_change_empties_the_cache():
+    maze, cache, algorithm = open_maze(), PathCache(), UCS()
+    cache.search(algorithm, ChasePacmanProblem(maze, (0, 0), (0, 6), encoded = True))
+    maze.set_tile((0, 3), 1)
+    assert cache.lookup(algorithm, ChasePacmanProblem(maze, (0, 2), (0, 6), encoded = True)) is MISS
+    result = cache.search(algorithm, ChasePacmanProblem(maze, (0, 0), (0, 6), encoded = True))
+    assert len(result.actions) == 8
+
+def test_replaced_entry_leaves_no_stale_route_cells():
+    maze, cache, algorithm = open_maze(), PathCache(), UCS()
+    problem = ChasePacmanProblem(maze, (0, 0), (0, 3), encoded = True)
+    assert cache.lookup(algorithm, problem) is MISS # As a SlicedSearch does before adding what it found
+    cache.add(algorithm, problem, ["RIGHT"] * 3)
+    cache.add(algorithm, problem, ["DOWN", "RIGHT", "RIGHT", "RIGHT", "UP"])
+    assert cache.stats()["route_cells"] == 5
+    assert cache.lookup(algorithm, ChasePacmanProblem(maze, (0, 1), (0, 3), encoded = True)) is MISS
+    assert cache.lookup(algorithm, ChasePacmanProblem(maze, (1, 1), (0, 3), encoded = True)) == ["RIGHT", "RIGHT", "UP"]
+
+def test_capacity_evicts_least_recently_used():
+    maze, cache, algorithm = open_maze(), PathCache(capacity = 2), UCS()
+    for goal in ((6, 6), (0, 6), (6, 0)):
+        cache.search(algorithm, ChasePacmanProblem(maze, (0, 0), goal, encoded = True))
+    assert cache.evictions == 1 and cache.stats()["paths"] == 2
+    assert cache.lookup(algorithm, ChasePacmanProblem(maze, (0, 0), (6, 6), encoded = True)) is MISS
+
+def test_shared_cells_survive_eviction_of_the_older_entry():
+    maze, cache, algorithm = open_maze(), PathCache(capacity = 2), UCS()
+    older = ChasePacmanProblem(maze, (0, 0), (0, 6), encoded = True)
+    newer = ChasePacmanProblem(maze, (0, 1), (0, 6), encoded = True)
+    assert cache.lookup(algorithm, older) is MISS
+    cache.add(algorithm, older, ["RIGHT"] * 6)
+    cache.add(algorithm, newer, ["RIGHT"] * 5) # Found by a search of its own, e.g. a SlicedSearch started earlier
+    cache.add(algorithm, ChasePacmanProblem(maze, (6, 6), (6, 0), encoded = True), ["LEFT"] * 6) # Evicts the older entry
+    assert cache.evictions == 1
+    assert cache.lookup(algorithm, ChasePacmanProblem(maze, (0, 3), (0, 6), encoded = True)) == ["RIGHT"] * 3
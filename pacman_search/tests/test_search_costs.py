@@ -0,0 +1,58 @@
+# tests/test_search_costs.py
+"""
+Every optimal algorithm of the benchmark suite must find paths as cheap as UCS on the seeded
+benchmark corpus, with and without a weighted cost layer.
+"""
+
+import random
+import pytest
+from game.maze import Maze
+from game.ghost import ChasePacmanProblem
+from search import UCS, Oracle
+from benchmarks.corpus import build_corpus, sample_pairs
+from benchmarks.search_benchmark import ALGORITHMS, UNIT_COST, path_cost
+
+PAIRS = 40
+CORPUS = build_corpus(kinds = ("pillars", "carved", "arena"), sizes = (20, 41), seed = 0)
+WEIGHTED_CORPUS = build_corpus(kinds = ("pillars", "carved", "arena"), sizes = (20, 41), seed = 0, weighted = True)
+UNIT_ONLY = ("BFS",) + UNIT_COST # Shortest in steps, which is only cheapest when every step costs 1
+OPTIMAL = [name for name in ALGORITHMS if name != "DFS"] + ["Oracle"]
+
+
+def make_algorithm(name):
+    return Oracle() if name == "Oracle" else ALGORITHMS[name]()
+
+def check_costs(case, name):
+    maze = Maze(headless = True, grid = case.grid, costs = case.costs)
+    graph = maze.graph
+    algorithm = make_algorithm(name)
+    for start, goal in sample_pairs(case.grid, PAIRS, random.Random(f"{case.name}-tests")):
+        expected = UCS().search(ChasePacmanProblem(maze, start, goal, encoded = True)).actions
+        actions = algorithm.search(ChasePacmanProblem(maze, start, goal, encoded = True)).actions
+        if expected is None:
+            assert actions is None, (name, case.name, start, goal)
+            continue
+        assert actions is not None, (name, case.name, start, goal)
+        assert path_cost(graph, start, actions) == path_cost(graph, start, expected), (name, case.name, start, goal)
+        row, col = start
+        for action in actions: # The path must be walkable and end on the goal
+            row, col = [position for move, position, cost in maze.get_neighbours((row, col)) if move == action][0]
+        assert (row, col) == goal
+
+@pytest.mark.parametrize("case", CORPUS, ids = lambda case: case.name)
+@pytest.mark.parametrize("name", OPTIMAL)
+def test_unit_cost_paths_match_ucs(case, name):
+    check_costs(case, name)
+
+@pytest.mark.parametrize("case", WEIGHTED_CORPUS, ids = lambda case: case.name)
+@pytest.mark.parametrize("name", [name for name in OPTIMAL if name not in UNIT_ONLY])
+def test_weighted_paths_match_ucs(case, name):
+    check_costs(case, name)
+
+@pytest.mark.parametrize("name", UNIT_COST)
+def test_unit_cost_algorithms_reject_weighted_mazes(name):
+    case = WEIGHTED_CORPUS[0]
+    maze = Maze(headless = True, grid = case.grid, costs = case.costs)
+    start, goal = sample_pairs(case.grid, 1, random.Random(0))[0]
+    with pytest.raises(ValueError):
+        ALGORITHMS[name]().search(ChasePacmanProblem(maze, start, goal, encoded = True))
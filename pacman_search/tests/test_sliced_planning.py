@@ -0,0 +1,34 @@
+# tests/test_sliced_planning.py
+"""
+Sliced ghost planning advances once per game tick, whether or not the ghost moves on that tick.
+"""
+
+from game.game import Game
+from game.constants import TICK_RATE
+
+
+def test_plan_advances_every_tick():
+    game = Game(level = 1, planning = "search", headless = True, maze_size = (61, 61))
+    ghost = game.ghosts[0]
+    ghost.node_budget = 20
+    ghost.path = []
+    game.update(dt = 1 / TICK_RATE)
+    plan = ghost.plan
+    assert plan is not None and plan.slices == 1
+    for tick in range(2, 6): # Ghosts move a tile only every few ticks, the plan must not wait for that
+        game.update(dt = 1 / TICK_RATE)
+        if ghost.plan is not plan:
+            break
+        assert plan.slices == tick
+
+def test_budget_goes_to_ghosts_that_are_planning():
+    game = Game(level = 5, planning = "search", headless = True, maze_size = (61, 61), plan_budget = 0.004)
+    budgets = []
+    for ghost in game.ghosts:
+        step_plan = ghost.step_plan
+        ghost.step_plan = lambda time_budget = None, step_plan = step_plan: (budgets.append(time_budget), step_plan(time_budget))
+        ghost.replan_every_tick = False
+        ghost.path = ["UP"] * 5 # Still following a path, nothing to plan
+    game.ghosts[0].path = []
+    game.update()
+    assert budgets == [0.004] # The whole budget, not a quarter of it
@@ -1,16 +1,20 @@
-# utils/__init__.py 
-"""
-This module initializes the utility components for the Pacman search project.
-It imports the following components:
-- DataLogger: A class for logging data.
-- ConfigManager: A class for managing configuration settings.
-- load_image: A function for loading image assets.
-- load_font: A function for loading font assets.
-- load_map: A function for loading map assets.
-"""
-
-
-
-from .data_logger import DataLogger
-from .config import ConfigManager
-from .asset_loader import load_image, load_font, load_map
\ No newline at end of file
+# utils/__init__.py 
+"""
+This module initializes the utility components for the Pacman search project.
+It imports the following components:
+- DataLogger: A class for logging data.
+- ConfigManager: A class for managing configuration settings.
+- load_image: A function for loading image assets.
+- load_font: A function for loading font assets.
+- load_map: A function for loading map assets.
+- AssetCache, assets: The cache of loaded images and fonts, and its process-wide instance.
+- read_map, read_map_cache, write_map_cache: Functions for the compiled binary cache of map files.
+"""
+
+
+
+from .data_logger import DataLogger
+from .config import ConfigManager
+from .asset_cache import AssetCache, assets
+from .asset_loader import load_image, load_font, load_map
+from .map_cache import read_map, read_map_cache, write_map_cache
\ No newline at end of file
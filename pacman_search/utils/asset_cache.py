@@ -0,0 +1,121 @@
+# utils/asset_cache.py
+
+"""
+This module holds the process-wide cache of loaded images and fonts.
+Every sprite, tile and font is read from disk once per (path, scale) or (path, size) and the same
+pygame object is handed to every entity, maze and screen that asks for it afterwards, so spawning
+ghosts or reopening a menu costs a dictionary lookup. Cached surfaces are shared: blit them, but
+copy one before drawing on it.
+Rendered text is cached too, keyed by (font, text, colour, antialias): static labels are rasterised
+once instead of every frame, and the least recently used ones are dropped past max_texts entries.
+Classes:
+    AssetCache: Loaded images and fonts keyed by path and size, and rendered text, with hit/miss/bytes counters.
+Attributes:
+    assets (AssetCache): The cache shared by utils.asset_loader, gui.utils and the game entities.
+Methods:
+    AssetCache.image(path, scale_to=None): The image at path with alpha, scaled to (width, height) if given.
+        Raises pygame.error or FileNotFoundError if the file cannot be loaded; failures are not cached.
+    AssetCache.font(path, size): The font at path in the given size, or pygame's default font if it cannot be loaded.
+    AssetCache.text(font, text, colour, antialias=True): font.render(text, antialias, colour), rendered once.
+    AssetCache.preload(images=(), fonts=()): Loads (path, scale_to) images and (path, size) fonts ahead of time.
+    AssetCache.stats(): Hits, misses, cached entries and their approximate size in bytes.
+    AssetCache.clear(): Drops every cached asset and resets the counters.
+"""
+
+import os
+from collections import OrderedDict
+import pygame
+
+MAX_TEXTS = 512 # Rendered strings kept; leaderboards and labels stay far below this
+
+
+class AssetCache:
+    def __init__(self, max_texts = MAX_TEXTS):
+        self.images = {} # (path, scale_to) -> pygame.Surface
+        self.fonts = {} # (path, size) -> pygame.font.Font
+        self.texts = OrderedDict() # (font, text, colour, antialias) -> pygame.Surface, least recently used first
+        self.max_texts = max_texts
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0 # Pixel bytes of the cached surfaces plus the size of the font files
+
+    def _key(self, path):
+        return os.path.normpath(path)
+
+    def image(self, path, scale_to = None):
+        key = (self._key(path), tuple(scale_to) if scale_to else None)
+        image = self.images.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        unscaled = self.images.get((key[0], None)) # Another scale of an image already read
+        if unscaled is None:
+            unscaled = pygame.image.load(key[0]).convert_alpha()
+            if key[1]: # Kept too, so the next scale of this file is not read from disk again
+                self.images[(key[0], None)] = unscaled
+                self.bytes += unscaled.get_pitch() * unscaled.get_height()
+        image = pygame.transform.scale(unscaled, key[1]) if key[1] else unscaled
+        self.images[key] = image
+        self.bytes += image.get_pitch() * image.get_height()
+        return image
+
+    def font(self, path, size):
+        key = (self._key(path), size)
+        font = self.fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+
+        self.misses += 1
+        try:
+            font = pygame.font.Font(key[0], size)
+            self.bytes += os.path.getsize(key[0])
+        except Exception as e: # The default font is cached in its place so a missing file is not retried
+            print(f"Error loading font '{key[0]}': {e}")
+            font = pygame.font.Font(None, size)
+        self.fonts[key] = font
+        return font
+
+    def text(self, font, text, colour, antialias = True):
+        key = (font, text, tuple(colour), antialias)
+        surface = self.texts.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.texts.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, colour)
+        self.texts[key] = surface
+        self.bytes += surface.get_pitch() * surface.get_height()
+        if len(self.texts) > self.max_texts:
+            key, evicted = self.texts.popitem(last = False)
+            self.bytes -= evicted.get_pitch() * evicted.get_height()
+        return surface
+
+    def preload(self, images = (), fonts = ()):
+        for path, scale_to in images:
+            self.image(path, scale_to)
+        for path, size in fonts:
+            self.font(path, size)
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "images": len(self.images),
+            "fonts": len(self.fonts),
+            "texts": len(self.texts),
+            "bytes": self.bytes,
+        }
+
+    def clear(self):
+        self.images.clear()
+        self.fonts.clear()
+        self.texts.clear()
+        self.hits = self.misses = self.bytes = 0
+
+
+assets = AssetCache()
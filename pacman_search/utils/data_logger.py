@@ -1,41 +1,199 @@
-# utils/data_logger.py
-"""
-DataLogger is a utility class for logging performance metrics of search algorithms.
-Attributes:
-    log_file (str): The path to the log file where performance data will be stored.
-Methods:
-    __init__(log_file="logs/performance_log.csv"):
-        Initializes the DataLogger instance and creates the log file with headers if it doesn't exist.
-    log(algorithm, level, search_time, memory_usage, nodes_expanded, path_length):
-        Logs the performance metrics of a search algorithm to the log file.
-        Args:
-            algorithm (str): The name of the search algorithm.
-            level (str): The level or scenario in which the algorithm is executed.
-            search_time (float): The time taken by the algorithm to complete the search, in seconds.
-            memory_usage (int): The memory usage of the algorithm, in bytes.
-            nodes_expanded (int): The number of nodes expanded by the algorithm.
-            path_length (int): The length of the path found by the algorithm.
-"""
-
-
-
-import os
-import csv
-import datetime
-
-class DataLogger:
-    def __init__(self, log_file = "logs\performance_log.csv"):
-        self.log_file = log_file
-
-        os.makedirs(os.path.dirname(self.log_file), exist_ok = True)
-
-        if not os.path.exists(self.log_file):
-            with open(self.log_file, "w", newline = "") as file:
-                writer = csv.writer(file)
-                writer.writerow(["Timestamp", "Algorithm", "Level", "SearchTimeSec", "MemoryUsageBytes", "NodesExpanded", "PathLength"])
-
-    def log(self, algorithm, level, search_time, memory_usage, nodes_expanded, path_length):
-        timestamp = datetime.datetime.now().isoformat()
-        with open(self.log_file, "a", newline = "") as file:
-            writer = csv.writer(file)
-            writer.writerow([timestamp, algorithm, level, search_time, memory_usage, nodes_expanded, path_length])
\ No newline at end of file
+# utils/data_logger.py
+"""
+DataLogger is a utility class for logging performance metrics of search algorithms.
+Rows are buffered in memory and written in batches by a background thread, so log() costs a
+list append on the caller's thread (e.g. the game loop) instead of a file open per row.
+The log file is rotated when it grows past max_bytes or gets older than max_age seconds.
+Formats:
+    "csv": One text row per search, with the headers below. The default.
+    "columnar": Binary blocks, one per batch, each holding every column as a packed array
+        (strings dictionary-encoded), much smaller and faster to write for large benchmark runs.
+        Read back with read_columnar(path).
+Attributes:
+    log_file (str): The path to the log file where performance data will be stored.
+    format (str): "csv" or "columnar".
+    level (str): The level written with the rows of record_search, e.g. the level being played.
+Methods:
+    __init__(log_file="logs/performance_log.csv", format="csv", batch_size=256, flush_interval=1.0,
+             max_bytes=10 MiB, max_age=None, backups=5, background=True):
+        Initializes the DataLogger instance and, with background=True, starts its writer thread.
+    log(algorithm, level, search_time, memory_usage, nodes_expanded, path_length):
+        Queues the performance metrics of a search algorithm for the log file.
+        Args:
+            algorithm (str): The name of the search algorithm.
+            level (str): The level or scenario in which the algorithm is executed.
+            search_time (float): The time taken by the algorithm to complete the search, in seconds.
+            memory_usage (int): The memory usage of the algorithm, in bytes.
+            nodes_expanded (int): The number of nodes expanded by the algorithm.
+            path_length (int): The length of the path found by the algorithm.
+    record_search(algorithm, problem, result):
+        Queues a SearchResult under the logger's current level; pass it to search.add_result_hook
+        to log every search.
+    flush(): Writes every queued row now.
+    close(): Stops the writer thread after writing every queued row.
+Functions:
+    read_columnar(path): Reads a columnar log into a dict of column name -> list of values.
+"""
+
+
+
+import os
+import csv
+import datetime
+import struct
+import threading
+import time
+import atexit
+from array import array
+
+HEADERS = ["Timestamp", "Algorithm", "Level", "SearchTimeSec", "MemoryUsageBytes", "NodesExpanded", "PathLength"]
+BLOCK = struct.Struct("<4sI") # magic, rows in the block
+MAGIC = b"PLOG"
+NUMERIC_COLUMNS = (("Timestamp", 'd'), ("SearchTimeSec", 'd'), ("MemoryUsageBytes", 'd'), ("NodesExpanded", 'q'), ("PathLength", 'q'))
+NO_PATH = -1 # PathLength of a search that found no path, in columnar logs
+
+class DataLogger:
+    def __init__(
+        self, log_file = os.path.join("logs", "performance_log.csv"), format = "csv", batch_size = 256,
+        flush_interval = 1.0, max_bytes = 10 * 1024 * 1024, max_age = None, backups = 5, background = True
+    ):
+        if format not in ("csv", "columnar"):
+            raise ValueError(f"Unknown log format: {format}")
+        self.log_file = log_file
+        self.format = format
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval # Seconds a row may wait in the buffer
+        self.max_bytes = max_bytes
+        self.max_age = max_age # Seconds before the file is rotated, None to rotate by size only
+        self.backups = backups # Rotated files kept as log_file.1 ... log_file.<backups>
+        self.level = ""
+
+        os.makedirs(os.path.dirname(self.log_file) or ".", exist_ok = True)
+        self.opened = time.time()
+        self.buffer = []
+        self.lock = threading.Lock() # Guards the buffer
+        self.write_lock = threading.Lock() # One batch written at a time, by the thread or flush()
+        self.wake = threading.Event()
+        self.closed = False
+        self.thread = None
+        if background:
+            self.thread = threading.Thread(target = self._run, name = "DataLogger", daemon = True)
+            self.thread.start()
+        atexit.register(self.close)
+
+    def log(self, algorithm, level, search_time, memory_usage, nodes_expanded, path_length):
+        with self.lock:
+            self.buffer.append((time.time(), algorithm, level, search_time, memory_usage, nodes_expanded, path_length))
+            full = len(self.buffer) >= self.batch_size
+        if full:
+            if self.thread is not None:
+                self.wake.set()
+            else:
+                self.flush()
+
+    def record_search(self, algorithm, problem, result):
+        path_length = len(result.actions) if result.actions is not None else None
+        self.log(algorithm.name, self.level, result.search_time, result.memory_usage, result.nodes_expanded, path_length)
+
+    def _run(self): # Writer thread: write a batch when one is full or flush_interval has passed
+        while not self.closed:
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            rows, self.buffer = self.buffer, []
+        if not rows:
+            return
+        with self.write_lock:
+            self._rotate_if_needed()
+            if self.format == "csv":
+                self._write_csv(rows)
+            else:
+                self._write_columnar(rows)
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        if self.thread is not None:
+            self.wake.set()
+            self.thread.join()
+        self.flush()
+        atexit.unregister(self.close)
+
+    def _rotate_if_needed(self):
+        if not os.path.exists(self.log_file):
+            return
+        too_big = os.path.getsize(self.log_file) >= self.max_bytes
+        too_old = self.max_age is not None and time.time() - self.opened >= self.max_age
+        if not (too_big or too_old):
+            return
+        for index in range(self.backups - 1, 0, -1): # log.1 -> log.2, ..., the oldest is overwritten
+            older = f"{self.log_file}.{index}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.log_file}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.log_file, f"{self.log_file}.1")
+        else:
+            os.remove(self.log_file)
+        self.opened = time.time()
+
+    def _write_csv(self, rows):
+        new_file = not os.path.exists(self.log_file) or os.path.getsize(self.log_file) == 0
+        with open(self.log_file, "a", newline = "") as file:
+            writer = csv.writer(file)
+            if new_file:
+                writer.writerow(HEADERS)
+            writer.writerows(
+                [datetime.datetime.fromtimestamp(row[0]).isoformat()] + list(row[1:]) for row in rows
+            )
+
+    def _write_columnar(self, rows):
+        # One block: header, then each string column as a table of distinct values and 16-bit codes,
+        # then each numeric column as one packed array
+        parts = [BLOCK.pack(MAGIC, len(rows))]
+        for index in (1, 2): # Algorithm, Level
+            table = {}
+            codes = array('H', (table.setdefault(str(row[index]), len(table)) for row in rows))
+            parts.append(struct.pack("<I", len(table)))
+            for text in table:
+                encoded = text.encode("utf-8")
+                parts.append(struct.pack("<H", len(encoded)))
+                parts.append(encoded)
+            parts.append(codes.tobytes())
+        for index, (name, code) in zip((0, 3, 4, 5, 6), NUMERIC_COLUMNS):
+            parts.append(array(code, (NO_PATH if row[index] is None else row[index] for row in rows)).tobytes())
+        with open(self.log_file, "ab") as file:
+            file.write(b"".join(parts))
+
+
+def read_columnar(path):
+    columns = {name: [] for name in HEADERS}
+    with open(path, "rb") as file:
+        data = file.read()
+    position = 0
+    while position < len(data):
+        magic, count = BLOCK.unpack_from(data, position)
+        if magic != MAGIC:
+            raise ValueError(f"Not a columnar log block at byte {position} of {path}")
+        position += BLOCK.size
+        for name in ("Algorithm", "Level"):
+            (size,) = struct.unpack_from("<I", data, position)
+            position += 4
+            table = []
+            for _ in range(size):
+                (length,) = struct.unpack_from("<H", data, position)
+                table.append(data[position + 2:position + 2 + length].decode("utf-8"))
+                position += 2 + length
+            codes = array('H')
+            codes.frombytes(data[position:position + 2 * count])
+            position += 2 * count
+            columns[name].extend(table[code] for code in codes)
+        for name, code in NUMERIC_COLUMNS:
+            values = array(code)
+            values.frombytes(data[position:position + values.itemsize * count])
+            position += values.itemsize * count
+            columns[name].extend(values)
+    return columns
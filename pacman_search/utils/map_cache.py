@@ -0,0 +1,90 @@
+# utils/map_cache.py
+
+"""
+This module stores compiled maps on disk so large map files are parsed only once.
+A map JSON file is compiled on its first load into one binary file holding the wall bytes,
+the tile costs, the CSR adjacency of its GridGraph and the intersection map, named after a hash
+of the JSON file so an edited map is compiled again. Later loads memory-map that file and hand
+out memoryviews into it instead of parsing nested JSON lists.
+Layout (native byte order, the cache is local to the machine):
+    header: magic, format version, rows, cols, edge count, flags
+    offsets (int32, rows * cols + 1), targets (int32, edge count), action codes (uint8, edge count),
+    walls (uint8, rows * cols), intersections (uint8, rows * cols), costs (uint8, rows * cols, if present)
+Functions:
+    map_path(map_filename): The path of a map file, a name in assets/maps or a path to any file.
+    read_map(map_filename): The raw bytes of a map file and the cache path for them.
+    read_map_cache(cache_path): The sections of a compiled map as memoryviews, or None if there is no cache.
+    write_map_cache(cache_path, graph, intersections, costs=None): Writes a compiled map, replacing any older one at once.
+Attributes:
+    CACHE_DIR (str): Where compiled maps are kept, pacman_search/cache/maps.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "maps") # Next to the package, whatever the working directory
+MAGIC = b"PMAP"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sIIIII") # magic, version, rows, cols, edges, flags
+HAS_COSTS = 1
+WEIGHTED = 2
+
+def map_path(map_filename):
+    if os.path.exists(map_filename):
+        return map_filename
+    return os.path.join("assets", "maps", map_filename)
+
+def read_map(map_filename, cache_dir = CACHE_DIR):
+    with open(map_path(map_filename), "rb") as map_file:
+        raw = map_file.read()
+    digest = hashlib.sha256(raw).hexdigest()[:32]
+    name = os.path.splitext(os.path.basename(map_filename))[0]
+    return raw, os.path.join(cache_dir, f"{name}-{digest}-v{FORMAT_VERSION}.pmap")
+
+def read_map_cache(cache_path):
+    try:
+        with open(cache_path, "rb") as cache_file:
+            mapped = mmap.mmap(cache_file.fileno(), 0, access = mmap.ACCESS_READ)
+    except (OSError, ValueError): # Missing, or empty
+        return None
+
+    view = memoryview(mapped)
+    if len(view) < HEADER.size:
+        return None
+    magic, version, rows, cols, edges, flags = HEADER.unpack_from(view)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    size = rows * cols
+    layout = (
+        ("offsets", size + 1, 4), ("targets", edges, 4), ("action_codes", edges, 1),
+        ("walls", size, 1), ("intersections", size, 1), ("costs", size if flags & HAS_COSTS else 0, 1),
+    )
+    if HEADER.size + sum(length * item for name, length, item in layout) != len(view):
+        return None # Truncated or corrupted
+
+    sections = {"rows": rows, "cols": cols, "weighted": bool(flags & WEIGHTED), "mmap": mapped}
+    position = HEADER.size
+    for name, length, item in layout:
+        section = view[position:position + length * item]
+        sections[name] = section.cast("i") if item == 4 else section
+        position += length * item
+    if not flags & HAS_COSTS:
+        sections["costs"] = None
+    return sections
+
+def write_map_cache(cache_path, graph, intersections, costs = None):
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok = True)
+    flags = (HAS_COSTS if costs is not None else 0) | (WEIGHTED if graph.weighted else 0)
+    temporary = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as cache_file:
+        cache_file.write(HEADER.pack(MAGIC, FORMAT_VERSION, graph.rows, graph.cols, len(graph.targets), flags))
+        cache_file.write(graph.offsets.tobytes())
+        cache_file.write(graph.targets.tobytes())
+        cache_file.write(graph.action_codes)
+        cache_file.write(graph.walls)
+        cache_file.write(intersections)
+        if costs is not None:
+            cache_file.write(costs)
+    os.replace(temporary, cache_path) # Readers never see a half-written cache